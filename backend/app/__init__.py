@@ -1,29 +1,71 @@
 from flask import Flask, jsonify
+from werkzeug.middleware.proxy_fix import ProxyFix
 from .config import Config
 from .database import db, ma
+from .broker import broker
+from .principal_cache import principal_cache
+from .hashing import password_hasher
+from .helper_index import helper_index
+from .request_queues import request_queues
+from .counters import post_counters
+from .response_cache import board_page_cache
+from .catalog import catalog
+from .db_profiler import db_profiler
+from .translation import translation_service
+from .message_archive import message_archive
+from .rate_limit import rate_limiter
+from .home_feed import home_feed
+from .message_writer import message_writer
+from .metrics import request_metrics
 
-def create_app():
-    """애플리케이션 팩토리 함수"""
+def create_app(config_overrides=None):
+    """애플리케이션 팩토리 함수
+
+    config_overrides: 테스트/벤치마크 등에서 Config 값을 덮어쓸 dict (예: SQLite DB URI)
+    """
     
     app = Flask(__name__)
     
     # 1. 설정 로드
     app.config.from_object(Config)
+    if config_overrides:
+        app.config.update(config_overrides)
+    if app.config['TRUSTED_PROXY_COUNT'] > 0:
+        # 리버스 프록시 뒤에서는 X-Forwarded-For의 클라이언트 주소를 request.remote_addr로 사용 (요청 제한 IP 키 등)
+        proxies = app.config['TRUSTED_PROXY_COUNT']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies, x_proto=proxies, x_host=proxies)
     
     # 2. DB 및 Marshmallow 초기화
     db.init_app(app)
     ma.init_app(app)
+    db_profiler.init_app(app)
+    broker.init_app(app)
+    principal_cache.init_app(app)
+    password_hasher.init_app(app)
+    helper_index.init_app(app)
+    request_queues.init_app(app)
+    post_counters.init_app(app)
+    board_page_cache.init_app(app)
+    catalog.init_app(app)
+    translation_service.init_app(app)
+    message_archive.init_app(app)
+    rate_limiter.init_app(app)
+    home_feed.init_app(app)
+    message_writer.init_app(app)
+    request_metrics.init_app(app)
     
     # 3. 블루프린트(기능별 파일) 등록
     from .routes.auth import auth_bp
     from .routes.school import school_bp
     from .routes.community import community_bp
     from .routes.matching import matching_bp
+    from .routes.catalog import catalog_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(school_bp)
     app.register_blueprint(community_bp)
     app.register_blueprint(matching_bp)
+    app.register_blueprint(catalog_bp)
     
     # 4. 모델 임포트 (DB 생성 명령어에 필요)
     from . import models
@@ -33,10 +75,12 @@ def create_app():
     def read_root():
         return jsonify({"message": "Hi-Campus API 서버 (분리된 구조)"})
 
-    # 6. (선택) DB 테이블 생성용 CLI 명령어
-    @app.cli.command("init-db")
-    def init_db():
-        db.create_all()
-        print("Database tables created.")
+    # 6. (선택) DB 테이블 생성 등 CLI 명령어
+    from .commands import register_commands
+    register_commands(app)
+
+    # 7. (선택) 일괄 자동 매칭 스케줄러 (BATCH_MATCH_INTERVAL > 0 일 때)
+    from .batch_matcher import start_scheduler
+    start_scheduler(app)
 
     return app
\ No newline at end of file
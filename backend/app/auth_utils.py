@@ -2,12 +2,21 @@ from functools import wraps
 import jwt
 from flask import request, jsonify, current_app
 from .models import Users
+from .principal_cache import principal_cache, principal_from_user, token_digest
 
-def require_auth(func):
+def require_auth(func=None, *, load_user=False):
     """
     헤더의 'Authorization: Bearer <token>'을 검사하여
-    유효한 JWT 토큰일 경우 request.user에 SQLAlchemy 사용자 객체를 주입합니다.
+    유효한 JWT 토큰일 경우 request.user에 사용자 정보를 주입합니다.
+
+    기본적으로 request.user는 읽기 전용 Principal 스냅샷이며, 같은 토큰의 재요청은
+    principal_cache에서 처리되어 JWT 디코딩과 DB 조회를 모두 건너뜁니다.
+    관계(relationship) 접근이나 수정이 필요한 핸들러는 @require_auth(load_user=True)로
+    SQLAlchemy Users 객체를 받을 수 있습니다.
     """
+    if func is None:
+        return lambda f: require_auth(f, load_user=load_user)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         token = None
@@ -19,24 +28,72 @@ def require_auth(func):
         if not token:
             return jsonify({"error": "Authorization token is missing"}), 401
         
-        try:
-            # current_app.config에서 SECRET_KEY를 가져옴
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
-            user_id = payload.get("user_id")
-            if user_id is None:
-                raise jwt.InvalidTokenError
-            
-            user = Users.query.get(user_id)
+        digest = token_digest(token)
+        principal = principal_cache.get(digest)
+
+        if principal is None:
+            try:
+                # current_app.config에서 SECRET_KEY를 가져옴
+                payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
+                user_id = payload.get("user_id")
+                if user_id is None:
+                    raise jwt.InvalidTokenError
+
+                user = Users.query.get(user_id)
+                if not user:
+                     return jsonify({"error": "User not found"}), 401
+
+            except jwt.ExpiredSignatureError:
+                return jsonify({"error": "Token has expired"}), 401
+            except jwt.InvalidTokenError:
+                return jsonify({"error": "Invalid token"}), 401
+
+            principal = principal_from_user(user)
+            principal_cache.put(digest, principal, token_exp=payload.get("exp"))
+
+            request.user = user if load_user else principal
+        elif load_user:
+            user = Users.query.get(principal.id)
             if not user:
-                 return jsonify({"error": "User not found"}), 401
-            
+                principal_cache.invalidate_user(principal.id)
+                return jsonify({"error": "User not found"}), 401
             request.user = user # SQLAlchemy User 모델 객체 자체를 주입
-
-        except jwt.ExpiredSignatureError:
-            return jsonify({"error": "Token has expired"}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({"error": "Invalid token"}), 401
+        else:
+            request.user = principal
         
         return func(*args, **kwargs)
     
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+# 역할 -> 해당 역할 사용자 id 목록(쉼표 구분)이 들어 있는 설정 키
+ROLE_SETTINGS = {
+    "admin": "ADMIN_USER_IDS",
+    "coordinator": "MATCH_COORDINATOR_USER_IDS",
+}
+
+
+def role_user_ids(role):
+    raw = current_app.config.get(ROLE_SETTINGS[role]) or ""
+    if isinstance(raw, str):
+        return {int(v) for v in raw.split(",") if v.strip()}
+    return {int(v) for v in raw}
+
+
+def has_role(user, *roles):
+    return any(user.id in role_user_ids(role) for role in roles)
+
+
+def require_role(*roles, load_user=False):
+    """@require_auth + 역할 검사. 사용자가 roles 중 하나라도 가지고 있어야 통과 (아니면 403)
+
+    운영용 통계 엔드포인트는 @require_role("admin")으로 보호합니다.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not has_role(request.user, *roles):
+                return jsonify({"error": "Insufficient privileges"}), 403
+            return func(*args, **kwargs)
+        return require_auth(wrapper, load_user=load_user)
+    return decorator
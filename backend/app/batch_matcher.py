@@ -0,0 +1,185 @@
+import heapq
+import logging
+import os
+import threading
+from collections import namedtuple
+from sqlalchemy import bindparam, func
+from .database import db
+from .models import Users, MatchRequests, Matches
+from .helper_index import helper_index
+from .request_queues import request_queues
+
+logger = logging.getLogger(__name__)
+
+PendingRequest = namedtuple("PendingRequest", [
+    "id", "language", "preferred_gender", "preferred_college_id", "school_id",
+])
+
+
+def compute_assignment(requests, helpers, load, capacity):
+    """대기 중인 요청들에 도우미를 한 번에 배정 (DB 접근 없음)
+
+    - requests: 우선순위(대기 시간) 순으로 정렬된 PendingRequest 리스트
+    - helpers: {user_id: HelperEntry} (helper_index.helpers와 같은 형태)
+    - load: {user_id: 현재 진행 중 매칭 + 제안 중 요청 수}
+    - capacity: 도우미 한 명당 최대 동시 매칭 수
+
+    같은 조건(언어, 성별, 단과대학, 학교)의 요청끼리는 도우미 힙 하나를 공유하고,
+    힙 항목의 부하 값이 낡았으면 꺼낼 때 갱신하는(lazy update) 방식으로
+    요청 하나당 O(log H)에 가장 한가한 같은 학교 도우미를 고릅니다.
+    반환값은 (request_id, helper_user_id) 리스트입니다.
+    """
+    by_language, by_gender, by_college = {}, {}, {}
+    for h in helpers.values():
+        for code in h.languages:
+            by_language.setdefault(code, set()).add(h.id)
+        by_gender.setdefault(h.gender, set()).add(h.id)
+        by_college.setdefault(h.college_id, set()).add(h.id)
+
+    load = dict(load)
+    heaps = {}
+    assignments = []
+
+    for req in requests:
+        gender = req.preferred_gender if req.preferred_gender not in (None, "any") else None
+        key = (req.language, gender, req.preferred_college_id, req.school_id)
+
+        heap = heaps.get(key)
+        if heap is None:
+            filters = []
+            if req.language:
+                filters.append(by_language.get(req.language, set()))
+            if gender:
+                filters.append(by_gender.get(gender, set()))
+            if req.preferred_college_id:
+                filters.append(by_college.get(req.preferred_college_id, set()))
+            if filters:
+                filters.sort(key=len)
+                eligible = filters[0].intersection(*filters[1:])
+            else:
+                eligible = helpers.keys()
+            heap = [(0 if helpers[h].school_id == req.school_id else 1, load.get(h, 0), h)
+                    for h in eligible if load.get(h, 0) < capacity]
+            heapq.heapify(heap)
+            heaps[key] = heap
+
+        while heap:
+            other_school, seen_load, helper_id = heap[0]
+            current = load.get(helper_id, 0)
+            if current >= capacity:
+                heapq.heappop(heap)
+            elif current != seen_load:
+                heapq.heapreplace(heap, (other_school, current, helper_id))
+            else:
+                break
+        else:
+            continue  # 조건에 맞는 여유 도우미 없음
+
+        assignments.append((req.id, helper_id))
+        load[helper_id] = current + 1
+        heapq.heapreplace(heap, (other_school, current + 1, helper_id))
+
+    return assignments
+
+
+def load_pending_requests():
+    """pending 요청을 대기 시간 순으로 한 번의 쿼리로 읽음"""
+    rows = db.session.query(MatchRequests.id, Users.main_language, MatchRequests.preferred_gender,
+                            MatchRequests.preferred_college_id, Users.school_id)\
+                     .join(Users, Users.id == MatchRequests.requester_user_id)\
+                     .filter(MatchRequests.status == 'pending')\
+                     .order_by(MatchRequests.created_at.asc(), MatchRequests.id.asc())\
+                     .all()
+    return [PendingRequest(*row) for row in rows]
+
+
+def load_helper_load():
+    """도우미별 현재 부하 = 진행 중 매칭 수 + 제안(offered) 상태 요청 수"""
+    load = dict(db.session.query(Matches.mentor_user_id, func.count(Matches.id))
+                          .filter(Matches.status == 'active')
+                          .group_by(Matches.mentor_user_id)
+                          .all())
+    offered = db.session.query(MatchRequests.offered_mentor_user_id, func.count(MatchRequests.id))\
+                        .filter(MatchRequests.status == 'offered',
+                                MatchRequests.offered_mentor_user_id.isnot(None))\
+                        .group_by(MatchRequests.offered_mentor_user_id)\
+                        .all()
+    for helper_id, count in offered:
+        load[helper_id] = load.get(helper_id, 0) + count
+    return load
+
+
+def write_offers(assignments, chunk_size=1000):
+    """배정 결과를 chunk 단위 다중 UPDATE로 기록. 그 사이 상태가 바뀐 요청은 건너뜀"""
+    table = MatchRequests.__table__
+    stmt = table.update()\
+                .where(table.c.id == bindparam("rid"), table.c.status == 'pending')\
+                .values(status='offered', offered_mentor_user_id=bindparam("mentor"))
+    written = 0
+    for start in range(0, len(assignments), chunk_size):
+        chunk = assignments[start:start + chunk_size]
+        result = db.session.execute(stmt, [{"rid": rid, "mentor": mentor} for rid, mentor in chunk])
+        db.session.commit()
+        request_queues.discard([rid for rid, _ in chunk])
+        written += result.rowcount
+    return written
+
+
+def run_batch_match(capacity, dry_run=False, chunk_size=1000):
+    """pending 요청 전체에 대해 배정을 계산하고 제안을 일괄 기록"""
+    helper_index.ensure_fresh()
+    requests = load_pending_requests()
+    load = load_helper_load()
+    assignments = compute_assignment(requests, dict(helper_index.helpers), load, capacity)
+    written = 0 if dry_run else write_offers(assignments, chunk_size)
+    return {"pending": len(requests), "assigned": len(assignments), "written": written}
+
+
+class BatchMatchScheduler:
+    """BATCH_MATCH_INTERVAL(초)마다 run_batch_match를 실행하는 데몬 스레드
+
+    create_app에서 스레드를 만들면 preload 후 fork된 워커에는 스레드가 없으므로 (fork는 호출한 스레드만 복제)
+    각 프로세스의 첫 요청에서 pid를 확인해 그 프로세스의 스레드를 시작합니다.
+    """
+
+    def __init__(self, app, interval):
+        self.app = app
+        self.interval = interval
+        self.stop = threading.Event()
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def ensure_started(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+        threading.Thread(target=self._loop, name="batch-matcher", daemon=True).start()
+
+    def _loop(self):
+        while not self.stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    result = run_batch_match(self.app.config['MATCH_HELPER_CAPACITY'])
+                    logger.info("batch match: %s", result)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("batch match failed")
+
+
+def start_scheduler(app):
+    """BATCH_MATCH_INTERVAL > 0 이면 워커 프로세스마다 첫 요청에서 일괄 매칭 스레드를 시작하도록 등록
+
+    제안 기록은 status='pending' 조건부 UPDATE라 여러 워커가 동시에 돌아도 같은 요청이 두 번 배정되지는 않지만,
+    도우미 부하를 각자 계산하므로 워커가 여러 개라면 한 곳에서만 켜거나 대신 cron으로 `flask batch-match`를 실행하세요.
+    """
+    interval = app.config['BATCH_MATCH_INTERVAL']
+    if interval <= 0:
+        return None
+    scheduler = BatchMatchScheduler(app, interval)
+    app.before_request(scheduler.ensure_started)
+    app.extensions['batch_matcher'] = scheduler
+    return scheduler
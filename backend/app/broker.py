@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import and_, func, or_
+from .models import db, Messages
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """하나의 구독(SSE 연결 등)이 받는 이벤트 큐
+
+    소비가 느려 큐가 가득 차면 이벤트를 버리지 않고 overflowed 플래그를 세웁니다.
+    이 경우 구독자는 연결을 끊고 DB(after_id)로 재동기화해야 합니다.
+    """
+
+    def __init__(self, backend, channel, maxsize):
+        self._backend = backend
+        self.channel = channel
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _deliver(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout=None):
+        """다음 이벤트를 반환. timeout 동안 이벤트가 없으면 None"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._backend.unsubscribe(self)
+
+
+class BrokerBackend:
+    """브로커 백엔드 인터페이스
+
+    여러 워커 프로세스가 이벤트를 공유하려면 이 인터페이스를 구현한
+    백엔드(예: Redis pub/sub)를 BROKER_BACKENDS에 등록하면 됩니다.
+    """
+
+    def publish(self, channel, event):
+        raise NotImplementedError
+
+    def subscribe(self, channel):
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+
+class LocalBackend(BrokerBackend):
+    """단일 프로세스 안에서만 동작하는 인메모리 백엔드 (개발/테스트용)
+
+    다른 워커 프로세스에서 publish한 이벤트는 받지 못하므로 워커가 여러 개면 "db" 백엔드를 쓰세요.
+    """
+
+    def __init__(self, queue_size=1000, app=None):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for sub in subscribers:
+            sub._deliver(event)
+
+    def subscribe(self, channel):
+        sub = Subscription(self, channel, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subs = self._subscribers.get(subscription.channel)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscribers[subscription.channel]
+
+
+class DatabasePollingBackend(LocalBackend):
+    """messages 테이블을 주기적으로 조회해 다른 워커 프로세스에서 보낸 메시지도 전달하는 백엔드
+
+    같은 프로세스의 publish는 LocalBackend처럼 바로 전달하고, 프로세스마다 폴링 스레드 하나가
+    구독 중인 대화방의 `id > 마지막으로 본 id` 메시지를 MESSAGE_BROKER_POLL_INTERVAL마다 한 번에 조회합니다.
+    폴링 스레드는 fork된 워커에서도 동작하도록 첫 구독 때 프로세스마다 시작합니다.
+    conversation 채널만 DB에서 따라잡으며, 이미 전달한 id는 채널마다 최근 RECENT_IDS개를 기억해 다시 보내지 않습니다.
+    """
+
+    RECENT_IDS = 1000
+
+    def __init__(self, queue_size=1000, app=None):
+        super().__init__(queue_size)
+        self.app = app
+        self.interval = app.config['MESSAGE_BROKER_POLL_INTERVAL'] if app is not None else 1.0
+        self.batch_size = 500
+        self._watermarks = {}   # conversation id -> 마지막으로 본 messages.id
+        self._delivered = {}    # channel -> OrderedDict(최근 전달한 message id)
+        self._pid = None
+
+    def publish(self, channel, event):
+        if self._mark_delivered(channel, event.get("id")):
+            super().publish(channel, event)
+
+    def subscribe(self, channel):
+        self._ensure_poller()
+        conv_id = _conversation_id(channel)
+        if conv_id is not None:
+            with self._lock:
+                known = conv_id in self._watermarks
+            if not known:
+                last_id = self._max_message_id(conv_id)
+                with self._lock:
+                    self._watermarks.setdefault(conv_id, last_id)
+        return super().subscribe(channel)
+
+    def _mark_delivered(self, channel, event_id):
+        """처음 전달하는 id면 기록하고 True (id 없는 이벤트는 항상 True)"""
+        if event_id is None:
+            return True
+        with self._lock:
+            recent = self._delivered.setdefault(channel, OrderedDict())
+            if event_id in recent:
+                return False
+            recent[event_id] = None
+            if len(recent) > self.RECENT_IDS:
+                recent.popitem(last=False)
+            return True
+
+    def _ensure_poller(self):
+        pid = os.getpid()
+        if self._pid == pid or self.app is None:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            threading.Thread(target=self._run, name="broker-poller", daemon=True).start()
+
+    @staticmethod
+    def _max_message_id(conv_id):
+        return db.session.query(func.max(Messages.id)).filter(Messages.conversation_id == conv_id).scalar() or 0
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self.app.app_context():
+                try:
+                    self.poll()
+                except Exception:
+                    logger.exception("message broker poll failed")
+                finally:
+                    db.session.remove()
+
+    def poll(self):
+        """구독 중인 대화방의 새 메시지를 한 번 조회해 전달. 전달한 이벤트 수 반환"""
+        with self._lock:
+            active = {_conversation_id(ch) for ch in self._subscribers}
+            for conv_id in list(self._watermarks):
+                if conv_id not in active:
+                    del self._watermarks[conv_id]
+                    self._delivered.pop(conversation_channel(conv_id), None)
+            watermarks = dict(self._watermarks)
+        if not watermarks:
+            return 0
+
+        # 대화방마다 자기 워터마크로 조건을 걸어야 조용한 대화방이 바쁜 대화방의 이미 본 행에 밀리지 않음
+        # (결과의 모든 행이 새 메시지이므로 LIMIT에 걸려도 다음 조회는 항상 앞으로 나아감)
+        delivered = 0
+        items = sorted(watermarks.items())
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start:start + self.batch_size]
+            rows = db.session.query(Messages)\
+                             .filter(or_(*(and_(Messages.conversation_id == conv_id, Messages.id > last_id)
+                                           for conv_id, last_id in chunk)))\
+                             .order_by(Messages.id.asc())\
+                             .limit(self.batch_size)\
+                             .all()
+            seen = {}
+            for m in rows:
+                seen[m.conversation_id] = m.id
+                channel = conversation_channel(m.conversation_id)
+                if self._mark_delivered(channel, m.id):
+                    LocalBackend.publish(self, channel, message_event(m))
+                    delivered += 1
+            with self._lock:
+                for conv_id, last_id in seen.items():
+                    if conv_id in self._watermarks:
+                        self._watermarks[conv_id] = max(self._watermarks[conv_id], last_id)
+        return delivered
+
+
+BROKER_BACKENDS = {
+    "local": LocalBackend,
+    "db": DatabasePollingBackend,
+}
+
+
+class MessageBroker:
+    """앱 전역 pub/sub 브로커. db와 같이 생성 후 create_app에서 init_app으로 초기화"""
+
+    def __init__(self):
+        self.backend = None
+
+    def init_app(self, app):
+        backend_cls = BROKER_BACKENDS[app.config['MESSAGE_BROKER_BACKEND']]
+        self.backend = backend_cls(queue_size=app.config['MESSAGE_BROKER_QUEUE_SIZE'], app=app)
+        app.extensions['message_broker'] = self
+
+    def publish(self, channel, event):
+        self.backend.publish(channel, event)
+
+    def subscribe(self, channel):
+        return self.backend.subscribe(channel)
+
+
+def conversation_channel(conv_id):
+    return f"conversation:{conv_id}"
+
+
+def _conversation_id(channel):
+    prefix, _, conv_id = channel.partition(":")
+    return int(conv_id) if prefix == "conversation" and conv_id.isdigit() else None
+
+
+def message_event(m):
+    """채팅 메시지(Messages 또는 같은 속성을 가진 객체)를 API / 브로커 이벤트 형식으로 직렬화"""
+    return {"id": m.id, "sender_user_id": m.sender_user_id, "content": m.content,
+            "created_at": m.created_at.isoformat()}
+
+
+def format_sse(data, event=None, event_id=None):
+    """Server-Sent Events 한 건을 텍스트로 직렬화"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+broker = MessageBroker()
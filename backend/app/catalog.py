@@ -0,0 +1,152 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+from sqlalchemy.exc import SQLAlchemyError
+from .models import Language, Country, Schools, Colleges, Departments
+from .serializers import dumps
+from .version_stamp import VersionStamp
+
+logger = logging.getLogger(__name__)
+
+LanguageRef = namedtuple("LanguageRef", ["code", "name", "native_name"])
+CountryRef = namedtuple("CountryRef", ["iso2", "name"])
+SchoolRef = namedtuple("SchoolRef", ["id", "school_name", "website_url"])
+CollegeRef = namedtuple("CollegeRef", ["id", "school_id", "college_name"])
+DepartmentRef = namedtuple("DepartmentRef", ["id", "school_id", "college_id", "department_name"])
+
+Payload = namedtuple("Payload", ["body", "etag"])
+
+
+def _payload(data):
+    body = dumps(data)
+    return Payload(body, hashlib.sha1(body).hexdigest()[:20])
+
+
+def _group(items, key):
+    grouped = {}
+    for item in items:
+        grouped.setdefault(getattr(item, key), []).append(item)
+    return MappingProxyType({k: tuple(v) for k, v in grouped.items()})
+
+
+class CatalogSnapshot:
+    """한 시점의 참조 데이터. 생성 후 변경하지 않으며, 재로딩은 새 스냅샷으로 교체"""
+
+    def __init__(self, languages, countries, schools, colleges, departments):
+        self.loaded_at = time.time()
+        self.languages = tuple(languages)
+        self.countries = tuple(countries)
+        self.schools = tuple(schools)
+        self.colleges = tuple(colleges)
+        self.departments = tuple(departments)
+
+        self.languages_by_code = MappingProxyType({l.code: l for l in self.languages})
+        self.countries_by_iso2 = MappingProxyType({c.iso2: c for c in self.countries})
+        self.schools_by_id = MappingProxyType({s.id: s for s in self.schools})
+        self.colleges_by_id = MappingProxyType({c.id: c for c in self.colleges})
+        self.departments_by_id = MappingProxyType({d.id: d for d in self.departments})
+        self.colleges_by_school = _group(self.colleges, "school_id")
+        self.departments_by_school = _group(self.departments, "school_id")
+        self.departments_by_college = _group(self.departments, "college_id")
+
+        # 읽기 전용 엔드포인트용 JSON bytes + ETag 미리 계산
+        payloads = {
+            "languages": _payload([l._asdict() for l in self.languages]),
+            "countries": _payload([c._asdict() for c in self.countries]),
+            "schools": _payload([s._asdict() for s in self.schools]),
+        }
+        for school in self.schools:
+            payloads[("colleges", school.id)] = _payload(
+                [c._asdict() for c in self.colleges_by_school.get(school.id, ())])
+            payloads[("departments", school.id)] = _payload(
+                [d._asdict() for d in self.departments_by_school.get(school.id, ())])
+        self.payloads = MappingProxyType(payloads)
+
+    @classmethod
+    def load(cls):
+        """5개 참조 테이블을 각각 한 번씩 조회해 스냅샷 생성"""
+        return cls(
+            [LanguageRef(*r) for r in Language.query.with_entities(
+                Language.code, Language.name, Language.native_name).order_by(Language.code)],
+            [CountryRef(*r) for r in Country.query.with_entities(
+                Country.iso2, Country.name).order_by(Country.iso2)],
+            [SchoolRef(*r) for r in Schools.query.with_entities(
+                Schools.id, Schools.school_name, Schools.website_url).order_by(Schools.id)],
+            [CollegeRef(*r) for r in Colleges.query.with_entities(
+                Colleges.id, Colleges.school_id, Colleges.college_name).order_by(Colleges.id)],
+            [DepartmentRef(*r) for r in Departments.query.with_entities(
+                Departments.id, Departments.school_id, Departments.college_id,
+                Departments.department_name).order_by(Departments.id)],
+        )
+
+
+class Catalog:
+    """언어/국가/학교/단과대학/학과 참조 데이터 카탈로그
+
+    create_app 시점에 메모리로 읽어 두고, `flask reload-catalog`(버전 파일 갱신) 후
+    각 워커가 다음 접근 때 새 스냅샷으로 교체합니다. 버전 파일 확인은 CATALOG_CHECK_INTERVAL마다 한 번.
+    """
+
+    def __init__(self):
+        self.stamp = VersionStamp()
+        self.check_interval = 1.0
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.stamp = VersionStamp(app.config['CATALOG_VERSION_FILE'])
+        self.check_interval = app.config['CATALOG_CHECK_INTERVAL']
+        self._snapshot = None
+        app.extensions['catalog'] = self
+        if app.config['CATALOG_PRELOAD']:
+            with app.app_context():
+                try:
+                    self.reload()
+                except SQLAlchemyError:
+                    # 테이블이 아직 없는 경우(init-db 전 등) 첫 접근 때 로드
+                    logger.warning("catalog preload failed; will load on first use", exc_info=True)
+
+    def reload(self):
+        stamp = self.stamp.current()
+        snapshot = CatalogSnapshot.load()
+        with self._lock:
+            self._snapshot = snapshot
+            self.stamp.mark_seen(stamp)
+            self._checked_at = time.monotonic()
+        return snapshot
+
+    @property
+    def snapshot(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload()
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self.stamp.changed():
+                return self.reload()
+        return snapshot
+
+    # --- 라우트에서 쓰는 조회 도우미 ---
+
+    def school(self, school_id):
+        return self.snapshot.schools_by_id.get(school_id)
+
+    def college(self, college_id):
+        return self.snapshot.colleges_by_id.get(college_id)
+
+    def department(self, department_id):
+        return self.snapshot.departments_by_id.get(department_id)
+
+    def language(self, code):
+        return self.snapshot.languages_by_code.get(code)
+
+    def payload(self, key):
+        return self.snapshot.payloads.get(key)
+
+
+catalog = Catalog()
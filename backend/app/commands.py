@@ -0,0 +1,140 @@
+import click
+from sqlalchemy import func, select
+from .database import db
+
+
+def register_commands(app):
+    """flask CLI 관리 명령어 등록"""
+
+    @app.cli.command("init-db")
+    def init_db():
+        from .migrations import mark_all_applied
+        db.create_all()
+        mark_all_applied() # 새로 만든 테이블은 이미 최신 스키마
+        print("Database tables created.")
+
+    @app.cli.command("migrate")
+    @click.option("--list", "list_only", is_flag=True, help="적용할 마이그레이션만 출력")
+    def migrate(list_only):
+        """기존 DB에 migrations/*.sql 중 아직 적용하지 않은 스키마 변경을 순서대로 적용
+
+        create_all은 이미 있는 테이블에 컬럼/인덱스/제약을 추가하지 않으므로,
+        운영 DB는 배포 전에 이 명령을 실행해야 합니다. 새 테이블은 init-db(create_all)로 만듭니다.
+        """
+        from .migrations import pending, apply_pending
+        if list_only:
+            for version, _ in pending():
+                click.echo(version)
+            return
+        db.create_all() # 새로 추가된 테이블 생성 (기존 테이블은 건드리지 않음)
+        done = apply_pending(echo=click.echo)
+        click.echo(f"Applied {len(done)} migrations.")
+
+    @app.cli.command("rebuild-helper-index")
+    def rebuild_helper_index():
+        """도우미 후보 색인을 전체 재빌드하고 실행 중인 워커에도 재빌드를 알림"""
+        from .helper_index import helper_index
+        count = helper_index.rebuild()
+        helper_index.stamp.bump()
+        click.echo(f"Helper index rebuilt: {count} helpers.")
+
+    @app.cli.command("batch-match")
+    @click.option("--capacity", type=int, default=None, help="도우미 1명당 최대 동시 매칭 수")
+    @click.option("--dry-run", is_flag=True, help="배정만 계산하고 기록하지 않음")
+    def batch_match(capacity, dry_run):
+        """pending 매칭 요청 전체에 도우미를 일괄 배정하고 제안(offered)으로 기록"""
+        from .batch_matcher import run_batch_match
+        if capacity is None:
+            capacity = app.config['MATCH_HELPER_CAPACITY']
+        result = run_batch_match(capacity, dry_run=dry_run)
+        click.echo(f"pending={result['pending']} assigned={result['assigned']} "
+                   f"written={result['written']}")
+
+    @app.cli.command("recount-post-counters")
+    def recount_post_counters():
+        """posts.like_count / comment_count를 post_likes / comments 기준으로 다시 계산"""
+        from .counters import post_counters
+        from .models import Posts, PostLikes, Comments
+        post_counters.flush()
+        posts = Posts.__table__
+        likes = select(func.count(PostLikes.id)).where(PostLikes.post_id == posts.c.id).scalar_subquery()
+        comments = select(func.count(Comments.id)).where(Comments.post_id == posts.c.id).scalar_subquery()
+        result = db.session.execute(posts.update().values(
+            like_count=likes, comment_count=comments, updated_at=posts.c.updated_at))
+        db.session.commit()
+        click.echo(f"Recounted {result.rowcount} posts.")
+
+    @app.cli.command("rebuild-search-index")
+    @click.option("--batch-size", type=int, default=1000, help="한 번에 색인할 글 수")
+    def rebuild_search_index(batch_size):
+        """게시글 검색 역색인을 전체 재생성 (글 batch 단위로 교체하므로 실행 중에도 검색 가능)"""
+        from .search import rebuild_index
+        count = rebuild_index(batch_size=batch_size)
+        click.echo(f"Search index rebuilt: {count} posts.")
+
+    @app.cli.command("reload-catalog")
+    def reload_catalog():
+        """참조 데이터 카탈로그를 다시 읽고 실행 중인 워커에도 재로딩을 알림"""
+        from .catalog import catalog
+        snapshot = catalog.reload()
+        catalog.stamp.bump()
+        click.echo(f"Catalog reloaded: {len(snapshot.languages)} languages, "
+                   f"{len(snapshot.countries)} countries, {len(snapshot.schools)} schools, "
+                   f"{len(snapshot.colleges)} colleges, {len(snapshot.departments)} departments.")
+
+    @app.cli.command("rebuild-inbox-counters")
+    def rebuild_inbox_counters():
+        """대화방 마지막 메시지 / 참여자별 안 읽은 수를 메시지 기준으로 재계산"""
+        from .inbox import rebuild_counters
+        count = rebuild_counters()
+        click.echo(f"Inbox counters rebuilt for {count} participants.")
+
+    @app.cli.command("archive-messages")
+    @click.option("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 대화방 수")
+    def archive_messages(limit):
+        """종료된 매칭의 오래된 대화 메시지를 압축 세그먼트 파일로 옮기고 messages 테이블에서 삭제"""
+        from .message_archive import message_archive
+        conversations, moved = message_archive.archive_ended(limit=limit)
+        click.echo(f"Archived {moved} messages from {conversations} conversations.")
+
+    @app.cli.command("import-data")
+    @click.argument("entity", type=click.Choice(["schools", "colleges", "departments",
+                                                 "communities", "boards", "users"]))
+    @click.argument("source", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), default=None,
+                  help="기본: 확장자로 판단 (.ndjson/.jsonl 외에는 csv)")
+    @click.option("--chunk-size", type=int, default=1000, help="트랜잭션 1회에 넣을 레코드 수")
+    @click.option("--hash-workers", type=int, default=None, help="bcrypt 해싱 프로세스 수 (기본: CPU 수)")
+    @click.option("--bcrypt-rounds", type=int, default=None, help="기본: BCRYPT_ROUNDS")
+    @click.option("--restart", is_flag=True, help="체크포인트를 무시하고 처음부터 다시 가져오기")
+    def import_data(entity, source, fmt, chunk_size, hash_workers, bcrypt_rounds, restart):
+        """CSV / NDJSON 파일에서 기관 데이터 또는 사용자를 일괄 가져오기
+
+        schools -> colleges -> departments -> communities -> boards -> users 순서로 실행하세요.
+        중단되면 같은 명령을 다시 실행해 마지막으로 커밋된 chunk 다음부터 이어서 진행합니다.
+        """
+        from .importer import BulkImporter
+        from .catalog import catalog
+        from .helper_index import helper_index
+        if bcrypt_rounds is None:
+            bcrypt_rounds = app.config['BCRYPT_ROUNDS']
+        importer = BulkImporter(entity, source, fmt=fmt, chunk_size=chunk_size,
+                                hash_workers=hash_workers, bcrypt_rounds=bcrypt_rounds,
+                                resume=not restart)
+        if importer.resumed:
+            click.echo(f"Resuming after record {importer.checkpoint.state['done']}.")
+
+        def progress(state):
+            click.echo(f"  {state['done']} records: inserted={state['inserted']} "
+                       f"skipped={state['skipped']} rejected={state['rejected']}")
+
+        result = importer.run(progress=progress)
+        # 실행 중인 워커가 다음 접근 때 새 데이터를 읽도록 버전 파일 갱신
+        if entity == "users":
+            helper_index.stamp.bump()
+        elif entity in ("schools", "colleges", "departments"):
+            catalog.stamp.bump()
+        click.echo(f"Imported {entity}: inserted={result['inserted']} skipped={result['skipped']} "
+                   f"rejected={result['rejected']}")
+        if result['rejected']:
+            click.echo(f"Rejected records: {importer.rejects_path}")
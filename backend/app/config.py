@@ -1,3 +1,4 @@
+import json
 import os
 
 class Config:
@@ -12,5 +13,149 @@ class Config:
     SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}/{DB_NAME}?charset=utf8mb4"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # DB 커넥션 풀 설정 (SQLite 등 풀 옵션을 받지 않는 DB는 {}로 덮어쓰기)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", 20)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+    }
+    
     # JWT 비밀 키 (매우 중요!)
-    SECRET_KEY = os.getenv("SECRET_KEY", "my-super-secret-key-for-hi-campus-project-123!")
\ No newline at end of file
+    SECRET_KEY = os.getenv("SECRET_KEY", "my-super-secret-key-for-hi-campus-project-123!")
+    
+    # 운영자 사용자 id (쉼표 구분). 통계 엔드포인트 등 @require_role("admin") 라우트에 접근 가능
+    ADMIN_USER_IDS = os.getenv("ADMIN_USER_IDS", "")
+    # 매칭 코디네이터 사용자 id (쉼표 구분). 일괄 수락 등 관리자 도구용 매칭 라우트에 접근 가능
+    MATCH_COORDINATOR_USER_IDS = os.getenv("MATCH_COORDINATOR_USER_IDS", "")
+    
+    # 게시판 글 목록 페이지 크기 (커서 기반 페이지네이션)
+    POSTS_PAGE_SIZE = int(os.getenv("POSTS_PAGE_SIZE", 20))
+    POSTS_MAX_PAGE_SIZE = int(os.getenv("POSTS_MAX_PAGE_SIZE", 100))
+    
+    # 대화 메시지 조회 페이지 크기 (after_id / before_id 커서)
+    MESSAGES_PAGE_SIZE = int(os.getenv("MESSAGES_PAGE_SIZE", 50))
+    MESSAGES_MAX_PAGE_SIZE = int(os.getenv("MESSAGES_MAX_PAGE_SIZE", 200))
+    
+    # 메시지 실시간 전달 (SSE) 브로커 설정
+    # db: 다른 워커에서 보낸 메시지도 messages 테이블 폴링으로 전달 / local: 단일 프로세스 전용
+    MESSAGE_BROKER_BACKEND = os.getenv("MESSAGE_BROKER_BACKEND", "db")
+    MESSAGE_BROKER_QUEUE_SIZE = int(os.getenv("MESSAGE_BROKER_QUEUE_SIZE", 1000))
+    MESSAGE_BROKER_POLL_INTERVAL = float(os.getenv("MESSAGE_BROKER_POLL_INTERVAL", 1.0))
+    MESSAGE_STREAM_HEARTBEAT_SECONDS = int(os.getenv("MESSAGE_STREAM_HEARTBEAT_SECONDS", 15))
+    MESSAGE_STREAM_MAX_SECONDS = int(os.getenv("MESSAGE_STREAM_MAX_SECONDS", 300))
+    
+    # 인증 사용자(Principal) 캐시: 최대 항목 수, 유효 시간(초)
+    PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", 10000))
+    PRINCIPAL_CACHE_TTL = int(os.getenv("PRINCIPAL_CACHE_TTL", 300))
+    
+    # 비밀번호 해싱: bcrypt cost 및 전용 해싱 풀 크기
+    # 풀은 스레드 워커(gthread --threads N)에서만 효과가 있음. 0(기본)이면 요청 스레드에서 바로 해싱 (sync 워커용)
+    # 스레드 워커에서는 WORKERS를 CPU 코어 수, QUEUE_SIZE를 워커당 요청 스레드 수 정도로 설정
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+    HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", 0))
+    HASH_POOL_QUEUE_SIZE = int(os.getenv("HASH_POOL_QUEUE_SIZE", 16))
+    HASH_POOL_TIMEOUT = int(os.getenv("HASH_POOL_TIMEOUT", 10))
+    HASH_POOL_RETRY_AFTER = int(os.getenv("HASH_POOL_RETRY_AFTER", 1))
+    
+    # 도우미 후보 인메모리 색인: 전체 재빌드 주기(초), 재빌드 신호용 버전 파일
+    HELPER_INDEX_MAX_AGE = int(os.getenv("HELPER_INDEX_MAX_AGE", 600))
+    HELPER_INDEX_VERSION_FILE = os.getenv("HELPER_INDEX_VERSION_FILE", "instance/helper_index.version")
+    
+    # 도우미 받은편지함: pending 요청 큐 전체 재빌드 주기(초), 페이지 크기
+    REQUEST_QUEUE_MAX_AGE = int(os.getenv("REQUEST_QUEUE_MAX_AGE", 300))
+    HELPER_INBOX_PAGE_SIZE = int(os.getenv("HELPER_INBOX_PAGE_SIZE", 20))
+    HELPER_INBOX_MAX_PAGE_SIZE = int(os.getenv("HELPER_INBOX_MAX_PAGE_SIZE", 50))
+    
+    # 일괄 자동 매칭: 도우미 1명당 최대 동시 매칭 수, 스케줄 주기(초, 0이면 비활성)
+    MATCH_HELPER_CAPACITY = int(os.getenv("MATCH_HELPER_CAPACITY", 3))
+    BATCH_MATCH_INTERVAL = int(os.getenv("BATCH_MATCH_INTERVAL", 0))
+    
+    # 좋아요/댓글 수 write-behind 버퍼: 반영 주기(초, 0이면 자동 반영 끔), UPDATE 묶음 크기
+    POST_COUNTER_FLUSH_INTERVAL = float(os.getenv("POST_COUNTER_FLUSH_INTERVAL", 2))
+    POST_COUNTER_FLUSH_BATCH = int(os.getenv("POST_COUNTER_FLUSH_BATCH", 500))
+    COMMENTS_PAGE_SIZE = int(os.getenv("COMMENTS_PAGE_SIZE", 50))
+    COMMENTS_MAX_PAGE_SIZE = int(os.getenv("COMMENTS_MAX_PAGE_SIZE", 200))
+    
+    # 게시글 검색 결과 페이지 크기
+    SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", 20))
+    SEARCH_MAX_PAGE_SIZE = int(os.getenv("SEARCH_MAX_PAGE_SIZE", 50))
+    
+    # 게시판 목록 응답 캐시: 최대 항목 수, 카운터 갱신 주기(초), 버전 저장소 백엔드
+    # (file: 워커 프로세스가 BOARD_CACHE_VERSION_DIR의 게시판별 파일로 버전 공유 / local: 단일 프로세스 전용)
+    BOARD_CACHE_SIZE = int(os.getenv("BOARD_CACHE_SIZE", 1024))
+    BOARD_CACHE_TTL = int(os.getenv("BOARD_CACHE_TTL", 30))
+    BOARD_CACHE_BACKEND = os.getenv("BOARD_CACHE_BACKEND", "file")
+    BOARD_CACHE_VERSION_DIR = os.getenv("BOARD_CACHE_VERSION_DIR", "instance/board_versions")
+    
+    # 참조 데이터 카탈로그 (언어/국가/학교/단과대학/학과)
+    CATALOG_PRELOAD = os.getenv("CATALOG_PRELOAD", "1") == "1"
+    CATALOG_VERSION_FILE = os.getenv("CATALOG_VERSION_FILE", "instance/catalog.version")
+    CATALOG_CHECK_INTERVAL = float(os.getenv("CATALOG_CHECK_INTERVAL", 1))
+    CATALOG_MAX_AGE = int(os.getenv("CATALOG_MAX_AGE", 3600))
+    
+    # 요청별 DB 쿼리 프로파일러 (N+1 감지, 기본 꺼짐). 켜면 헤더는 디버그 모드에서 항상 출력
+    DB_PROFILER_ENABLED = os.getenv("DB_PROFILER_ENABLED", "0") == "1"
+    DB_PROFILER_HEADERS = os.getenv("DB_PROFILER_HEADERS", "0") == "1"
+    DB_PROFILER_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_PROFILER_N_PLUS_ONE_THRESHOLD", 5))
+    
+    # 게시글 번역: 백엔드, 메모리 LRU 크기, 디스크 캐시 디렉터리(빈 값이면 사용 안 함),
+    # 글 작성 후 미리 번역할 언어(쉼표 구분, 비우면 카탈로그의 모든 언어)와 작업 스레드 수
+    # 백엔드를 비우면 번역 기능을 끔 (번역 목록 API는 503). fake는 `[언어] 원문`을 돌려주는 개발/테스트용
+    TRANSLATOR_BACKEND = os.getenv("TRANSLATOR_BACKEND", "")
+    TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", 10000))
+    TRANSLATION_CACHE_DIR = os.getenv("TRANSLATION_CACHE_DIR", "instance/translations")
+    TRANSLATION_WARM_LANGUAGES = os.getenv("TRANSLATION_WARM_LANGUAGES", "")
+    TRANSLATION_WARM_WORKERS = int(os.getenv("TRANSLATION_WARM_WORKERS", 2))
+    
+    # 종료된 매칭 대화 아카이브: 세그먼트 파일 위치, 종료 후 보관 기간(일), 세그먼트당 메시지 수, 메모리 캐시 세그먼트 수
+    MESSAGE_ARCHIVE_DIR = os.getenv("MESSAGE_ARCHIVE_DIR", "instance/message_archive")
+    MESSAGE_ARCHIVE_MIN_AGE_DAYS = int(os.getenv("MESSAGE_ARCHIVE_MIN_AGE_DAYS", 30))
+    MESSAGE_ARCHIVE_SEGMENT_SIZE = int(os.getenv("MESSAGE_ARCHIVE_SEGMENT_SIZE", 5000))
+    MESSAGE_ARCHIVE_CACHE_SIZE = int(os.getenv("MESSAGE_ARCHIVE_CACHE_SIZE", 64))
+    
+    # 쓰기 핫패스 요청 제한 (토큰 버킷). 규칙은 "횟수/second|minute|hour|day", RATE_LIMITS 환경 변수(JSON)로 교체 가능
+    # shm 백엔드는 같은 호스트의 워커 프로세스가 mmap 파일 하나로 버킷을 공유
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "shm" if os.name == "posix" else "local")
+    RATE_LIMIT_SHM_PATH = os.getenv("RATE_LIMIT_SHM_PATH", "/dev/shm/hi_campus_rate_limit"
+                                    if os.path.isdir("/dev/shm") else "instance/rate_limit.shm")
+    RATE_LIMIT_SHM_SLOTS = int(os.getenv("RATE_LIMIT_SHM_SLOTS", 65536))
+    # 앱 앞에 있는 신뢰할 수 있는 리버스 프록시 수 (X-Forwarded-For를 몇 단계까지 믿을지)
+    # 0이면 request.remote_addr(직접 연결한 주소)를 쓰므로 프록시 뒤에서는 "ip" 규칙이 프록시 주소 하나에 걸려
+    # 사이트 전체 한도가 됩니다. 프록시 뒤에 배포하면 반드시 설정하세요.
+    TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", 0))
+    RATE_LIMITS = json.loads(os.getenv("RATE_LIMITS", "null")) or {
+        "login": {"user": "10/minute", "ip": "30/minute"},       # user = 로그인 시도 이메일
+        "create_post": {"user": "10/minute", "ip": "60/minute"},
+        "send_message": {"user": "60/minute", "ip": "300/minute"},
+        "create_match_request": {"user": "5/minute", "ip": "30/minute"},
+    }
+    
+    # 홈 피드: 게시판별로 메모리에 들고 있는 최신 글 수, 링 최대 유지 시간(초)
+    # 다른 워커의 새 글은 BOARD_CACHE_BACKEND 버전으로 감지하고, MAX_AGE는 버전을 올리지 않는 변경이 반영되는 상한
+    HOME_FEED_RING_SIZE = int(os.getenv("HOME_FEED_RING_SIZE", 100))
+    HOME_FEED_RING_MAX_AGE = int(os.getenv("HOME_FEED_RING_MAX_AGE", 60))
+    HOME_FEED_PAGE_SIZE = int(os.getenv("HOME_FEED_PAGE_SIZE", 20))
+    HOME_FEED_MAX_PAGE_SIZE = int(os.getenv("HOME_FEED_MAX_PAGE_SIZE", 50))
+    
+    # 메시지 group commit: 켜면 send_message의 INSERT를 백그라운드 writer가 모아 한 트랜잭션으로 커밋
+    # (배치 최대 메시지 수, 첫 메시지 후 최대 대기(ms), 요청이 커밋을 기다리는 최대 시간(초))
+    MESSAGE_GROUP_COMMIT = os.getenv("MESSAGE_GROUP_COMMIT", "0") == "1"
+    MESSAGE_GROUP_COMMIT_MAX_BATCH = int(os.getenv("MESSAGE_GROUP_COMMIT_MAX_BATCH", 200))
+    MESSAGE_GROUP_COMMIT_MAX_WAIT_MS = float(os.getenv("MESSAGE_GROUP_COMMIT_MAX_WAIT_MS", 5))
+    MESSAGE_GROUP_COMMIT_TIMEOUT = float(os.getenv("MESSAGE_GROUP_COMMIT_TIMEOUT", 10))
+    
+    # 요청 계측 (GET /metrics, Prometheus 형식): 히스토그램 경계(초), 워커별 값을 모으는 디렉터리와 저장 주기(초)
+    # METRICS_DIR을 비우면 /metrics는 응답한 워커 프로세스의 값만 보여줌
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+    METRICS_BUCKETS = os.getenv("METRICS_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10")
+    METRICS_DIR = os.getenv("METRICS_DIR", "instance/metrics")
+    METRICS_FLUSH_INTERVAL = int(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+    
+    # 느린 요청 샘플링 프로파일러 (기본 꺼짐): 저장 기준 지연(ms), 샘플 간격(ms), collapsed stack 파일 저장 위치
+    PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "0") == "1"
+    PROFILER_THRESHOLD_MS = float(os.getenv("PROFILER_THRESHOLD_MS", 500))
+    PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", 10))
+    PROFILER_DIR = os.getenv("PROFILER_DIR", "instance/profiles")
@@ -0,0 +1,124 @@
+import atexit
+import logging
+import os
+import threading
+from sqlalchemy import bindparam
+from .database import db
+from .models import Posts
+
+logger = logging.getLogger(__name__)
+
+
+class PostCounterBuffer:
+    """posts.like_count / comment_count 증감을 메모리에 모았다가 주기적으로 일괄 반영 (write-behind)
+
+    좋아요/댓글 하나마다 posts 행을 UPDATE하지 않으므로 인기 글에 행 잠금이 몰리지 않습니다.
+    조회 시에는 DB 값에 아직 반영되지 않은 증감(pending)을 더해서 보여줍니다.
+    프로세스가 비정상 종료되면 버퍼의 증감은 사라질 수 있으며,
+    `flask recount-post-counters`로 post_likes / comments 기준 값을 다시 계산할 수 있습니다.
+    """
+
+    FIELDS = ("like_count", "comment_count")
+
+    def __init__(self):
+        self.flush_interval = 2
+        self.batch_size = 500
+        self._lock = threading.Lock()
+        self._pending = {}   # post_id -> {field: delta}
+        self._inflight = {}  # flush 중인 증감 (반영 완료 전까지 조회에 포함)
+        self._app = None
+        self._pid = None     # flush 스레드를 시작한 프로세스 (fork된 워커에서는 다시 시작)
+
+    def init_app(self, app):
+        self.flush_interval = app.config['POST_COUNTER_FLUSH_INTERVAL']
+        self.batch_size = app.config['POST_COUNTER_FLUSH_BATCH']
+        self._app = app
+        with self._lock:
+            self._pending.clear()
+        app.extensions['post_counters'] = self
+
+    def _ensure_thread(self):
+        """워커 프로세스마다 첫 증감 때 flush 스레드 시작 (preload 후 fork된 워커 포함)"""
+        pid = os.getpid()
+        if self._pid == pid or self.flush_interval <= 0 or self._app is None:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+        threading.Thread(target=self._run, args=(self._app,), name="post-counter-flush", daemon=True).start()
+        atexit.register(self._flush_at_exit, self._app)
+
+    def add(self, post_id, field, delta):
+        self._ensure_thread()
+        with self._lock:
+            counts = self._pending.setdefault(post_id, {})
+            counts[field] = counts.get(field, 0) + delta
+
+    def pending(self, post_id):
+        with self._lock:
+            result = {}
+            for source in (self._inflight, self._pending):
+                for field, delta in source.get(post_id, {}).items():
+                    result[field] = result.get(field, 0) + delta
+            return result
+
+    def apply(self, post_id, data):
+        """직렬화된 글(dict)의 카운터에 미반영 증감을 더함"""
+        for field, delta in self.pending(post_id).items():
+            data[field] = (data.get(field) or 0) + delta
+        return data
+
+    def flush(self):
+        """버퍼를 비우고 글별 UPDATE를 executemany로 묶어 반영. 반영된 글 수 반환"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+
+        table = Posts.__table__
+        stmt = table.update()\
+                    .where(table.c.id == bindparam("pid"))\
+                    .values(like_count=table.c.like_count + bindparam("d_like"),
+                            comment_count=table.c.comment_count + bindparam("d_comment"),
+                            updated_at=table.c.updated_at)  # 카운터 변경은 수정 시각에 반영하지 않음
+        params = [{"pid": post_id,
+                   "d_like": counts.get("like_count", 0),
+                   "d_comment": counts.get("comment_count", 0)}
+                  for post_id, counts in batch.items()]
+        try:
+            with db.engine.begin() as conn:
+                for start in range(0, len(params), self.batch_size):
+                    conn.execute(stmt, params[start:start + self.batch_size])
+        except Exception:
+            # 실패한 증감은 다음 flush에서 다시 시도
+            with self._lock:
+                for post_id, counts in batch.items():
+                    target = self._pending.setdefault(post_id, {})
+                    for field, delta in counts.items():
+                        target[field] = target.get(field, 0) + delta
+            raise
+        finally:
+            with self._lock:
+                self._inflight = {}
+        return len(params)
+
+    def _run(self, app):
+        stop = threading.Event()
+        while not stop.wait(self.flush_interval):
+            with app.app_context():
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("post counter flush failed")
+
+    def _flush_at_exit(self, app):
+        with app.app_context():
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("post counter flush at exit failed")
+
+
+post_counters = PostCounterBuffer()
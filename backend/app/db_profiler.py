@@ -0,0 +1,148 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from flask import g, has_request_context, request, jsonify
+from sqlalchemy import event
+from .database import db
+from .auth_utils import require_role
+
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+_PARAM = r"(?:%s|\?|%\(\w+\)s|:\w+)"
+_IN_LIST_RE = re.compile(r"\(\s*" + _PARAM + r"(?:\s*,\s*" + _PARAM + r")+\s*\)")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+
+
+def statement_shape(sql):
+    """파라미터 값/IN 목록 길이/숫자 리터럴을 지운 SQL 형태 (같은 쿼리 반복 감지용)"""
+    shape = _WS_RE.sub(" ", sql).strip()
+    shape = _IN_LIST_RE.sub("(?+)", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    return shape[:500]
+
+
+class EndpointStats:
+    __slots__ = ("requests", "queries", "db_time", "max_queries", "n_plus_one", "shapes")
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.db_time = 0.0
+        self.max_queries = 0
+        self.n_plus_one = 0
+        self.shapes = Counter()  # N+1로 판정된 쿼리 형태별 발생 횟수
+
+    def as_dict(self, top):
+        return {
+            "requests": self.requests,
+            "avg_queries": self.queries / self.requests if self.requests else 0.0,
+            "max_queries": self.max_queries,
+            "avg_db_ms": self.db_time * 1000 / self.requests if self.requests else 0.0,
+            "n_plus_one_requests": self.n_plus_one,
+            "n_plus_one_shapes": [{"shape": shape, "requests": n}
+                                  for shape, n in self.shapes.most_common(top)],
+        }
+
+
+class DBProfiler:
+    """요청별 DB 쿼리 수 / DB 시간 / 반복 쿼리 형태를 기록하는 엔진 계측
+
+    - 같은 형태의 쿼리가 한 요청에서 DB_PROFILER_N_PLUS_ONE_THRESHOLD번 이상 실행되면 N+1로 표시
+    - 디버그 모드(또는 DB_PROFILER_HEADERS)에서는 X-DB-* 응답 헤더로 바로 확인 가능
+    - 엔드포인트별 누적 통계는 GET /api/db-profiler/stats (운영자 전용)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = 5
+        self.emit_headers = False
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def init_app(self, app):
+        self.enabled = app.config['DB_PROFILER_ENABLED']
+        self.threshold = app.config['DB_PROFILER_N_PLUS_ONE_THRESHOLD']
+        self.emit_headers = app.debug or app.config['DB_PROFILER_HEADERS']
+        app.extensions['db_profiler'] = self
+        if not self.enabled:
+            return
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        app.after_request(self._after_request)
+        app.add_url_rule("/api/db-profiler/stats", "db_profiler_stats",
+                         require_role("admin")(self._stats_view))
+
+    # --- 엔진 이벤트 ---
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("db_profiler_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["db_profiler_start"].pop()
+        if not has_request_context():
+            return
+        profile = g.get("db_profile")
+        if profile is None:
+            profile = g.db_profile = {"count": 0, "time": 0.0, "shapes": Counter()}
+        profile["count"] += 1
+        profile["time"] += time.perf_counter() - started
+        profile["shapes"][statement_shape(statement)] += 1
+
+    def _handle_error(self, context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 before에서 넣은 시작 시각을 여기서 버림
+        conn = context.connection
+        if conn is not None and context.cursor is not None:
+            starts = conn.info.get("db_profiler_start")
+            if starts:
+                starts.pop()
+
+    # --- 요청 종료 시 집계 ---
+
+    def _after_request(self, response):
+        profile = g.get("db_profile")
+        count = profile["count"] if profile else 0
+        db_time = profile["time"] if profile else 0.0
+        repeated = [shape for shape, n in profile["shapes"].items() if n >= self.threshold] \
+            if profile else []
+
+        endpoint = request.endpoint or "<unmatched>"
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats()
+            stats.requests += 1
+            stats.queries += count
+            stats.db_time += db_time
+            stats.max_queries = max(stats.max_queries, count)
+            if repeated:
+                stats.n_plus_one += 1
+                stats.shapes.update(repeated)
+
+        if repeated:
+            logger.warning("possible N+1 in %s: %s", endpoint, repeated)
+        if self.emit_headers:
+            response.headers["X-DB-Query-Count"] = str(count)
+            response.headers["X-DB-Time-ms"] = f"{db_time * 1000:.2f}"
+            response.headers["X-DB-N-Plus-One"] = str(len(repeated))
+        return response
+
+    def stats(self, top=5):
+        with self._lock:
+            return {endpoint: s.as_dict(top) for endpoint, s in sorted(self._endpoints.items())}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def _stats_view(self):
+        return jsonify(self.stats()), 200
+
+
+db_profiler = DBProfiler()
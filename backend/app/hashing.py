@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt
+
+
+class HashPoolSaturated(Exception):
+    """해싱 풀의 실행 중 + 대기 작업이 한도를 넘었거나 HASH_POOL_TIMEOUT 안에 끝나지 않았을 때 발생 (503 응답용)"""
+
+
+class PasswordHasher:
+    """bcrypt 해싱 전용 스레드 풀
+
+    bcrypt는 해싱 중 GIL을 놓기 때문에 별도 스레드에서 돌려도 병렬로 실행됩니다.
+    동시에 실행되는 해싱은 workers개로 제한하고, 대기 큐가 queue_size를 넘으면
+    기다리지 않고 HashPoolSaturated를 던집니다. 로그인 폭주가 와도 요청 워커가
+    전부 bcrypt에 묶이지 않으므로 다른 라우트는 계속 응답할 수 있습니다.
+
+    요청 스레드는 결과를 기다리므로 이 제한은 한 프로세스가 요청을 여러 스레드로 동시에 처리할 때
+    (gunicorn gthread --threads N 등)만 의미가 있습니다. 프로세스당 요청 1개인 sync 워커에서는
+    대기열이 찰 수 없고 스레드 전환 비용만 늘어나므로 workers=0(기본값)으로 요청 스레드에서 바로 해싱합니다.
+    스레드 워커에서는 workers를 CPU 코어 수 정도로, queue_size를 요청 스레드 수 정도로 두세요.
+    """
+
+    def __init__(self, rounds=12, workers=0, queue_size=16, timeout=10):
+        self.rounds = rounds
+        self.timeout = timeout
+        self._configure(workers, queue_size)
+
+    def init_app(self, app):
+        self.rounds = app.config['BCRYPT_ROUNDS']
+        self.timeout = app.config['HASH_POOL_TIMEOUT']
+        self._configure(app.config['HASH_POOL_WORKERS'], app.config['HASH_POOL_QUEUE_SIZE'])
+        app.extensions['password_hasher'] = self
+
+    def _configure(self, workers, queue_size):
+        old = getattr(self, "_executor", None)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt") \
+            if workers > 0 else None
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HashPoolSaturated()
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업이면 취소해 풀 자리를 돌려줌 (실행 중이면 끝난 뒤 반환됨)
+            future.cancel()
+            raise HashPoolSaturated()
+
+    def hash_password(self, password):
+        """평문 비밀번호를 현재 BCRYPT_ROUNDS로 해싱한 문자열 반환"""
+        return self._run(self._hash, password, self.rounds)
+
+    def check_password(self, password, password_hash):
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8'))
+
+    def needs_rehash(self, password_hash):
+        """저장된 해시의 cost가 현재 설정과 다르면 True ($2b$12$... 형식)"""
+        try:
+            return int(password_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    @staticmethod
+    def _hash(password, rounds):
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,212 @@
+import heapq
+import threading
+import time
+from collections import namedtuple
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from .database import db
+from .models import Users, Departments, HelperProfiles, HelperLanguages, Matches
+from .version_stamp import VersionStamp
+
+HelperEntry = namedtuple("HelperEntry", [
+    "id", "nickname", "gender", "school_id", "college_id", "languages", "profile_created_at",
+])
+
+
+class HelperIndex:
+    """도우미 후보 검색용 인메모리 색인
+
+    언어/성별/단과대학별로 도우미 id 집합을 유지하고, 후보 검색은 집합 교집합 후
+    (언어 일치, 같은 학교, 진행 중인 매칭 수, 프로필 최신순)으로 정렬합니다.
+
+    HelperProfiles / HelperLanguages / Users / Matches 변경은 커밋 시점에 해당 도우미를
+    dirty로 표시하고, 다음 검색 때 그 도우미만 다시 읽어 반영합니다.
+    다른 워커 프로세스의 변경은 HELPER_INDEX_MAX_AGE 주기의 전체 재빌드나
+    `flask rebuild-helper-index`(버전 파일 갱신)로 반영됩니다.
+    """
+
+    def __init__(self):
+        self.max_age = 600
+        self.stamp = VersionStamp()
+        self._lock = threading.Lock()
+        self._built_at = None
+        self._dirty = set()
+        self._reset()
+
+    def init_app(self, app):
+        self.max_age = app.config['HELPER_INDEX_MAX_AGE']
+        self.stamp = VersionStamp(app.config['HELPER_INDEX_VERSION_FILE'])
+        with self._lock:
+            self._built_at = None
+            self._dirty.clear()
+            self._reset()
+        app.extensions['helper_index'] = self
+
+    def _reset(self):
+        self.helpers = {}
+        self.by_language = {}
+        self.by_gender = {}
+        self.by_college = {}
+        self.active_load = {}
+
+    # --- 빌드 / 갱신 ---
+
+    def rebuild(self):
+        """DB에서 전체 색인을 다시 만든다 (쿼리 3회)"""
+        stamp = self.stamp.current()
+        rows = db.session.query(Users.id, Users.nickname, Users.gender, Users.school_id,
+                                Departments.college_id, HelperProfiles.created_at)\
+                         .join(HelperProfiles, HelperProfiles.user_id == Users.id)\
+                         .outerjoin(Departments, Users.department_id == Departments.id)\
+                         .filter(Users.is_helper == True)\
+                         .all()
+        languages = {}
+        for user_id, code in db.session.query(HelperLanguages.user_id,
+                                              HelperLanguages.language_code).all():
+            languages.setdefault(user_id, set()).add(code)
+        loads = dict(db.session.query(Matches.mentor_user_id, func.count(Matches.id))
+                               .filter(Matches.status == 'active')
+                               .group_by(Matches.mentor_user_id)
+                               .all())
+
+        with self._lock:
+            self._reset()
+            for user_id, nickname, gender, school_id, college_id, created_at in rows:
+                self._add(HelperEntry(user_id, nickname, gender, school_id, college_id,
+                                      frozenset(languages.get(user_id, ())), created_at))
+            self.active_load = {uid: n for uid, n in loads.items() if uid in self.helpers}
+            self._dirty.clear()
+            self._built_at = time.monotonic()
+            self.stamp.mark_seen(stamp)
+        return len(self.helpers)
+
+    def refresh_helper(self, user_id):
+        """도우미 한 명의 항목만 DB에서 다시 읽어 반영"""
+        row = db.session.query(Users.id, Users.nickname, Users.gender, Users.school_id,
+                               Departments.college_id, HelperProfiles.created_at)\
+                        .join(HelperProfiles, HelperProfiles.user_id == Users.id)\
+                        .outerjoin(Departments, Users.department_id == Departments.id)\
+                        .filter(Users.id == user_id, Users.is_helper == True)\
+                        .first()
+        entry = load = None
+        if row:
+            codes = frozenset(code for (code,) in db.session.query(HelperLanguages.language_code)
+                                                            .filter_by(user_id=user_id).all())
+            entry = HelperEntry(*row[:5], codes, row[5])
+            load = Matches.query.filter_by(mentor_user_id=user_id, status='active').count()
+
+        with self._lock:
+            self._remove(user_id)
+            if entry is not None:
+                self._add(entry)
+                self.active_load[user_id] = load
+
+    def mark_dirty(self, user_ids):
+        with self._lock:
+            self._dirty.update(user_ids)
+
+    def _add(self, entry):
+        self.helpers[entry.id] = entry
+        for code in entry.languages:
+            self.by_language.setdefault(code, set()).add(entry.id)
+        self.by_gender.setdefault(entry.gender, set()).add(entry.id)
+        self.by_college.setdefault(entry.college_id, set()).add(entry.id)
+
+    def _remove(self, user_id):
+        entry = self.helpers.pop(user_id, None)
+        self.active_load.pop(user_id, None)
+        if entry is None:
+            return
+        for code in entry.languages:
+            self.by_language.get(code, set()).discard(user_id)
+        self.by_gender.get(entry.gender, set()).discard(user_id)
+        self.by_college.get(entry.college_id, set()).discard(user_id)
+
+    def ensure_fresh(self):
+        """필요하면 전체 재빌드, 아니면 dirty 도우미만 갱신"""
+        stale = (self._built_at is None
+                 or time.monotonic() - self._built_at > self.max_age
+                 or self.stamp.changed())
+        if stale:
+            self.rebuild()
+            return
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        for user_id in dirty:
+            self.refresh_helper(user_id)
+
+    # --- 검색 ---
+
+    def candidates(self, language=None, gender=None, college_id=None, school_id=None, limit=10):
+        """조건을 만족하는 도우미를 순위대로 최대 limit명 반환 (HelperEntry 리스트)"""
+        self.ensure_fresh()
+        with self._lock:
+            filters = []
+            if language:
+                filters.append(self.by_language.get(language, set()))
+            if gender and gender != "any":
+                filters.append(self.by_gender.get(gender, set()))
+            if college_id:
+                filters.append(self.by_college.get(college_id, set()))
+
+            if filters:
+                filters.sort(key=len)
+                ids = filters[0].intersection(*filters[1:])
+            else:
+                ids = self.helpers.keys()
+
+            def rank(user_id):
+                h = self.helpers[user_id]
+                created = h.profile_created_at.timestamp() if h.profile_created_at else 0
+                return (0 if language in h.languages else 1,
+                        0 if school_id is not None and h.school_id == school_id else 1,
+                        self.active_load.get(user_id, 0),
+                        -created,
+                        user_id)
+
+            return [self.helpers[i] for i in heapq.nsmallest(limit, ids, key=rank)]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "helpers": len(self.helpers),
+                "languages": len(self.by_language),
+                "dirty": len(self._dirty),
+                "age_seconds": (time.monotonic() - self._built_at) if self._built_at else None,
+            }
+
+
+helper_index = HelperIndex()
+
+
+# --- 변경 감지: flush 때 영향받는 도우미를 모아 두었다가 commit 시 dirty로 표시 ---
+
+def _affected_helper_id(obj):
+    if isinstance(obj, Users):
+        return obj.id
+    if isinstance(obj, (HelperProfiles, HelperLanguages)):
+        return obj.user_id
+    if isinstance(obj, Matches):
+        return obj.mentor_user_id
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_helper_changes(session, flush_context):
+    pending = session.info.setdefault("helper_index_dirty", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        user_id = _affected_helper_id(obj)
+        if user_id is not None:
+            pending.add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_helper_changes(session):
+    pending = session.info.pop("helper_index_dirty", None)
+    if pending:
+        helper_index.mark_dirty(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_helper_changes(session):
+    session.info.pop("helper_index_dirty", None)
@@ -0,0 +1,175 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from sqlalchemy import and_, func, or_
+from .database import db
+from .models import Boards, Communities, Posts
+from .response_cache import board_page_cache
+from .serializers import post_list_query, serialize_post_row
+
+
+class BoardRing:
+    """게시판 하나의 최신 글 키 (created_at, id) 목록. 오래된 순으로 정렬, 최대 capacity개"""
+
+    __slots__ = ("keys", "complete", "version", "loaded_at")
+
+    def __init__(self, keys, capacity, version):
+        self.keys = keys
+        self.complete = len(keys) < capacity  # True면 게시판의 글 전체를 담고 있음
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+    def newer_than_cursor(self, cursor):
+        """cursor보다 오래된 키를 최신순으로 (cursor가 None이면 전부)"""
+        end = len(self.keys) if cursor is None else bisect_left(self.keys, cursor)
+        keys = self.keys
+        return (keys[i] for i in range(end - 1, -1, -1))
+
+
+class HomeFeed:
+    """사용자의 커뮤니티(같은 학교 + 같은 국적)에 속한 모든 게시판 글을 최신순으로 합친 피드
+
+    게시판마다 최근 글 키를 메모리 링(HOME_FEED_RING_SIZE개)으로 들고 있고, 요청 시 heapq.merge로
+    k-way 병합해 한 페이지(limit + 1개)만 꺼냅니다. 본문은 페이지에 든 글만 IN 조회 한 번으로 읽습니다.
+    create_post는 record_post로 링을 바로 갱신합니다. board_page_cache의 게시판 버전이 링과 다르거나
+    HOME_FEED_RING_MAX_AGE가 지난 링은 다음 요청 때 다시 읽습니다. 다른 워커에서 쓴 글은 공유 버전 저장소
+    (BOARD_CACHE_BACKEND="file", 기본값)일 때만 버전 변화로 보이고, "local"이면 최대 MAX_AGE 동안 늦게 보입니다.
+    커서가 링보다 깊이 내려가면 그 페이지만 DB keyset 조회로 처리합니다.
+    """
+
+    def __init__(self):
+        self.capacity = 100
+        self.max_age = 300
+        self._lock = threading.Lock()
+        self._rings = {}
+        self.memory_pages = 0
+        self.db_pages = 0
+
+    def init_app(self, app):
+        self.capacity = app.config['HOME_FEED_RING_SIZE']
+        self.max_age = app.config['HOME_FEED_RING_MAX_AGE']
+        with self._lock:
+            self._rings.clear()
+            self.memory_pages = self.db_pages = 0
+        app.extensions['home_feed'] = self
+
+    # --- 링 관리 ---
+
+    def _load_rings(self, board_ids):
+        """여러 게시판의 최신 capacity개 키를 ROW_NUMBER() 윈도 함수 쿼리 한 번으로 읽음"""
+        versions = {board_id: board_page_cache.versions.get(board_id)[0] for board_id in board_ids}
+        rank = func.row_number().over(partition_by=Posts.board_id,
+                                      order_by=(Posts.created_at.desc(), Posts.id.desc())).label("rank")
+        ranked = db.session.query(Posts.board_id, Posts.created_at, Posts.id, rank)\
+                           .filter(Posts.board_id.in_(board_ids))\
+                           .subquery()
+        rows = db.session.query(ranked.c.board_id, ranked.c.created_at, ranked.c.id)\
+                         .filter(ranked.c.rank <= self.capacity)\
+                         .all()
+        keys = {board_id: [] for board_id in board_ids}
+        for board_id, created_at, post_id in rows:
+            keys[board_id].append((created_at, post_id))
+        rings = {}
+        for board_id, board_keys in keys.items():
+            board_keys.sort()
+            rings[board_id] = BoardRing(board_keys, self.capacity, versions[board_id])
+        with self._lock:
+            self._rings.update(rings)
+        return rings
+
+    def rings_for(self, board_ids):
+        now = time.monotonic()
+        rings, stale = {}, []
+        with self._lock:
+            for board_id in board_ids:
+                ring = self._rings.get(board_id)
+                if ring is None or now - ring.loaded_at > self.max_age:
+                    stale.append(board_id)
+                else:
+                    rings[board_id] = ring
+        for board_id, ring in list(rings.items()):
+            if board_page_cache.versions.get(board_id)[0] != ring.version:
+                stale.append(board_id)
+                del rings[board_id]
+        if stale:
+            rings.update(self._load_rings(stale))
+        return rings
+
+    def record_post(self, board_id, created_at, post_id, version):
+        """새 글을 링에 반영 (create_post에서 board_page_cache.invalidate가 돌려준 새 버전과 함께 호출)
+
+        링이 이 글의 bump 바로 전 버전일 때만 새 버전을 링 버전으로 받아들입니다. 그 사이 다른 워커가
+        글을 써서 버전이 더 올라갔다면 그 글은 링에 없으므로 버전을 그대로 두어 다음 조회 때 다시 읽게 합니다.
+        """
+        with self._lock:
+            ring = self._rings.get(board_id)
+            if ring is None:
+                return
+            # 읽는 중인 요청이 있을 수 있으므로 목록을 복사해서 교체
+            keys = list(ring.keys)
+            insort(keys, (created_at, post_id))
+            if len(keys) > self.capacity:
+                del keys[0]
+                ring.complete = False
+            ring.keys = keys
+            if version == ring.version + 1:
+                ring.version = version
+
+    # --- 피드 ---
+
+    def board_ids_for(self, user):
+        rows = db.session.query(Boards.id)\
+                         .join(Communities, Communities.id == Boards.community_id)\
+                         .filter(Communities.school_id == user.school_id,
+                                 Communities.nationality_iso2 == user.nationality_iso2)\
+                         .all()
+        return [board_id for (board_id,) in rows]
+
+    def page(self, board_ids, limit, cursor=None):
+        """(직렬화된 글 목록, 다음 페이지 커서 키 또는 None)"""
+        if not board_ids:
+            return [], None
+        rings = self.rings_for(board_ids)
+        merged = heapq.merge(*(ring.newer_than_cursor(cursor) for ring in rings.values()), reverse=True)
+        keys = []
+        for key in merged:
+            keys.append(key)
+            if len(keys) > limit:
+                break
+
+        # 링이 잘린(complete가 아닌) 게시판은 링의 가장 오래된 키까지만 믿을 수 있음
+        bottom = keys[-1] if len(keys) > limit else None
+        covered = all(ring.complete or (bottom is not None and ring.keys and ring.keys[0] <= bottom)
+                      for ring in rings.values())
+        if covered:
+            with self._lock:
+                self.memory_pages += 1
+            has_more = len(keys) > limit
+            keys = keys[:limit]
+            rows = {row[0]: row for row in
+                    post_list_query().filter(Posts.id.in_([post_id for _, post_id in keys])).all()} \
+                if keys else {}
+            posts = [serialize_post_row(rows[post_id]) for _, post_id in keys if post_id in rows]
+        else:
+            with self._lock:
+                self.db_pages += 1
+            q = post_list_query().filter(Posts.board_id.in_(board_ids))
+            if cursor is not None:
+                q = q.filter(or_(Posts.created_at < cursor[0],
+                                 and_(Posts.created_at == cursor[0], Posts.id < cursor[1])))
+            rows = q.order_by(Posts.created_at.desc(), Posts.id.desc()).limit(limit + 1).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            keys = [(row.created_at, row.id) for row in rows]
+            posts = [serialize_post_row(row) for row in rows]
+
+        return posts, (keys[-1] if has_more and keys else None)
+
+    def stats(self):
+        with self._lock:
+            return {"rings": len(self._rings), "ring_size": self.capacity,
+                    "memory_pages": self.memory_pages, "db_pages": self.db_pages}
+
+
+home_feed = HomeFeed()
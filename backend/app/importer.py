@@ -0,0 +1,367 @@
+import csv
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import bcrypt
+from sqlalchemy import select
+from .database import db
+from .models import Language, Country, Schools, Colleges, Departments, Communities, Boards, Users, \
+    HelperProfiles, HelperLanguages
+
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+
+
+class RecordError(ValueError):
+    """한 레코드를 가져올 수 없음 (해당 줄만 rejects 파일로 보내고 계속 진행)"""
+
+
+def iter_records(path, fmt=None):
+    """CSV / NDJSON 파일을 (레코드 번호, dict)로 한 줄씩 읽음 (파일 전체를 메모리에 올리지 않음)"""
+    fmt = fmt or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            for number, record in enumerate(csv.DictReader(f), 1):
+                yield number, record
+        else:
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield number, RecordError(f"invalid JSON: {e}")
+
+
+def _text(record, field, required=True):
+    value = record.get(field)
+    if isinstance(value, str):
+        value = value.strip()
+    if value in (None, ""):
+        if required:
+            raise RecordError(f"missing field: {field}")
+        return None
+    return str(value)
+
+
+def _int(record, field, required=True):
+    value = _text(record, field, required)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise RecordError(f"{field} must be an integer")
+
+
+def _bool(record, field):
+    value = record.get(field)
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+
+class ReferenceMaps:
+    """외래키 해석용 이름 -> id 맵 (학교/단과대학/학과/커뮤니티/게시판 + 언어/국가 코드)
+
+    레코드는 `school_id`처럼 id를 직접 주거나 `school`처럼 이름으로 참조할 수 있습니다.
+    기관 데이터는 사용자 수에 비해 작으므로 시작 시 한 번 전부 읽어 둡니다.
+    """
+
+    def __init__(self):
+        self.languages = {code for (code,) in db.session.query(Language.code)}
+        self.countries = {iso2 for (iso2,) in db.session.query(Country.iso2)}
+        self.schools = {name: sid for sid, name in db.session.query(Schools.id, Schools.school_name)}
+        self.school_ids = set(self.schools.values())
+        self.colleges = {(sid, name): cid for cid, sid, name in
+                         db.session.query(Colleges.id, Colleges.school_id, Colleges.college_name)}
+        self.college_school = {cid: sid for (sid, _), cid in self.colleges.items()}
+        self.departments = {(sid, name): did for did, sid, name in
+                            db.session.query(Departments.id, Departments.school_id,
+                                             Departments.department_name)}
+        self.department_school = {did: sid for (sid, _), did in self.departments.items()}
+        self.communities = {(sid, name): cid for cid, sid, name in
+                            db.session.query(Communities.id, Communities.school_id,
+                                             Communities.community_name)}
+        self.community_ids = set(self.communities.values())
+
+    def school(self, record):
+        school_id = _int(record, "school_id", required=False)
+        if school_id is not None:
+            if school_id not in self.school_ids:
+                raise RecordError(f"unknown school_id: {school_id}")
+            return school_id
+        name = _text(record, "school")
+        if name not in self.schools:
+            raise RecordError(f"unknown school: {name}")
+        return self.schools[name]
+
+    def college(self, record, school_id):
+        college_id = _int(record, "college_id", required=False)
+        if college_id is None:
+            college_id = self.colleges.get((school_id, _text(record, "college")))
+        if self.college_school.get(college_id) != school_id:
+            raise RecordError("unknown college for this school")
+        return college_id
+
+    def department(self, record, school_id):
+        department_id = _int(record, "department_id", required=False)
+        if department_id is None:
+            department_id = self.departments.get((school_id, _text(record, "department")))
+        if self.department_school.get(department_id) != school_id:
+            raise RecordError("unknown department for this school")
+        return department_id
+
+    def community(self, record, school_id):
+        community_id = _int(record, "community_id", required=False)
+        if community_id is None:
+            community_id = self.communities.get((school_id, _text(record, "community")))
+        if community_id not in self.community_ids:
+            raise RecordError("unknown community for this school")
+        return community_id
+
+    def language(self, code):
+        if code not in self.languages:
+            raise RecordError(f"unknown language: {code}")
+        return code
+
+    def country(self, iso2):
+        iso2 = iso2.upper()
+        if iso2 not in self.countries:
+            raise RecordError(f"unknown country: {iso2}")
+        return iso2
+
+
+# --- 엔터티별 레코드 -> 행 변환 ---
+
+def _school_row(record, refs):
+    return {"school_name": _text(record, "school_name"),
+            "website_url": _text(record, "website_url", required=False)}
+
+
+def _college_row(record, refs):
+    return {"school_id": refs.school(record), "college_name": _text(record, "college_name")}
+
+
+def _department_row(record, refs):
+    school_id = refs.school(record)
+    return {"school_id": school_id, "college_id": refs.college(record, school_id),
+            "department_name": _text(record, "department_name")}
+
+
+def _community_row(record, refs):
+    return {"school_id": refs.school(record), "community_name": _text(record, "community_name"),
+            "nationality_iso2": refs.country(_text(record, "nationality_iso2"))}
+
+
+def _board_row(record, refs):
+    school_id = refs.school(record)
+    return {"community_id": refs.community(record, school_id), "board_name": _text(record, "board_name"),
+            "description": _text(record, "description", required=False),
+            "order_index": _int(record, "order_index", required=False) or 0}
+
+
+def _user_row(record, refs):
+    school_id = refs.school(record)
+    gender = _text(record, "gender")
+    if gender not in ("male", "female"):
+        raise RecordError("gender must be 'male' or 'female'")
+    password = _text(record, "password", required=False)
+    password_hash = _text(record, "password_hash", required=False)
+    if not password and not password_hash:
+        raise RecordError("password or password_hash required")
+    helper_languages = _text(record, "helper_languages", required=False)
+    return {
+        "email": _text(record, "email").lower(),
+        "password_hash": password_hash,
+        "nickname": _text(record, "nickname"),
+        "realname": _text(record, "realname"),
+        "gender": gender,
+        "main_language": refs.language(_text(record, "main_language")),
+        "nationality_iso2": refs.country(_text(record, "nationality_iso2")),
+        "school_id": school_id,
+        "department_id": refs.department(record, school_id),
+        "enrollment_year": _int(record, "enrollment_year"),
+        "is_helper": _bool(record, "is_helper"),
+        # 아래 키는 users 테이블에 쓰지 않음 (해싱 / 도우미 프로필용)
+        "_password": None if password_hash else password,
+        "_intro": _text(record, "intro", required=False),
+        "_helper_languages": [refs.language(code.strip()) for code in helper_languages.replace(";", ",").split(",")
+                              if code.strip()] if helper_languages else [],
+    }
+
+
+ImportSpec = namedtuple("ImportSpec", ["model", "key", "build_row"])
+
+# 자연키(key)가 이미 DB에 있는 레코드는 건너뛰므로 같은 파일을 다시 돌려도 중복이 생기지 않음
+IMPORT_SPECS = {
+    "schools": ImportSpec(Schools, ("school_name",), _school_row),
+    "colleges": ImportSpec(Colleges, ("school_id", "college_name"), _college_row),
+    "departments": ImportSpec(Departments, ("school_id", "department_name"), _department_row),
+    "communities": ImportSpec(Communities, ("school_id", "community_name"), _community_row),
+    "boards": ImportSpec(Boards, ("community_id", "board_name"), _board_row),
+    "users": ImportSpec(Users, ("email",), _user_row),
+}
+
+
+def _hash_password(password, rounds):
+    # ProcessPoolExecutor로 넘기므로 모듈 수준 함수여야 함
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+class ImportCheckpoint:
+    """처리 완료된 레코드 수를 `<원본>.import-state.json`에 기록 (chunk 커밋 직후 갱신)
+
+    원본 파일의 크기/수정 시각이 바뀌면 이어서 하지 않고 처음부터 다시 시작합니다.
+    """
+
+    def __init__(self, source, entity):
+        self.path = source + ".import-state.json"
+        stat = os.stat(source)
+        self.identity = {"entity": entity, "size": stat.st_size, "mtime": int(stat.st_mtime)}
+        self.state = {"done": 0, "inserted": 0, "skipped": 0, "rejected": 0}
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if saved.get("identity") != self.identity:
+            return False
+        self.state.update(saved.get("state", {}))
+        return True
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"identity": self.identity, "state": self.state}, f)
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class BulkImporter:
+    """CSV / NDJSON 스트리밍 가져오기
+
+    - chunk_size개씩 읽어 외래키를 메모리 맵으로 해석하고, 자연키 기준으로 기존 행을 걸러낸 뒤
+      다중 INSERT(executemany) 1회 + commit 1회로 저장
+    - chunk 커밋마다 체크포인트를 남겨 실패 후 다시 실행하면 이어서 진행
+    - users의 평문 비밀번호는 프로세스 풀에서 병렬로 bcrypt 해싱
+    - 잘못된 레코드는 `<원본>.rejects.ndjson`에 사유와 함께 기록하고 건너뜀
+    """
+
+    def __init__(self, entity, source, fmt=None, chunk_size=1000, hash_workers=None,
+                 bcrypt_rounds=12, resume=True):
+        self.spec = IMPORT_SPECS[entity]
+        self.entity = entity
+        self.source = source
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.hash_workers = hash_workers or os.cpu_count() or 1
+        self.bcrypt_rounds = bcrypt_rounds
+        self.checkpoint = ImportCheckpoint(source, entity)
+        self.resumed = resume and self.checkpoint.load()
+        self.rejects_path = source + ".rejects.ndjson"
+
+    def run(self, progress=None):
+        refs = ReferenceMaps()
+        skip = self.checkpoint.state["done"] if self.resumed else 0
+        rejects = open(self.rejects_path, "a" if self.resumed else "w", encoding="utf-8")
+        pool = ProcessPoolExecutor(self.hash_workers) if self.entity == "users" else None
+        try:
+            chunk = []
+            for number, record in iter_records(self.source, self.fmt):
+                if number <= skip:
+                    continue
+                chunk.append((number, record))
+                if len(chunk) >= self.chunk_size:
+                    self._process(chunk, refs, rejects, pool)
+                    chunk = []
+                    if progress:
+                        progress(self.checkpoint.state)
+            if chunk:
+                self._process(chunk, refs, rejects, pool)
+                if progress:
+                    progress(self.checkpoint.state)
+        finally:
+            rejects.close()
+            if pool is not None:
+                pool.shutdown()
+        result = dict(self.checkpoint.state)
+        self.checkpoint.clear()
+        return result
+
+    def _process(self, chunk, refs, rejects, pool):
+        rows = {}
+        rejected = 0
+        for number, record in chunk:
+            try:
+                if isinstance(record, RecordError):
+                    raise record
+                row = self.spec.build_row(record, refs)
+            except RecordError as e:
+                rejects.write(json.dumps({"record": number, "error": str(e)}, ensure_ascii=False) + "\n")
+                rejected += 1
+                continue
+            rows.setdefault(tuple(row[k] for k in self.spec.key), row) # 파일 안 중복은 첫 줄만
+
+        existing = self._existing_keys(rows)
+        new_rows = [row for key, row in rows.items() if key not in existing]
+        if new_rows:
+            if pool is not None:
+                self._hash_passwords(new_rows, pool)
+            self._insert(new_rows)
+        db.session.commit()
+        rejects.flush()
+
+        state = self.checkpoint.state
+        state["done"] = chunk[-1][0]
+        state["inserted"] += len(new_rows)
+        state["skipped"] += len(chunk) - rejected - len(new_rows)
+        state["rejected"] += rejected
+        self.checkpoint.save()
+
+    def _existing_keys(self, rows):
+        """chunk 안 자연키 중 이미 DB에 있는 것 (열별 IN으로 넓게 조회 후 튜플로 거름)"""
+        if not rows:
+            return set()
+        table = self.spec.model.__table__
+        columns = [table.c[k] for k in self.spec.key]
+        stmt = select(*columns)
+        for i, column in enumerate(columns):
+            stmt = stmt.where(column.in_({key[i] for key in rows}))
+        return {tuple(r) for r in db.session.execute(stmt)} & set(rows)
+
+    def _hash_passwords(self, rows, pool):
+        todo = [row for row in rows if row["_password"]]
+        hashes = pool.map(_hash_password, [row["_password"] for row in todo],
+                          [self.bcrypt_rounds] * len(todo),
+                          chunksize=max(1, len(todo) // (self.hash_workers * 4)))
+        for row, password_hash in zip(todo, hashes):
+            row["password_hash"] = password_hash
+
+    def _insert(self, rows):
+        table = self.spec.model.__table__
+        db.session.execute(table.insert(), [{k: v for k, v in row.items() if not k.startswith("_")}
+                                            for row in rows])
+        if self.entity == "users":
+            self._insert_helper_profiles([row for row in rows if row["is_helper"]])
+
+    def _insert_helper_profiles(self, rows):
+        if not rows:
+            return
+        ids = dict(db.session.query(Users.email, Users.id)
+                             .filter(Users.email.in_([row["email"] for row in rows])))
+        db.session.execute(HelperProfiles.__table__.insert(),
+                           [{"user_id": ids[row["email"]], "intro": row["_intro"]} for row in rows])
+        languages = [{"user_id": ids[row["email"]], "language_code": code}
+                     for row in rows for code in dict.fromkeys(row["_helper_languages"])]
+        if languages:
+            db.session.execute(HelperLanguages.__table__.insert(), languages)
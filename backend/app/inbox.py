@@ -0,0 +1,161 @@
+from datetime import datetime
+from sqlalchemy import and_, bindparam, func, or_, select
+from sqlalchemy.orm import aliased
+from .database import db
+from .models import Users, Conversations, ConversationParticipants, Messages
+from .message_archive import message_archive
+
+PREVIEW_LENGTH = 100
+
+
+def record_new_message(conv_id, message_id, sender_user_id):
+    """새 메시지를 대화방 요약에 반영 (메시지 INSERT와 같은 트랜잭션에서 호출)
+
+    - conversations.last_message_id 를 더 큰 id로만 갱신 (동시 전송에도 역행하지 않음)
+    - 보낸 사람을 제외한 참여자의 unread_count + 1
+    """
+    conversations = Conversations.__table__
+    participants = ConversationParticipants.__table__
+    db.session.execute(
+        conversations.update()
+        .where(conversations.c.id == conv_id,
+               or_(conversations.c.last_message_id.is_(None),
+                   conversations.c.last_message_id < message_id))
+        .values(last_message_id=message_id)
+    )
+    db.session.execute(
+        participants.update()
+        .where(participants.c.conversation_id == conv_id,
+               participants.c.user_id != sender_user_id)
+        .values(unread_count=participants.c.unread_count + 1)
+    )
+
+
+def record_new_messages(conn, messages):
+    """record_new_message의 일괄 버전 (group commit 배치용, 같은 커넥션/트랜잭션에서 실행)
+
+    messages: (conversation_id, message_id, sender_user_id) 목록
+    대화방별 마지막 id와 (대화방, 보낸 사람)별 메시지 수로 묶어 executemany 두 번으로 처리합니다.
+    """
+    conversations = Conversations.__table__
+    participants = ConversationParticipants.__table__
+    last_ids, per_sender = {}, {}
+    for conv_id, message_id, sender_user_id in messages:
+        last_ids[conv_id] = max(last_ids.get(conv_id, 0), message_id)
+        per_sender[(conv_id, sender_user_id)] = per_sender.get((conv_id, sender_user_id), 0) + 1
+
+    conn.execute(
+        conversations.update()
+        .where(conversations.c.id == bindparam("cid"),
+               or_(conversations.c.last_message_id.is_(None),
+                   conversations.c.last_message_id < bindparam("mid")))
+        .values(last_message_id=bindparam("mid")),
+        [{"cid": conv_id, "mid": message_id} for conv_id, message_id in last_ids.items()]
+    )
+    conn.execute(
+        participants.update()
+        .where(participants.c.conversation_id == bindparam("cid"),
+               participants.c.user_id != bindparam("sender"))
+        .values(unread_count=participants.c.unread_count + bindparam("n")),
+        [{"cid": conv_id, "sender": sender, "n": n} for (conv_id, sender), n in per_sender.items()]
+    )
+
+
+def inbox_for(user_id):
+    """사용자의 대화방 목록 + 마지막 메시지 미리보기 + 안 읽은 수를 한 번의 쿼리로 조회"""
+    me = aliased(ConversationParticipants)
+    other = aliased(ConversationParticipants)
+    last_activity = func.coalesce(Messages.created_at, Conversations.created_at)
+
+    rows = db.session.query(
+                me.conversation_id, me.unread_count, me.last_read_at, Conversations.match_id,
+                Messages.id, Messages.sender_user_id,
+                func.substr(Messages.content, 1, PREVIEW_LENGTH), Messages.created_at,
+                other.user_id, Users.nickname, last_activity)\
+             .join(Conversations, Conversations.id == me.conversation_id)\
+             .outerjoin(Messages, Messages.id == Conversations.last_message_id)\
+             .outerjoin(other, and_(other.conversation_id == me.conversation_id,
+                                    other.user_id != me.user_id))\
+             .outerjoin(Users, Users.id == other.user_id)\
+             .filter(me.user_id == user_id)\
+             .order_by(last_activity.desc(), me.conversation_id.desc())\
+             .all()
+
+    inbox = []
+    for (conv_id, unread, last_read_at, match_id, msg_id, sender_id, preview, msg_created_at,
+         other_id, other_nickname, _) in rows:
+        inbox.append({
+            "conversation_id": conv_id,
+            "match_id": match_id,
+            "other_user": {"id": other_id, "nickname": other_nickname} if other_id else None,
+            "last_message": {
+                "id": msg_id,
+                "sender_user_id": sender_id,
+                "preview": preview,
+                "created_at": msg_created_at.isoformat(),
+            } if msg_id else None,
+            "unread_count": unread or 0,
+            "last_read_at": last_read_at.isoformat() if last_read_at else None,
+        })
+    return inbox
+
+
+def mark_read(participant, message_id=None):
+    """읽음 위치를 앞으로만 옮기는 조건부 UPDATE. 갱신된 participant 반환 (메시지가 없으면 None)
+
+    message_id를 주면 그 메시지까지, 생략하면 대화방의 마지막 메시지까지 읽은 것으로 봅니다.
+    last_read_at이 이미 더 뒤라면 아무것도 바꾸지 않으므로 늦게 도착한 이전 요청이 읽음 위치를 되돌리지 않습니다.
+    unread_count는 0으로 덮어쓰지 않고 같은 UPDATE 안에서 읽음 위치 뒤의 (남이 보낸) 메시지 수로 다시 세므로
+    동시에 들어온 새 메시지의 증가분도 사라지지 않습니다.
+    """
+    conv_id = participant.conversation_id
+    if message_id is None:
+        read_at = datetime.utcnow()
+        message_id = db.session.query(Conversations.last_message_id)\
+                               .filter(Conversations.id == conv_id).scalar() or 0
+    else:
+        msg = Messages.query.filter_by(id=message_id, conversation_id=conv_id).first()
+        if msg is None:
+            msg = message_archive.find(conv_id, message_id)
+        if msg is None:
+            return None
+        read_at = msg.created_at
+
+    participants = ConversationParticipants.__table__
+    messages = Messages.__table__
+    unread = select(func.count(messages.c.id))\
+        .where(messages.c.conversation_id == conv_id,
+               messages.c.id > message_id,
+               messages.c.sender_user_id != participant.user_id)\
+        .scalar_subquery()
+    db.session.execute(
+        participants.update()
+        .where(participants.c.id == participant.id,
+               or_(participants.c.last_read_at.is_(None),
+                   participants.c.last_read_at <= read_at))
+        .values(last_read_at=read_at, unread_count=unread)
+    )
+    db.session.refresh(participant)
+    return participant
+
+
+def rebuild_counters():
+    """last_read_at 기준으로 unread_count와 last_message_id를 전체 재계산 (마이그레이션/복구용)"""
+    conversations = Conversations.__table__
+    participants = ConversationParticipants.__table__
+    messages = Messages.__table__
+
+    last_id = select(func.max(messages.c.id))\
+        .where(messages.c.conversation_id == conversations.c.id)\
+        .scalar_subquery()
+    db.session.execute(conversations.update().values(last_message_id=last_id))
+
+    unread = select(func.count(messages.c.id))\
+        .where(messages.c.conversation_id == participants.c.conversation_id,
+               messages.c.sender_user_id != participants.c.user_id,
+               or_(participants.c.last_read_at.is_(None),
+                   messages.c.created_at > participants.c.last_read_at))\
+        .scalar_subquery()
+    result = db.session.execute(participants.update().values(unread_count=unread))
+    db.session.commit()
+    return result.rowcount
@@ -0,0 +1,196 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+from sqlalchemy import exists
+from .database import db
+from .models import Matches, Conversations, Messages, MessageArchiveSegments
+
+logger = logging.getLogger(__name__)
+
+# message_event가 Messages 객체와 똑같이 다룰 수 있는 읽기 전용 메시지
+ArchivedMessage = namedtuple("ArchivedMessage",
+                             ["id", "conversation_id", "sender_user_id", "content", "created_at"])
+
+ENDED_MATCH_STATUSES = ('completed', 'cancelled')
+
+
+class MessageArchive:
+    """종료된 매칭의 대화 메시지를 압축 세그먼트 파일(cold tier)로 옮기고 다시 읽어오는 저장소
+
+    - 세그먼트: <MESSAGE_ARCHIVE_DIR>/<대화방 id>/<첫 id>-<마지막 id>.ndjson.gz (한 번 쓰면 변경하지 않음)
+    - 색인: message_archive_segments 테이블 (대화방별 id 구간, 메시지 수, sha256)
+    - conversations.archived_until_id 보다 큰 id만 messages 테이블에 남음
+    받은편지함 미리보기가 계속 보이도록 대화방의 마지막 메시지 1개는 옮기지 않습니다.
+    세그먼트는 불변이므로 읽은 내용을 프로세스 메모리 LRU에 그대로 캐시합니다.
+    """
+
+    def __init__(self):
+        self.directory = "instance/message_archive"
+        self.min_age = timedelta(days=30)
+        self.segment_size = 5000
+        self.cache_size = 64
+        self._lock = threading.Lock()
+        self._segments = OrderedDict()  # path -> tuple[ArchivedMessage]
+        self.segment_reads = 0
+        self.cache_hits = 0
+
+    def init_app(self, app):
+        self.directory = app.config['MESSAGE_ARCHIVE_DIR']
+        self.min_age = timedelta(days=app.config['MESSAGE_ARCHIVE_MIN_AGE_DAYS'])
+        self.segment_size = app.config['MESSAGE_ARCHIVE_SEGMENT_SIZE']
+        self.cache_size = app.config['MESSAGE_ARCHIVE_CACHE_SIZE']
+        with self._lock:
+            self._segments.clear()
+            self.segment_reads = self.cache_hits = 0
+        app.extensions['message_archive'] = self
+
+    # --- 쓰기 ---
+
+    def _write_segment(self, conv_id, messages):
+        """세그먼트 파일을 임시 파일 -> fsync -> rename 으로 기록하고 (상대 경로, sha256) 반환"""
+        relpath = os.path.join(str(conv_id), f"{messages[0].id}-{messages[-1].id}.ndjson.gz")
+        path = os.path.join(self.directory, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        lines = "".join(json.dumps({"id": m.id, "sender_user_id": m.sender_user_id,
+                                    "content": m.content, "created_at": m.created_at.isoformat()},
+                                   ensure_ascii=False) + "\n" for m in messages)
+        data = gzip.compress(lines.encode("utf-8"), mtime=0)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return relpath, hashlib.sha256(data).hexdigest()
+
+    def archive_conversation(self, conv_id):
+        """대화방의 (마지막 메시지를 제외한) 메시지를 세그먼트로 옮김. 옮긴 메시지 수 반환
+
+        파일을 먼저 쓰고, 색인 INSERT / 메시지 DELETE / archived_until_id 갱신을 한 트랜잭션으로 커밋합니다.
+        커밋 전에 실패하면 메시지는 그대로 남고, 같은 이름의 파일은 다음 실행 때 다시 쓰입니다.
+        """
+        conv = db.session.query(Conversations.last_message_id, Conversations.archived_until_id)\
+                         .filter(Conversations.id == conv_id).first()
+        if conv is None or conv.last_message_id is None:
+            return 0
+        messages = Messages.query.filter(Messages.conversation_id == conv_id,
+                                         Messages.id < conv.last_message_id)\
+                                 .order_by(Messages.id.asc())\
+                                 .all()
+        if not messages:
+            return 0
+
+        segments = []
+        for start in range(0, len(messages), self.segment_size):
+            chunk = messages[start:start + self.segment_size]
+            relpath, digest = self._write_segment(conv_id, chunk)
+            segments.append({"conversation_id": conv_id, "first_message_id": chunk[0].id,
+                             "last_message_id": chunk[-1].id, "message_count": len(chunk),
+                             "path": relpath, "sha256": digest, "created_at": datetime.utcnow()})
+
+        archived_until = messages[-1].id
+        db.session.execute(MessageArchiveSegments.__table__.insert(), segments)
+        Messages.query.filter(Messages.conversation_id == conv_id, Messages.id <= archived_until)\
+                      .delete(synchronize_session=False)
+        Conversations.query.filter(Conversations.id == conv_id)\
+                           .update({"archived_until_id": archived_until}, synchronize_session=False)
+        db.session.commit()
+        return len(messages)
+
+    def eligible_conversations(self, now=None, limit=None):
+        """종료 후 MESSAGE_ARCHIVE_MIN_AGE_DAYS가 지났고 옮길 메시지가 남은 대화방 id 목록
+
+        ended_at이 비어 있는 매칭은 언제 끝났는지 알 수 없으므로 대상에서 제외합니다
+        (매칭을 종료할 때 status와 함께 ended_at을 기록해야 아카이브됩니다).
+        """
+        cutoff = (now or datetime.utcnow()) - self.min_age
+        has_cold = exists().where(Messages.conversation_id == Conversations.id,
+                                  Messages.id < Conversations.last_message_id)
+        q = db.session.query(Conversations.id)\
+                      .join(Matches, Matches.id == Conversations.match_id)\
+                      .filter(Matches.status.in_(ENDED_MATCH_STATUSES),
+                              Matches.ended_at < cutoff,
+                              has_cold)\
+                      .order_by(Conversations.id)
+        if limit:
+            q = q.limit(limit)
+        return [conv_id for (conv_id,) in q]
+
+    def archive_ended(self, limit=None):
+        """대상 대화방을 모두 아카이브하고 (대화방 수, 메시지 수) 반환. 대화방 하나가 실패해도 계속 진행"""
+        conversations = moved = 0
+        for conv_id in self.eligible_conversations(limit=limit):
+            try:
+                count = self.archive_conversation(conv_id)
+            except Exception:
+                db.session.rollback()
+                logger.exception("failed to archive conversation %s", conv_id)
+                continue
+            if count:
+                conversations += 1
+                moved += count
+        return conversations, moved
+
+    # --- 읽기 ---
+
+    def _load_segment(self, segment):
+        with self._lock:
+            messages = self._segments.get(segment.path)
+            if messages is not None:
+                self._segments.move_to_end(segment.path)
+                self.cache_hits += 1
+                return messages
+
+        with open(os.path.join(self.directory, segment.path), "rb") as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != segment.sha256:
+            raise IOError(f"archive segment checksum mismatch: {segment.path}")
+        messages = tuple(
+            ArchivedMessage(r["id"], segment.conversation_id, r["sender_user_id"], r["content"],
+                            datetime.fromisoformat(r["created_at"]))
+            for r in map(json.loads, gzip.decompress(data).decode("utf-8").splitlines())
+        )
+        with self._lock:
+            self.segment_reads += 1
+            self._segments[segment.path] = messages
+            while len(self._segments) > self.cache_size:
+                self._segments.popitem(last=False)
+        return messages
+
+    def read(self, conv_id, after_id=None, before_id=None, limit=50, newest_first=False):
+        """아카이브된 메시지 중 (after_id, before_id) 구간을 id 순서로 최대 limit개"""
+        q = MessageArchiveSegments.query.filter(MessageArchiveSegments.conversation_id == conv_id)
+        if after_id is not None:
+            q = q.filter(MessageArchiveSegments.last_message_id > after_id)
+        if before_id is not None:
+            q = q.filter(MessageArchiveSegments.first_message_id < before_id)
+        order = MessageArchiveSegments.first_message_id
+        segments = q.order_by(order.desc() if newest_first else order.asc()).all()
+
+        out = []
+        for segment in segments:
+            messages = self._load_segment(segment)
+            for m in (reversed(messages) if newest_first else messages):
+                if (after_id is None or m.id > after_id) and (before_id is None or m.id < before_id):
+                    out.append(m)
+                    if len(out) >= limit:
+                        return out
+        return out
+
+    def find(self, conv_id, message_id):
+        """아카이브에서 메시지 하나 찾기 (없으면 None)"""
+        found = self.read(conv_id, after_id=message_id - 1, before_id=message_id + 1, limit=1)
+        return found[0] if found else None
+
+    def stats(self):
+        with self._lock:
+            return {"cached_segments": len(self._segments), "cache_size": self.cache_size,
+                    "segment_reads": self.segment_reads, "cache_hits": self.cache_hits}
+
+
+message_archive = MessageArchive()
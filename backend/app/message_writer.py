@@ -0,0 +1,216 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from flask import jsonify
+from .auth_utils import require_role
+from .database import db
+from .inbox import record_new_messages
+from .models import Messages
+
+logger = logging.getLogger(__name__)
+
+# message_event가 Messages 객체처럼 다룰 수 있는 저장 완료 메시지
+WrittenMessage = namedtuple("WrittenMessage",
+                            ["id", "conversation_id", "sender_user_id", "content", "created_at"])
+
+
+class MessageWriteTimeout(Exception):
+    """MESSAGE_GROUP_COMMIT_TIMEOUT 안에 메시지가 커밋되지 않음 (503 응답용)"""
+
+
+class _PendingWrite:
+    __slots__ = ("row", "state", "done", "result", "error")
+
+    def __init__(self, row):
+        self.row = row
+        self.state = "queued"  # queued -> writing (writer가 가져감) 또는 cancelled (요청이 기다리다 포기)
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class GroupCommitWriter:
+    """메시지 INSERT를 여러 요청에서 모아 한 트랜잭션으로 커밋하는 백그라운드 writer (group commit)
+
+    요청 스레드는 write()로 메시지를 넘기고 자기 배치가 커밋될 때까지 기다립니다.
+    writer 스레드는 첫 메시지가 들어온 뒤 최대 MESSAGE_GROUP_COMMIT_MAX_WAIT_MS 동안,
+    최대 MESSAGE_GROUP_COMMIT_MAX_BATCH개까지 모아 다중 INSERT 1회 + 대화방 요약 갱신 + commit 1회로 저장합니다.
+    커밋(=fsync)이 메시지마다가 아니라 배치마다 한 번이므로 채팅이 몰릴 때 처리량이 올라갑니다.
+    배치가 실패하면 메시지별 트랜잭션으로 다시 시도해 문제가 된 메시지만 실패시킵니다.
+    요청이 MESSAGE_GROUP_COMMIT_TIMEOUT 안에 결과를 받지 못했는데 메시지가 아직 큐에 있으면 취소하므로,
+    503을 받은 클라이언트가 다시 보내도 메시지가 두 번 저장되지 않습니다. writer가 이미 가져간 메시지는
+    취소할 수 없으므로 커밋 결과(성공/실패)가 나올 때까지 기다려 그대로 돌려줍니다.
+    created_at은 초 단위로 잘라 저장하므로(MySQL DATETIME(0)) 응답 / 브로커 이벤트의 값이 DB 행과 같습니다.
+    writer 스레드는 워커 프로세스마다 첫 write() 때 시작합니다 (preload 후 fork된 워커 포함).
+    배치 수 / 평균 배치 크기는 GET /api/messages/group-commit/stats (워커 프로세스별 값, 운영자 전용)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_batch = 200
+        self.max_wait = 0.005
+        self.timeout = 10
+        self._queue = queue.Queue()
+        self._thread = None
+        self._app = None
+        self._pid = None          # writer 스레드를 시작한 프로세스
+        self._autoinc_step = None  # MySQL @@auto_increment_increment
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.messages = 0
+        self.cancelled = 0
+
+    def init_app(self, app):
+        self.enabled = app.config['MESSAGE_GROUP_COMMIT']
+        self.max_batch = app.config['MESSAGE_GROUP_COMMIT_MAX_BATCH']
+        self.max_wait = app.config['MESSAGE_GROUP_COMMIT_MAX_WAIT_MS'] / 1000
+        self.timeout = app.config['MESSAGE_GROUP_COMMIT_TIMEOUT']
+        self._app = app
+        app.extensions['message_writer'] = self
+        app.add_url_rule("/api/messages/group-commit/stats", "message_group_commit_stats",
+                         require_role("admin")(self._stats_view))
+
+    def start(self, app):
+        """현재 프로세스의 writer 스레드 시작 (이미 실행 중이면 무시)"""
+        self._app = app
+        pid = os.getpid()
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self._queue = queue.Queue()  # fork 전에 쌓인 항목은 부모 프로세스의 writer 몫
+            self._thread = threading.Thread(target=self._run, args=(app, self._queue),
+                                            name="message-group-commit", daemon=True)
+            self._thread.start()
+        atexit.register(self._stop)
+
+    def write(self, conversation_id, sender_user_id, content):
+        """메시지를 배치에 넣고 커밋될 때까지 대기. 저장된 WrittenMessage 반환
+
+        시간 안에 끝나지 않았을 때 메시지가 아직 큐에 있으면 취소하고 MessageWriteTimeout을 던집니다.
+        이미 writer가 가져간 뒤라면 저장됐을 수 있으므로 503 대신 그 커밋 결과를 끝까지 기다립니다.
+        """
+        if self._pid != os.getpid():
+            self.start(self._app)
+        pending = _PendingWrite({"conversation_id": conversation_id, "sender_user_id": sender_user_id,
+                                 "content": content,
+                                 "created_at": datetime.utcnow().replace(microsecond=0)})
+        self._queue.put(pending)
+        if not pending.done.wait(self.timeout):
+            with self._lock:
+                cancel = pending.state == "queued"
+                if cancel:
+                    pending.state = "cancelled"
+                    self.cancelled += 1
+            if cancel:
+                raise MessageWriteTimeout()
+            pending.done.wait()  # writer는 성공/실패와 관계없이 항상 done을 세움
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    # --- writer 스레드 ---
+
+    def _collect(self, work, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = work.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                work.put(None)  # 종료 신호는 다음 루프에서 처리
+                break
+            batch.append(item)
+        return batch
+
+    def _claim(self, batch):
+        """취소되지 않은 항목만 writing으로 바꿔 반환 (이후에는 요청이 취소할 수 없음)"""
+        with self._lock:
+            live = [pending for pending in batch if pending.state == "queued"]
+            for pending in live:
+                pending.state = "writing"
+        return live
+
+    def _insert(self, conn, rows):
+        """다중 INSERT 1회로 저장하고 rows 순서대로 id 목록 반환"""
+        table = Messages.__table__
+        if conn.dialect.insert_executemany_returning_sort_by_parameter_order:
+            # SQLite / PostgreSQL / MariaDB: INSERT ... VALUES (...), (...) RETURNING id
+            result = conn.execute(table.insert().returning(table.c.id, sort_by_parameter_order=True), rows)
+            return [row[0] for row in result]
+        # MySQL(RETURNING 없음): 행 수가 정해진 다중 VALUES INSERT("simple insert")는 InnoDB가 모든
+        # innodb_autoinc_lock_mode에서 한 문장 안에 빈틈 없이 auto_increment_increment 간격으로 id를 할당하고
+        # LAST_INSERT_ID()가 첫 번째 id이므로 나머지 id를 계산할 수 있음
+        result = conn.execute(table.insert().values(rows))
+        if result.rowcount != len(rows):
+            raise RuntimeError(f"multi-row insert stored {result.rowcount} of {len(rows)} messages")
+        if self._autoinc_step is None:
+            self._autoinc_step = conn.exec_driver_sql("SELECT @@auto_increment_increment").scalar() or 1
+        first = result.lastrowid
+        return [first + i * self._autoinc_step for i in range(len(rows))]
+
+    def _commit(self, batch):
+        rows = [p.row for p in batch]
+        with db.engine.begin() as conn:
+            ids = self._insert(conn, rows)
+            record_new_messages(conn, [(row["conversation_id"], message_id, row["sender_user_id"])
+                                       for row, message_id in zip(rows, ids)])
+        for pending, message_id in zip(batch, ids):
+            row = pending.row
+            pending.result = WrittenMessage(message_id, row["conversation_id"], row["sender_user_id"],
+                                            row["content"], row["created_at"])
+        with self._lock:
+            self.batches += 1
+            self.messages += len(batch)
+
+    def _flush(self, batch):
+        try:
+            self._commit(batch)
+        except Exception:
+            logger.exception("group commit of %d messages failed; retrying one by one", len(batch))
+            for pending in batch:
+                try:
+                    self._commit([pending])
+                except Exception as e:
+                    pending.error = e
+        finally:
+            for pending in batch:
+                pending.done.set()
+
+    def _run(self, app, work):
+        while True:
+            first = work.get()
+            if first is None:
+                return
+            batch = self._claim(self._collect(work, first))
+            if batch:
+                with app.app_context():
+                    self._flush(batch)
+
+    def _stop(self):
+        """프로세스 종료 시 대기 중인 메시지를 모두 커밋한 뒤 writer 종료"""
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout)
+
+    def stats(self):
+        with self._lock:
+            return {"enabled": self.enabled, "batches": self.batches, "messages": self.messages,
+                    "avg_batch": (self.messages / self.batches) if self.batches else 0.0,
+                    "cancelled": self.cancelled, "queued": self._queue.qsize()}
+
+    def _stats_view(self):
+        return jsonify(self.stats()), 200
+
+
+message_writer = GroupCommitWriter()
@@ -0,0 +1,414 @@
+import atexit
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from flask import Response, g, request
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없으면 종료된 워커 파일을 합치지 않음
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+AGGREGATE_FILE = "aggregate.json"  # 종료된 워커들의 값을 합쳐 둔 파일
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_float(value):
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    if os.name != "posix":  # Windows의 os.kill(pid, 0)은 시그널을 보내므로 확인하지 않음
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _file_pid(name):
+    """<pid>-<시작 시각>.json 워커 파일의 pid (aggregate.json 등 다른 파일은 None)"""
+    head = name.split("-", 1)[0]
+    return int(head) if name.endswith(".json") and head.isdigit() else None
+
+
+class RouteSeries:
+    """(method, route) 하나의 지연 시간 히스토그램 + 상태 코드별 요청 수"""
+
+    __slots__ = ("buckets", "sum", "count", "statuses")
+
+    def __init__(self, n_buckets):
+        self.buckets = [0] * (n_buckets + 1)  # 마지막 칸은 +Inf (누적 아님)
+        self.sum = 0.0
+        self.count = 0
+        self.statuses = Counter()
+
+
+class SamplingProfiler:
+    """느린 요청의 스택을 주기적으로 샘플링해 collapsed stack 파일로 남기는 프로파일러
+
+    샘플러 스레드 하나가 PROFILER_INTERVAL_MS마다 sys._current_frames()로 요청 처리 중인
+    스레드의 스택만 읽어 요청별로 모읍니다. 요청이 PROFILER_THRESHOLD_MS보다 오래 걸렸으면
+    <PROFILER_DIR>/<시각>-<pid>-<route>-<ms>ms.folded 로 저장하고, 아니면 버립니다.
+    파일은 한 줄에 "frame;frame;... 샘플 수" 형식이라 flamegraph.pl / speedscope로 바로 볼 수 있습니다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = 0.5
+        self.interval = 0.01
+        self.directory = "instance/profiles"
+        self._lock = threading.Lock()
+        self._active = {}  # thread id -> Counter(folded stack -> 샘플 수)
+        self._pid = None   # 샘플러 스레드를 시작한 프로세스
+        self.profiles_written = 0
+
+    def init_app(self, app):
+        self.enabled = app.config['PROFILER_ENABLED']
+        self.threshold = app.config['PROFILER_THRESHOLD_MS'] / 1000
+        self.interval = app.config['PROFILER_INTERVAL_MS'] / 1000
+        self.directory = app.config['PROFILER_DIR']
+
+    def begin(self):
+        with self._lock:
+            if self._pid != os.getpid():  # fork된 워커에는 스레드가 없으므로 프로세스마다 시작
+                self._pid = os.getpid()
+                threading.Thread(target=self._run, name="request-profiler", daemon=True).start()
+            self._active[threading.get_ident()] = Counter()
+
+    def end(self, route, elapsed):
+        with self._lock:
+            samples = self._active.pop(threading.get_ident(), None)
+        if samples and elapsed >= self.threshold:
+            try:
+                self._write(route, elapsed, samples)
+            except OSError:
+                logger.warning("failed to write request profile for %s", route, exc_info=True)
+
+    def _write(self, route, elapsed, samples):
+        os.makedirs(self.directory, exist_ok=True)
+        slug = "".join(c if c.isalnum() else "_" for c in route).strip("_")[:80] or "root"
+        name = f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{os.getpid()}-{slug}-{int(elapsed * 1000)}ms.folded"
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in samples.most_common():
+                f.write(f"{stack} {n}\n")
+        with self._lock:
+            self.profiles_written += 1
+
+    @staticmethod
+    def _fold(frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            # 스택 문자열 만들기는 잠금 밖에서 (요청 스레드의 begin/end가 샘플링을 기다리지 않도록)
+            with self._lock:
+                if not self._active:
+                    continue
+                active = list(self._active.items())
+            frames = sys._current_frames()
+            folded = [(ident, samples, self._fold(frames[ident]))
+                      for ident, samples in active if ident in frames]
+            with self._lock:
+                for ident, samples, stack in folded:
+                    if self._active.get(ident) is samples:  # 그 사이 끝난 요청은 건너뜀
+                        samples[stack] += 1
+
+
+class RequestMetrics:
+    """라우트별 HTTP 지연 시간 히스토그램 / 처리 중 요청 수 / 상태 코드별 요청 수 (Prometheus 형식)
+
+    - 라우트 라벨은 URL 규칙 문자열(/board/<int:board_id>/posts)이라 값 개수가 라우트 수로 고정됨
+    - 워커 프로세스마다 메모리에 누적하고 METRICS_FLUSH_INTERVAL마다 <METRICS_DIR>/<pid>-<시작 시각>.json 으로 저장
+    - GET /metrics 는 디렉터리의 모든 파일을 합쳐 응답 (카운터/히스토그램은 종료된 워커 값까지 합산,
+      처리 중 요청 수는 살아 있는 워커만). 배포 시 디렉터리를 비우면 카운터가 0부터 다시 시작합니다.
+    - 종료된 워커의 파일은 /metrics 조회 때 aggregate.json 하나로 합치고 지우므로 워커가 재시작되어도 파일이 늘지 않음
+    - 요청당 비용은 perf_counter 2회 + 잠금 1회 + bisect 1회 (benchmarks/metrics_overhead.py)
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+        self.directory = ""
+        self.flush_interval = 5
+        self.profiler = SamplingProfiler()
+        self._lock = threading.Lock()
+        self._series = {}    # (method, route) -> RouteSeries
+        self._inflight = {}  # (method, route) -> 처리 중 요청 수
+        self._pid = None     # 파일 이름/flush 스레드를 만든 프로세스 (fork된 워커에서는 다시 만듦)
+        self._filename = None
+
+    def init_app(self, app):
+        self.enabled = app.config['METRICS_ENABLED']
+        self.buckets = tuple(sorted(float(b) for b in app.config['METRICS_BUCKETS'].split(",") if b.strip()))
+        self.directory = app.config['METRICS_DIR']
+        self.flush_interval = app.config['METRICS_FLUSH_INTERVAL']
+        self.profiler.init_app(app)
+        with self._lock:
+            self._series.clear()
+            self._inflight.clear()
+        app.extensions['metrics'] = self
+        if not self.enabled:
+            return
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        app.add_url_rule("/metrics", "metrics", self._metrics_view)
+
+    def _ensure_process(self):
+        """워커 프로세스마다 한 번: 파일 이름을 정하고 flush 스레드 시작 (preload 후 fork된 경우 포함)"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._filename = f"{pid}-{int(time.time() * 1000)}.json"
+            self._pid = pid
+        if self.directory and self.flush_interval > 0:
+            threading.Thread(target=self._run, name="metrics-flush", daemon=True).start()
+            atexit.register(self.flush)
+
+    # --- 요청 계측 ---
+
+    @staticmethod
+    def _key():
+        rule = request.url_rule
+        return request.method, rule.rule if rule is not None else "<unmatched>"
+
+    def _before_request(self):
+        self._ensure_process()
+        key = self._key()
+        g.metrics_key = key
+        g.metrics_started = time.perf_counter()
+        with self._lock:
+            self._inflight[key] = self._inflight.get(key, 0) + 1
+        if self.profiler.enabled:
+            self.profiler.begin()
+
+    def _after_request(self, response):
+        started = g.get("metrics_started")
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        key = g.metrics_key
+        index = bisect_left(self.buckets, elapsed)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = RouteSeries(len(self.buckets))
+            series.buckets[index] += 1
+            series.sum += elapsed
+            series.count += 1
+            series.statuses[response.status_code] += 1
+        g.metrics_elapsed = elapsed
+        return response
+
+    def _teardown_request(self, exc):
+        # after_request가 실행되지 않은 경우에도 처리 중 요청 수는 반드시 되돌림
+        key = g.pop("metrics_key", None)
+        if key is None:
+            return
+        with self._lock:
+            self._inflight[key] = self._inflight.get(key, 1) - 1
+        if self.profiler.enabled:
+            elapsed = g.get("metrics_elapsed", time.perf_counter() - g.metrics_started)
+            self.profiler.end(key[1], elapsed)
+
+    # --- 프로세스 간 집계 ---
+
+    @staticmethod
+    def _series_json(series):
+        return [{"method": method, "route": route, "buckets": list(s.buckets), "sum": s.sum,
+                 "count": s.count, "statuses": {str(code): n for code, n in s.statuses.items()}}
+                for (method, route), s in series.items()]
+
+    def _merge(self, series, snapshot):
+        """snapshot의 히스토그램 / 상태 코드 값을 series({(method, route): RouteSeries})에 더함"""
+        for s in snapshot["series"]:
+            key = (s["method"], s["route"])
+            merged = series.get(key)
+            if merged is None:
+                merged = series[key] = RouteSeries(len(self.buckets))
+            merged.buckets = [a + b for a, b in zip(merged.buckets, s["buckets"])]
+            merged.sum += s["sum"]
+            merged.count += s["count"]
+            merged.statuses.update({int(code): n for code, n in s["statuses"].items()})
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "buckets": list(self.buckets),
+                "series": self._series_json(self._series),
+                "inflight": [{"method": method, "route": route, "value": n}
+                             for (method, route), n in self._inflight.items() if n],
+            }
+
+    def flush(self):
+        """이 프로세스의 현재 값을 METRICS_DIR에 저장 (임시 파일 -> rename)"""
+        if not self.directory:
+            return
+        self._ensure_process()
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_json(os.path.join(self.directory, self._filename), self.snapshot())
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def _load(self, name):
+        """METRICS_DIR의 파일 하나를 읽음. 쓰는 중이거나 손상됐거나 히스토그램 경계가 다르면 None"""
+        try:
+            with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("buckets") != list(self.buckets):
+            logger.warning("skipping metrics file %s with different histogram buckets", name)
+            return None
+        return snapshot
+
+    def compact(self):
+        """종료된 워커의 파일을 aggregate.json에 더하고 지움
+
+        여러 워커가 동시에 합치지 않도록 lock 파일에 flock을 걸고, 다른 워커가 잡고 있으면 건너뜁니다.
+        합친 파일 이름을 aggregate.json에 함께 기록하므로 지우기 전에 중단돼도 두 번 더해지지 않습니다.
+        """
+        if not self.directory or fcntl is None or not os.path.isdir(self.directory):
+            return
+        with open(os.path.join(self.directory, ".compact.lock"), "a") as lock:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return
+            names = set(os.listdir(self.directory))
+            aggregate = self._load(AGGREGATE_FILE) if AGGREGATE_FILE in names else None
+            if aggregate is None and AGGREGATE_FILE in names:
+                return  # 히스토그램 경계가 바뀐 이전 집계는 그대로 둠
+            compacted = [name for name in (aggregate or {}).get("compacted", []) if name in names]
+            series, dead = {}, []
+            self._merge(series, aggregate or {"series": []})
+            for name in sorted(names):
+                pid = _file_pid(name)
+                if pid is None or name in compacted or _pid_alive(pid):
+                    continue
+                snapshot = self._load(name)
+                if snapshot is not None:
+                    self._merge(series, snapshot)
+                    dead.append(name)
+            if dead:
+                self._write_json(os.path.join(self.directory, AGGREGATE_FILE),
+                                 {"pid": None, "buckets": list(self.buckets),
+                                  "series": self._series_json(series), "inflight": [],
+                                  "compacted": compacted + dead})
+            for name in compacted + dead:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("metrics flush failed")
+
+    def _snapshots(self):
+        if not self.directory:
+            return [self.snapshot()]
+        self.flush()
+        try:
+            self.compact()
+        except OSError:
+            logger.warning("metrics compaction failed", exc_info=True)
+        loaded, compacted = [], set()
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".json"):
+                continue
+            snapshot = self._load(name)
+            if snapshot is None:
+                continue
+            if name == AGGREGATE_FILE:
+                compacted.update(snapshot.get("compacted", []))
+            loaded.append((name, snapshot))
+        # aggregate.json에 이미 더해졌지만 아직 지워지지 않은 파일은 제외
+        return [snapshot for name, snapshot in loaded if name not in compacted]
+
+    def collect(self):
+        """모든 워커의 값을 합친 (series, inflight)"""
+        series, inflight = {}, {}
+        for snapshot in self._snapshots():
+            self._merge(series, snapshot)
+            if snapshot["pid"] is not None and _pid_alive(snapshot["pid"]):
+                for item in snapshot["inflight"]:
+                    key = (item["method"], item["route"])
+                    inflight[key] = inflight.get(key, 0) + item["value"]
+        return series, inflight
+
+    def render(self):
+        series, inflight = self.collect()
+        lines = [
+            "# HELP http_request_duration_seconds HTTP request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), s in sorted(series.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), s.buckets):
+                cumulative += n
+                lines.append(f"http_request_duration_seconds_bucket"
+                             f"{_labels(method=method, route=route, le=_format_float(bound))} {cumulative}")
+            lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {s.sum!r}")
+            lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {s.count}")
+
+        lines += ["# HELP http_requests_total HTTP requests by route and status code.",
+                  "# TYPE http_requests_total counter"]
+        for (method, route), s in sorted(series.items()):
+            for status, n in sorted(s.statuses.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {n}")
+
+        lines += ["# HELP http_requests_in_flight HTTP requests currently being handled.",
+                  "# TYPE http_requests_in_flight gauge"]
+        for (method, route), n in sorted(inflight.items()):
+            lines.append(f"http_requests_in_flight{_labels(method=method, route=route)} {n}")
+        return "\n".join(lines) + "\n"
+
+    def _metrics_view(self):
+        return Response(self.render(), mimetype=None, content_type=CONTENT_TYPE)
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,85 @@
+import os
+from datetime import datetime
+from sqlalchemy import text
+from .database import db
+
+# backend/migrations/NNNN_설명.sql (MySQL 문법, 파일 이름 순서대로 적용)
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) NOT NULL PRIMARY KEY,
+    applied_at DATETIME NOT NULL
+)
+"""
+
+
+def available():
+    """migrations 디렉터리의 (version, 경로) 목록. version은 확장자를 뺀 파일 이름"""
+    if not os.path.isdir(MIGRATIONS_DIR):
+        return []
+    return [(name[:-4], os.path.join(MIGRATIONS_DIR, name))
+            for name in sorted(os.listdir(MIGRATIONS_DIR)) if name.endswith(".sql")]
+
+
+def split_statements(sql):
+    """세미콜론으로 끝나는 줄 단위로 문장을 나눔 (-- 주석 줄은 제외)"""
+    statements, current = [], []
+    for line in sql.splitlines():
+        if line.strip().startswith("--"):
+            continue
+        current.append(line)
+        if line.rstrip().endswith(";"):
+            statement = "\n".join(current).strip().rstrip(";").strip()
+            if statement:
+                statements.append(statement)
+            current = []
+    tail = "\n".join(current).strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+def applied():
+    with db.engine.begin() as conn:
+        conn.execute(text(_CREATE_TABLE))
+        return {version for (version,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def _record(conn, version):
+    conn.execute(text("INSERT INTO schema_migrations (version, applied_at) VALUES (:v, :at)"),
+                 {"v": version, "at": datetime.utcnow()})
+
+
+def pending():
+    done = applied()
+    return [(version, path) for version, path in available() if version not in done]
+
+
+def apply_pending(echo=print):
+    """적용되지 않은 마이그레이션을 순서대로 실행. 적용한 version 목록 반환
+
+    MySQL의 DDL은 암묵적으로 커밋되므로 파일 중간에 실패하면 앞 문장은 이미 반영돼 있고
+    schema_migrations에는 기록되지 않습니다. 반영된 문장을 확인해 나머지를 수동으로 적용한 뒤
+    schema_migrations에 version을 넣거나, 반영된 부분을 되돌리고 다시 실행하세요.
+    """
+    done = []
+    for version, path in pending():
+        with open(path, encoding="utf-8") as f:
+            statements = split_statements(f.read())
+        echo(f"Applying {version} ({len(statements)} statements)")
+        with db.engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            _record(conn, version)
+        done.append(version)
+    return done
+
+
+def mark_all_applied():
+    """create_all로 만든 새 DB는 이미 최신 스키마이므로 모든 마이그레이션을 적용된 것으로 기록"""
+    done = applied()
+    with db.engine.begin() as conn:
+        for version, _ in available():
+            if version not in done:
+                _record(conn, version)
@@ -1,6 +1,9 @@
 from .database import db
 from datetime import datetime
 
+# MySQL에서는 BIGINT, SQLite(벤치마크/테스트용)에서는 자동 증가가 되는 INTEGER PRIMARY KEY로 생성
+BigIntPK = db.BigInteger().with_variant(db.Integer(), "sqlite")
+
 class Language(db.Model):
     __tablename__ = "language"
     code = db.Column(db.String(10), primary_key=True)
@@ -14,19 +17,19 @@ class Country(db.Model):
 
 class Schools(db.Model):
     __tablename__ = "schools"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     school_name = db.Column(db.String(200), nullable=False)
     website_url = db.Column(db.String(255), nullable=True)
 
 class Colleges(db.Model):
     __tablename__ = "colleges"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     school_id = db.Column(db.BigInteger, db.ForeignKey('schools.id'), nullable=False)
     college_name = db.Column(db.String(200), nullable=False)
 
 class Departments(db.Model):
     __tablename__ = "departments"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     school_id = db.Column(db.BigInteger, db.ForeignKey('schools.id'), nullable=False)
     college_id = db.Column(db.BigInteger, db.ForeignKey('colleges.id'), nullable=False)
     department_name = db.Column(db.String(200), nullable=False)
@@ -34,7 +37,7 @@ class Departments(db.Model):
 
 class Users(db.Model):
     __tablename__ = "users"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     email = db.Column(db.String(255), unique=True, nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
     nickname = db.Column(db.String(100), nullable=False)
@@ -51,27 +54,27 @@ class Users(db.Model):
 
 class HelperProfiles(db.Model):
     __tablename__ = "helper_profiles"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False, unique=True)
     intro = db.Column(db.String(500))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class HelperLanguages(db.Model):
     __tablename__ = "helper_languages"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     language_code = db.Column(db.String(10), db.ForeignKey('language.code'), nullable=False)
 
 class Communities(db.Model):
     __tablename__ = "communities"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     school_id = db.Column(db.BigInteger, db.ForeignKey('schools.id'), nullable=False)
     community_name = db.Column(db.String(200), nullable=False)
     nationality_iso2 = db.Column(db.CHAR(2), db.ForeignKey('country.iso2'), nullable=False)
 
 class Boards(db.Model):
     __tablename__ = "boards"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     community_id = db.Column(db.BigInteger, db.ForeignKey('communities.id'), nullable=False)
     board_name = db.Column(db.String(200), nullable=False)
     description = db.Column(db.String(500))
@@ -79,7 +82,7 @@ class Boards(db.Model):
 
 class Posts(db.Model):
     __tablename__ = "posts"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     board_id = db.Column(db.BigInteger, db.ForeignKey('boards.id'), nullable=False)
     user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     title = db.Column(db.String(200), nullable=False)
@@ -92,22 +95,76 @@ class Posts(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     author = db.relationship('Users', backref=db.backref('posts'))
 
+    # 게시판별 최신순 커서 페이지네이션용 복합 인덱스
+    __table_args__ = (
+        db.Index('ix_posts_board_created_id', 'board_id', 'created_at', 'id'),
+    )
+
+class PostSearchTerms(db.Model):
+    """게시글 검색용 역색인 (term -> 글). board_id / community_id는 범위 검색을 위해 비정규화"""
+    __tablename__ = "post_search_terms"
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
+    term = db.Column(db.String(32), nullable=False)
+    post_id = db.Column(db.BigInteger, db.ForeignKey('posts.id'), nullable=False)
+    board_id = db.Column(db.BigInteger, nullable=False)
+    community_id = db.Column(db.BigInteger, nullable=False)
+    tf = db.Column(db.Integer, nullable=False, default=1)
+
+    __table_args__ = (
+        db.Index('ix_post_search_terms_term_board', 'term', 'board_id', 'post_id'),
+        db.Index('ix_post_search_terms_term_community', 'term', 'community_id', 'post_id'),
+        db.Index('ix_post_search_terms_post', 'post_id'),
+    )
+
+class PostLikes(db.Model):
+    __tablename__ = "post_likes"
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
+    post_id = db.Column(db.BigInteger, db.ForeignKey('posts.id'), nullable=False)
+    user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 사용자당 글 1회만 좋아요
+    __table_args__ = (
+        db.UniqueConstraint('post_id', 'user_id', name='uq_post_likes_post_user'),
+    )
+
+class Comments(db.Model):
+    __tablename__ = "comments"
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
+    post_id = db.Column(db.BigInteger, db.ForeignKey('posts.id'), nullable=False)
+    user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    is_anonymous = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 글별 댓글 id 커서 조회용 복합 인덱스
+    __table_args__ = (
+        db.Index('ix_comments_post_id_id', 'post_id', 'id'),
+    )
+
 class MatchRequests(db.Model):
     __tablename__ = "match_requests"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     requester_user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     preferred_college_id = db.Column(db.BigInteger, db.ForeignKey('colleges.id'))
     preferred_gender = db.Column(db.Enum('male', 'female', 'any'), default='any')
     notes = db.Column(db.String(500))
     status = db.Column(db.Enum('pending', 'offered', 'accepted', 'rejected', 'cancelled'), default='pending')
+    offered_mentor_user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # 요청자 정보 (매칭 수락 시 school_id를 알기 위해)
-    requester = db.relationship('Users', backref=db.backref('match_requests'))
+    requester = db.relationship('Users', foreign_keys=[requester_user_id],
+                                backref=db.backref('match_requests'))
+
+    # 상태별 대기 순서 조회(일괄 매칭 등)용 인덱스
+    __table_args__ = (
+        db.Index('ix_match_requests_status_created', 'status', 'created_at'),
+    )
 
 class Matches(db.Model):
     __tablename__ = "matches"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     mentor_user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     mentee_user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     school_id = db.Column(db.BigInteger)
@@ -115,24 +172,60 @@ class Matches(db.Model):
     status = db.Column(db.Enum('active', 'completed', 'cancelled'), default='active')
     started_at = db.Column(db.DateTime, default=datetime.utcnow)
     ended_at = db.Column(db.DateTime)
+    # 요청당 매칭 1개 (수락 멱등성 보장)
+    __table_args__ = (
+        db.UniqueConstraint('request_id', name='uq_matches_request_id'),
+    )
 
 class Conversations(db.Model):
     __tablename__ = "conversations"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     match_id = db.Column(db.BigInteger, db.ForeignKey('matches.id'), unique=True, nullable=False)
+    last_message_id = db.Column(db.BigInteger) # 받은편지함 미리보기용 마지막 메시지 (messages.id)
+    archived_until_id = db.Column(db.BigInteger) # 이 id까지의 메시지는 아카이브 세그먼트 파일에 있음
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    match = db.relationship('Matches', backref=db.backref('conversation', uselist=False))
 
 class ConversationParticipants(db.Model):
     __tablename__ = "conversation_participants"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     conversation_id = db.Column(db.BigInteger, db.ForeignKey('conversations.id'), nullable=False)
     user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     last_read_at = db.Column(db.DateTime)
+    unread_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    conversation = db.relationship('Conversations', backref=db.backref('participants'))
+
+    # 대화방당 참여자 1회 + 사용자별 받은편지함 조회용 인덱스
+    __table_args__ = (
+        db.UniqueConstraint('conversation_id', 'user_id', name='uq_conversation_participants_conv_user'),
+        db.Index('ix_conversation_participants_user_conv', 'user_id', 'conversation_id'),
+    )
 
 class Messages(db.Model):
     __tablename__ = "messages"
-    id = db.Column(db.BigInteger, primary_key=True, autoincrement=True)
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
     conversation_id = db.Column(db.BigInteger, db.ForeignKey('conversations.id'), nullable=False)
     sender_user_id = db.Column(db.BigInteger, db.ForeignKey('users.id'), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # 대화방별 id 커서(after_id / before_id) 조회용 복합 인덱스
+    __table_args__ = (
+        db.Index('ix_messages_conversation_id_id', 'conversation_id', 'id'),
+    )
+
+class MessageArchiveSegments(db.Model):
+    """종료된 매칭의 메시지를 옮겨 둔 압축 세그먼트 파일 색인 (파일 1개 = 연속된 id 구간)"""
+    __tablename__ = "message_archive_segments"
+    id = db.Column(BigIntPK, primary_key=True, autoincrement=True)
+    conversation_id = db.Column(db.BigInteger, db.ForeignKey('conversations.id'), nullable=False)
+    first_message_id = db.Column(db.BigInteger, nullable=False)
+    last_message_id = db.Column(db.BigInteger, nullable=False)
+    message_count = db.Column(db.Integer, nullable=False)
+    path = db.Column(db.String(255), nullable=False) # MESSAGE_ARCHIVE_DIR 기준 상대 경로
+    sha256 = db.Column(db.CHAR(64), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_message_archive_segments_conv_last', 'conversation_id', 'last_message_id'),
+    )
@@ -0,0 +1,32 @@
+import base64
+from datetime import datetime
+
+
+def encode_cursor(created_at, row_id):
+    """(created_at, id) 쌍을 클라이언트에 노출할 불투명 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """encode_cursor로 만든 커서를 (created_at, id)로 복원. 형식이 잘못되면 ValueError
+
+    DB의 created_at은 naive UTC이므로 시간대가 붙은 값은 (naive 값과 비교할 수 없어) 거부합니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        created_at = datetime.fromisoformat(created_at)
+        if created_at.tzinfo is not None:
+            raise ValueError("cursor timestamp must not carry a timezone")
+        return created_at, int(row_id)
+    except (ValueError, UnicodeError) as err:
+        raise ValueError("invalid cursor") from err
+
+
+def parse_limit(value, default, maximum):
+    """쿼리스트링의 limit 값을 1..maximum 범위로 보정. 숫자가 아니면 ValueError"""
+    if value is None:
+        return default
+    return max(1, min(int(value), maximum))
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from sqlalchemy import event
+from .models import Users
+
+# 인증된 사용자의 읽기 전용 스냅샷 (password_hash 및 관계 제외)
+Principal = namedtuple("Principal", [
+    "id", "email", "nickname", "realname", "gender", "main_language",
+    "nationality_iso2", "school_id", "department_id", "enrollment_year", "is_helper",
+])
+
+
+def principal_from_user(user):
+    return Principal(*(getattr(user, field) for field in Principal._fields))
+
+
+def token_digest(token):
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class PrincipalCache:
+    """검증된 토큰 digest -> Principal 스냅샷을 보관하는 LRU + TTL 캐시
+
+    항목의 만료 시각은 min(저장 시각 + TTL, 토큰 exp) 이므로 만료된 토큰은 캐시에서도 통과하지 못합니다.
+    Users 행이 수정/삭제되면 해당 사용자의 항목을 모두 지웁니다 (프로세스 로컬 캐시이므로
+    다른 워커의 항목은 TTL로 정리됩니다).
+    """
+
+    def __init__(self, maxsize=10000, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # digest -> (principal, expires_at)
+        self._by_user = {}             # user_id -> set(digest)
+
+    def init_app(self, app):
+        self.maxsize = app.config['PRINCIPAL_CACHE_SIZE']
+        self.ttl = app.config['PRINCIPAL_CACHE_TTL']
+        self.clear()
+        app.extensions['principal_cache'] = self
+
+    def get(self, digest):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= now:
+                self._remove(digest)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return principal
+
+    def put(self, digest, principal, token_exp=None):
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+            self._entries[digest] = (principal, expires_at)
+            self._by_user.setdefault(principal.id, set()).add(digest)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for digest in self._by_user.pop(user_id, ()):
+                self._entries.pop(digest, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / total) if total else 0.0,
+            }
+
+    def _remove(self, digest):
+        principal, _ = self._entries.pop(digest)
+        digests = self._by_user.get(principal.id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_user[principal.id]
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(Users, "after_update")
+@event.listens_for(Users, "after_delete")
+def _invalidate_changed_user(mapper, connection, target):
+    principal_cache.invalidate_user(target.id)
@@ -0,0 +1,219 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from functools import wraps
+from flask import request, jsonify
+from .auth_utils import require_role
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없으면 shm 백엔드 사용 불가
+    fcntl = None
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_limit(spec):
+    """"20/minute" -> (초당 충전량, 버킷 크기). 버킷 크기는 기간당 허용 횟수와 같음"""
+    count, _, period = spec.partition("/")
+    count = int(count)
+    if period not in PERIODS or count <= 0:
+        raise ValueError(f"invalid rate limit: {spec!r}")
+    return count / PERIODS[period], float(count)
+
+
+def _refill(tokens, updated, now, rate, burst):
+    # 벽시계가 뒤로 가도(NTP 보정, 재부팅 전에 기록된 시각) 토큰이 줄어들지 않도록 경과 시간은 0 이상
+    return min(burst, tokens + max(0.0, now - updated) * rate)
+
+
+class LocalBucketStore:
+    """프로세스 메모리 안의 토큰 버킷 (단일 워커/테스트용)"""
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._buckets = {}  # key -> [tokens, updated]
+
+    def take(self, key, rate, burst, cost=1.0, consume=True):
+        """토큰을 cost만큼 쓰면 (True, 0), 부족하면 (False, 다시 시도할 때까지 남은 초)
+
+        consume=False면 쓸 수 있는지만 확인하고 버킷은 그대로 둡니다. cost가 음수면 토큰을 돌려줍니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            tokens = burst if bucket is None else _refill(bucket[0], bucket[1], now, rate, burst)
+            allowed = tokens >= cost
+            if allowed and consume:
+                tokens = min(burst, tokens - cost)
+                self._buckets[key] = [tokens, now]
+        return (True, 0.0) if allowed else (False, (cost - tokens) / rate)
+
+
+class SharedMemoryBucketStore:
+    """같은 호스트의 워커 프로세스가 공유하는 토큰 버킷 (mmap 파일 + 슬롯 단위 잠금)
+
+    고정 크기 2-way 해시 테이블이라 조회/갱신이 O(1)이고 메모리도 slots * 24바이트로 고정입니다.
+    슬롯: (키 해시 64bit, 토큰 수, 마지막 갱신 시각). 두 칸이 모두 다른 키로 차 있으면
+    더 오래 쓰이지 않은 칸을 새 버킷으로 덮어씁니다 (가득 찬 버킷으로 시작하므로 제한이 느슨해질 뿐 잘못 막지는 않음).
+    프로세스 간에는 set 단위 fcntl 레코드 잠금, 프로세스 안의 스레드 간에는 threading.Lock으로 보호합니다.
+    시각은 time.time()(epoch 초)을 기록합니다. 파일(RATE_LIMIT_SHM_PATH)은 재부팅 후에도 남는데
+    time.monotonic()은 부팅 시점 기준이라 재부팅 뒤 값이 작아지기 때문입니다. 시계가 뒤로 가더라도
+    경과 시간을 0으로 보므로 버킷이 비워지지는 않습니다.
+    """
+
+    SLOT = struct.Struct("<Qdd")
+    WAYS = 2
+
+    def __init__(self, app):
+        if fcntl is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND 'shm' requires fcntl (POSIX)")
+        path = app.config['RATE_LIMIT_SHM_PATH']
+        self.slots = app.config['RATE_LIMIT_SHM_SLOTS']
+        self.sets = self.slots // self.WAYS
+        size = self.sets * self.WAYS * self.SLOT.size
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, cost=1.0, consume=True):
+        tag = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+        offset = (tag % self.sets) * self.WAYS * self.SLOT.size
+        length = self.WAYS * self.SLOT.size
+        now = time.time()
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+            try:
+                slots = [self.SLOT.unpack_from(self._map, offset + i * self.SLOT.size)
+                         for i in range(self.WAYS)]
+                way = next((i for i, s in enumerate(slots) if s[0] == tag), None)
+                if way is None:
+                    way = min(range(self.WAYS), key=lambda i: slots[i][2])
+                    tokens = burst
+                else:
+                    tokens = _refill(slots[way][1], slots[way][2], now, rate, burst)
+                allowed = tokens >= cost
+                if allowed and consume:
+                    tokens = min(burst, tokens - cost)
+                    self.SLOT.pack_into(self._map, offset + way * self.SLOT.size, tag, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+        return (True, 0.0) if allowed else (False, (cost - tokens) / rate)
+
+
+BUCKET_STORES = {
+    "local": LocalBucketStore,
+    "shm": SharedMemoryBucketStore,
+}
+
+
+class RateLimiter:
+    """쓰기 핫패스용 사용자별 / IP별 토큰 버킷 admission control
+
+    RATE_LIMITS = {"send_message": {"user": "60/minute", "ip": "300/minute"}, ...}
+    @rate_limited("send_message")를 붙인 핸들러는 규칙마다 버킷에서 토큰 1개를 쓰고,
+    하나라도 부족하면 어느 버킷에서도 토큰을 쓰지 않고 429 + Retry-After를 반환합니다.
+    "ip" 범위는 request.remote_addr 기준이므로 리버스 프록시 뒤에서는 TRUSTED_PROXY_COUNT를 설정해야
+    클라이언트 주소별로 나뉩니다 (create_app이 ProxyFix 적용).
+    허용/차단 횟수는 GET /api/rate-limit/stats (워커 프로세스별 값, 운영자 전용)
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.store = LocalBucketStore()
+        self.rules = {}
+        self._lock = threading.Lock()
+        self._counters = {}  # (이름, 범위) -> [허용, 차단]
+
+    def init_app(self, app):
+        self.enabled = app.config['RATE_LIMIT_ENABLED']
+        self.rules = {name: {scope: parse_limit(spec) for scope, spec in scopes.items() if spec}
+                      for name, scopes in app.config['RATE_LIMITS'].items()}
+        self.store = BUCKET_STORES[app.config['RATE_LIMIT_BACKEND']](app)
+        with self._lock:
+            self._counters.clear()
+        app.extensions['rate_limiter'] = self
+        app.add_url_rule("/api/rate-limit/stats", "rate_limit_stats",
+                         require_role("admin")(self._stats_view))
+
+    def check(self, name, identities):
+        """identities: {"user": 사용자 식별값, "ip": 주소}. (허용 여부, Retry-After 초) 반환"""
+        buckets = []
+        for scope, (rate, burst) in self.rules.get(name, {}).items():
+            identity = identities.get(scope)
+            if identity is not None:
+                buckets.append((scope, f"{name}:{scope}:{identity}", rate, burst))
+
+        # 1) 모든 범위를 먼저 확인하고, 하나라도 부족하면 어느 버킷도 건드리지 않음
+        retry_after = 0.0
+        denied = set()
+        for scope, key, rate, burst in buckets:
+            allowed, wait = self.store.take(key, rate, burst, consume=False)
+            if not allowed:
+                denied.add(scope)
+                retry_after = max(retry_after, wait)
+
+        # 2) 모두 여유가 있으면 차례로 씀. 확인과 사용 사이에 다른 워커가 먼저 써서 부족해지면 이미 쓴 토큰을 돌려줌
+        if not denied:
+            taken = []
+            for scope, key, rate, burst in buckets:
+                allowed, wait = self.store.take(key, rate, burst)
+                if not allowed:
+                    for taken_key, taken_rate, taken_burst in taken:
+                        self.store.take(taken_key, taken_rate, taken_burst, cost=-1.0)
+                    denied.add(scope)
+                    retry_after = wait
+                    break
+                taken.append((key, rate, burst))
+
+        with self._lock:
+            for scope, _, _, _ in buckets:
+                counter = self._counters.setdefault((name, scope), [0, 0])
+                if not denied:
+                    counter[0] += 1
+                elif scope in denied:
+                    counter[1] += 1
+        return not denied, retry_after
+
+    def stats(self):
+        with self._lock:
+            return {f"{name}:{scope}": {"allowed": allowed, "throttled": throttled}
+                    for (name, scope), (allowed, throttled) in sorted(self._counters.items())}
+
+    def _stats_view(self):
+        return jsonify(self.stats()), 200
+
+
+rate_limiter = RateLimiter()
+
+
+def _current_user_id():
+    user = getattr(request, "user", None)
+    return user.id if user is not None else None
+
+
+def rate_limited(name, user_key=None):
+    """RATE_LIMITS[name] 규칙으로 요청을 제한하는 데코레이터 (@require_auth 아래에 붙임)
+
+    user_key: "user" 범위의 식별값을 돌려주는 함수 (기본: 로그인 사용자 id)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if rate_limiter.enabled:
+                allowed, retry_after = rate_limiter.check(
+                    name, {"user": (user_key or _current_user_id)(), "ip": request.remote_addr})
+                if not allowed:
+                    response = jsonify({"error": "Too many requests, please retry later"})
+                    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+                    return response, 429
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
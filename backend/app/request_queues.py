@@ -0,0 +1,192 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import namedtuple
+from sqlalchemy import func
+from .database import db
+from .models import Users, MatchRequests
+
+PendingEntry = namedtuple("PendingEntry", [
+    "id", "requester_user_id", "language", "preferred_college_id", "preferred_gender", "school_id",
+    "created_at",
+])
+
+
+def queue_key(language, college_id, gender):
+    """(요청자 언어, 선호 단과대학 또는 None, 선호 성별 또는 'any')"""
+    return language, college_id or None, gender if gender in ("male", "female") else "any"
+
+
+class PendingRequestQueues:
+    """도우미 받은편지함용 pending 매칭 요청 큐 (언어 x 선호 단과대학 x 선호 성별별, 대기 시간 순)
+
+    요청은 (요청자 언어, 선호 단과대학, 선호 성별) 큐 하나에 (created_at, id) 순으로 들어갑니다.
+    도우미의 받은편지함은 HelperLanguages의 언어마다 (단과대학 무관 / 도우미 단과대학) x (성별 무관 / 도우미 성별)
+    큐만 heapq.merge로 합치므로 match_requests 전체를 훑지 않습니다.
+
+    - create_match_request / offer_match / accept_match(일괄 포함) / 일괄 매칭은 커밋 후 큐를 바로 갱신
+    - 다른 워커에서 만든 요청은 요청마다 `id > 마지막으로 본 id` PK 범위 조회로 따라잡음
+    - 다른 워커에서 상태가 바뀐 요청은 페이지를 만들 때 상태 확인 조회(IN)로 걸러내고 큐에서 제거
+    - REQUEST_QUEUE_MAX_AGE마다 (status, created_at) 인덱스로 pending 요청만 다시 읽어 전체 재빌드
+    """
+
+    def __init__(self):
+        self.max_age = 300
+        self._lock = threading.Lock()
+        self._built_at = None
+        self._reset()
+
+    def init_app(self, app):
+        self.max_age = app.config['REQUEST_QUEUE_MAX_AGE']
+        with self._lock:
+            self._built_at = None
+            self._reset()
+        app.extensions['request_queues'] = self
+
+    def _reset(self):
+        self.entries = {}     # request_id -> PendingEntry
+        self.queues = {}      # queue_key -> [(created_at, id), ...] 오래된 순
+        self.last_seen_id = 0
+
+    # --- 빌드 / 갱신 ---
+
+    @staticmethod
+    def _pending_query():
+        return db.session.query(MatchRequests.id, MatchRequests.requester_user_id, Users.main_language,
+                                MatchRequests.preferred_college_id, MatchRequests.preferred_gender,
+                                Users.school_id, MatchRequests.created_at, MatchRequests.status)\
+                         .join(Users, Users.id == MatchRequests.requester_user_id)
+
+    def rebuild(self):
+        """pending 요청만 다시 읽어 큐 전체를 재구성 (쿼리 2회)"""
+        last_id = db.session.query(func.max(MatchRequests.id)).scalar() or 0
+        rows = self._pending_query()\
+                   .filter(MatchRequests.status == 'pending', MatchRequests.id <= last_id)\
+                   .order_by(MatchRequests.created_at.asc(), MatchRequests.id.asc())\
+                   .all()
+        with self._lock:
+            self._reset()
+            for row in rows:
+                self._add(PendingEntry(*row[:7]))
+            self.last_seen_id = last_id
+            self._built_at = time.monotonic()
+        return len(self.entries)
+
+    def catch_up(self):
+        """마지막으로 본 id 이후에 (다른 워커 포함) 생성된 요청을 반영"""
+        rows = self._pending_query()\
+                   .filter(MatchRequests.id > self.last_seen_id)\
+                   .order_by(MatchRequests.id.asc())\
+                   .all()
+        if not rows:
+            return
+        with self._lock:
+            for row in rows:
+                if row.status == 'pending':
+                    self._add(PendingEntry(*row[:7]))
+            self.last_seen_id = max(self.last_seen_id, rows[-1].id)
+
+    def ensure_fresh(self):
+        if self._built_at is None or time.monotonic() - self._built_at > self.max_age:
+            self.rebuild()
+        else:
+            self.catch_up()
+
+    def record_created(self, mr, requester):
+        """create_match_request 커밋 직후 호출"""
+        entry = PendingEntry(mr.id, mr.requester_user_id, requester.main_language, mr.preferred_college_id,
+                             mr.preferred_gender, requester.school_id, mr.created_at)
+        with self._lock:
+            self._add(entry)
+
+    def discard(self, request_ids):
+        """pending이 아니게 된 요청을 큐에서 제거 (offer / accept / 일괄 매칭 커밋 직후 호출)"""
+        with self._lock:
+            for request_id in request_ids:
+                self._remove(request_id)
+
+    def _add(self, entry):
+        if entry.id in self.entries:
+            return
+        self.entries[entry.id] = entry
+        key = queue_key(entry.language, entry.preferred_college_id, entry.preferred_gender)
+        insort(self.queues.setdefault(key, []), (entry.created_at, entry.id))
+
+    def _remove(self, request_id):
+        entry = self.entries.pop(request_id, None)
+        if entry is None:
+            return
+        key = queue_key(entry.language, entry.preferred_college_id, entry.preferred_gender)
+        queue = self.queues.get(key, [])
+        i = bisect_left(queue, (entry.created_at, entry.id))
+        if i < len(queue) and queue[i] == (entry.created_at, entry.id):
+            del queue[i]
+        if not queue:
+            self.queues.pop(key, None)
+
+    # --- 받은편지함 ---
+
+    @staticmethod
+    def helper_queue_keys(helper):
+        """도우미(HelperEntry)가 받을 수 있는 요청이 들어 있는 큐 키"""
+        colleges = (None, helper.college_id) if helper.college_id else (None,)
+        genders = ("any", helper.gender) if helper.gender in ("male", "female") else ("any",)
+        return [(language, college, gender)
+                for language in helper.languages for college in colleges for gender in genders]
+
+    def _collect(self, keys, after, count):
+        """여러 큐에서 after 이후 항목을 오래된 순으로 최대 count개 (큐마다 앞 count개만 복사해 병합)"""
+        with self._lock:
+            heads = []
+            for key in keys:
+                queue = self.queues.get(key)
+                if queue:
+                    start = 0 if after is None else bisect_right(queue, after)
+                    heads.append(queue[start:start + count])
+            return [self.entries[request_id] for _, request_id in heapq.merge(*heads)][:count]
+
+    def page(self, helper, limit, cursor=None):
+        """(대기 시간이 긴 순으로 최대 limit개의 (PendingEntry, 요청자 닉네임), 다음 페이지 커서 키 또는 None)
+
+        큐에서 꺼낸 후보의 현재 상태를 한 번에 확인하고, 다른 워커에서 이미 처리된 요청은
+        큐에서 지운 뒤 그만큼 더 꺼냅니다.
+        """
+        self.ensure_fresh()
+        keys = self.helper_queue_keys(helper)
+        result = []
+        after = cursor
+        while True:
+            want = limit + 1 - len(result)
+            candidates = self._collect(keys, after, want)
+            if not candidates:
+                break
+            rows = dict((rid, (status, nickname)) for rid, status, nickname in
+                        db.session.query(MatchRequests.id, MatchRequests.status, Users.nickname)
+                                  .join(Users, Users.id == MatchRequests.requester_user_id)
+                                  .filter(MatchRequests.id.in_([e.id for e in candidates]))
+                                  .all())
+            stale = {e.id for e in candidates if rows.get(e.id, (None,))[0] != 'pending'}
+            if stale:
+                self.discard(stale)
+            result.extend((e, rows[e.id][1]) for e in candidates if e.id not in stale)
+            after = (candidates[-1].created_at, candidates[-1].id)
+            if len(result) > limit or len(candidates) < want:
+                break
+
+        has_more = len(result) > limit
+        result = result[:limit]
+        next_key = (result[-1][0].created_at, result[-1][0].id) if has_more and result else None
+        return result, next_key
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pending": len(self.entries),
+                "queues": len(self.queues),
+                "last_seen_id": self.last_seen_id,
+                "age_seconds": (time.monotonic() - self._built_at) if self._built_at else None,
+            }
+
+
+request_queues = PendingRequestQueues()
@@ -0,0 +1,142 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from .version_stamp import VersionStamp
+
+
+class LocalVersionStore:
+    """게시판별 버전을 프로세스 메모리에 보관 (단일 워커/테스트용)
+
+    다른 워커에서 쓴 글은 버전을 올리지 못하므로 워커가 여러 개면 "file" 저장소를 쓰세요.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._versions = {}
+
+    def get(self, key):
+        """(version, 마지막 변경 시각) 반환"""
+        with self._lock:
+            return self._versions.get(key, (0, self._started_at))
+
+    def bump(self, key):
+        """버전을 1 올리고 새 버전 반환"""
+        with self._lock:
+            version, _ = self._versions.get(key, (0, self._started_at))
+            self._versions[key] = (version + 1, time.time())
+            return version + 1
+
+
+class FileVersionStore:
+    """게시판별 버전 파일(BOARD_CACHE_VERSION_DIR/<board_id>.version)에 든 버전 번호를 사용 (VersionStamp)
+
+    같은 호스트의 워커 프로세스가 모두 같은 파일을 보므로 어느 워커에서 글을 써도
+    ETag / Last-Modified가 함께 바뀝니다. 조회는 작은 파일 읽기 1회, bump는 잠금 아래 1 증가입니다.
+    파일이 없으면 처음 조회한 워커가 만들어 모든 워커가 같은 Last-Modified를 내보냅니다.
+    """
+
+    def __init__(self, app=None):
+        self.directory = app.config['BOARD_CACHE_VERSION_DIR'] if app is not None else "instance/board_versions"
+
+    def _stamp(self, key):
+        return VersionStamp(os.path.join(self.directory, f"{key}.version"))
+
+    def get(self, key):
+        """(version, 마지막 변경 시각) 반환"""
+        stamp = self._stamp(key)
+        state = stamp.read()
+        if state is None:
+            stamp.bump()
+            state = stamp.read()
+        return state
+
+    def bump(self, key):
+        """버전을 1 올리고 새 버전 반환"""
+        return self._stamp(key).bump()
+
+
+# 여러 호스트가 버전을 공유하려면 get/bump를 구현한 저장소(예: Redis INCR)를 등록
+VERSION_STORES = {
+    "local": LocalVersionStore,
+    "file": FileVersionStore,
+}
+
+
+class BoardPageCache:
+    """게시판 목록 응답(JSON bytes) LRU 캐시 + ETag 계산
+
+    ETag는 (게시판, 게시판 버전, TTL 구간, 요청 파라미터)에서 계산되므로
+    If-None-Match 비교와 캐시 조회 모두 DB 없이 처리됩니다.
+    글 작성/수정/삭제 시 invalidate(board_id)로 버전을 올리면 기존 ETag와 캐시 항목이 모두 무효화됩니다.
+    좋아요/댓글 수처럼 버전을 올리지 않는 변화는 최대 TTL 동안만 이전 값으로 보입니다.
+    """
+
+    def __init__(self):
+        self.maxsize = 1024
+        self.ttl = 30
+        self.versions = LocalVersionStore()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # etag -> JSON bytes
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def init_app(self, app):
+        self.maxsize = app.config['BOARD_CACHE_SIZE']
+        self.ttl = app.config['BOARD_CACHE_TTL']
+        self.versions = VERSION_STORES[app.config['BOARD_CACHE_BACKEND']](app)
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.not_modified = 0
+        app.extensions['board_page_cache'] = self
+
+    def validators(self, board_id, variant):
+        """현재 (ETag 값(따옴표 제외), Last-Modified epoch) 계산. 헤더에는 weak ETag(W/"...")로 내보냄"""
+        version, modified_at = self.versions.get(board_id)
+        bucket = int(time.time() // self.ttl) if self.ttl > 0 else 0
+        digest = hashlib.sha1(f"{board_id}:{version}:{bucket}:{variant}".encode("utf-8")).hexdigest()
+        return digest[:20], modified_at
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def get(self, etag):
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.hits += 1
+            return entry
+
+    def put(self, etag, body):
+        with self._lock:
+            self._entries[etag] = body
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, board_id):
+        """게시판 버전을 올리고 새 버전 반환"""
+        return self.versions.bump(board_id)
+
+    def stats(self):
+        with self._lock:
+            served = self.hits + self.not_modified
+            total = served + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "not_modified": self.not_modified,
+                "misses": self.misses,
+                "hit_ratio": (served / total) if total else 0.0,
+            }
+
+
+board_page_cache = BoardPageCache()
@@ -1,13 +1,24 @@
 from flask import Blueprint, request, jsonify, current_app
 from ..database import db
 from ..models import Users
-import bcrypt
+from ..principal_cache import principal_cache
+from ..hashing import password_hasher, HashPoolSaturated
+from ..rate_limit import rate_limited
+from ..auth_utils import require_role
 import jwt
 from datetime import datetime, timedelta, timezone
 
 # 'auth_bp'라는 이름의 블루프린트 생성
 auth_bp = Blueprint('auth_bp', __name__, url_prefix='/api/auth')
 
+
+@auth_bp.errorhandler(HashPoolSaturated)
+def handle_hash_pool_saturated(err):
+    """해싱 풀이 가득 찬 경우 잠시 후 재시도하도록 503 반환"""
+    response = jsonify({"error": "Server is busy, please retry shortly"})
+    response.headers["Retry-After"] = str(current_app.config['HASH_POOL_RETRY_AFTER'])
+    return response, 503
+
 @auth_bp.route("/register", methods=["POST"])
 def register():
     """회원가입 API"""
@@ -24,10 +35,7 @@ def register():
     if Users.query.filter_by(email=data['email']).first():
         return jsonify({"error": "Email already registered"}), 409
 
-    hashed_password = bcrypt.hashpw(
-        data['password'].encode('utf-8'), 
-        bcrypt.gensalt()
-    ).decode('utf-8')
+    hashed_password = password_hasher.hash_password(data['password'])
 
     new_user = Users(
         email=data['email'],
@@ -48,7 +56,12 @@ def register():
     return jsonify({"message": "User registered successfully"}), 201
 
 
+def _login_email():
+    return ((request.get_json(silent=True) or {}).get("email") or "").strip().lower() or None
+
+
 @auth_bp.route("/login", methods=["POST"])
+@rate_limited("login", user_key=_login_email) # 계정별 / IP별 bcrypt 시도 제한
 def login():
     """로그인 API - JWT 토큰 발급"""
     data = request.json
@@ -60,9 +73,18 @@ def login():
 
     user = Users.query.filter_by(email=email).first()
 
-    if not user or not bcrypt.checkpw(password.encode('utf-8'), user.password_hash.encode('utf-8')):
+    if not user or not password_hasher.check_password(password, user.password_hash):
         return jsonify({"error": "Invalid email or password"}), 401
 
+    # BCRYPT_ROUNDS가 바뀐 경우 로그인 성공 시점에 새 cost로 재해싱
+    # (풀이 바쁘면 다음 로그인으로 미룸)
+    if password_hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = password_hasher.hash_password(password)
+            db.session.commit()
+        except HashPoolSaturated:
+            pass
+
     token_payload = {
         "user_id": user.id,
         "sub": user.email,
@@ -72,4 +94,11 @@ def login():
     
     access_token = jwt.encode(token_payload, current_app.config['SECRET_KEY'], algorithm="HS256")
 
-    return jsonify({"access_token": access_token, "token_type": "bearer"}), 200
\ No newline at end of file
+    return jsonify({"access_token": access_token, "token_type": "bearer"}), 200
+
+
+@auth_bp.route("/principal-cache/stats", methods=["GET"])
+@require_role("admin")
+def principal_cache_stats():
+    """인증 사용자 캐시 적중/미스 카운터 (모니터링용)"""
+    return jsonify(principal_cache.stats()), 200
@@ -0,0 +1,51 @@
+from flask import Blueprint, jsonify, request, current_app
+from ..catalog import catalog
+
+catalog_bp = Blueprint('catalog_bp', __name__, url_prefix='/api/catalog')
+
+
+def _payload_response(payload):
+    """미리 계산된 JSON bytes 응답. ETag가 일치하면 304"""
+    headers = {
+        "ETag": f'"{payload.etag}"',
+        "Cache-Control": f"public, max-age={current_app.config['CATALOG_MAX_AGE']}",
+    }
+    if request.if_none_match.contains(payload.etag):
+        return current_app.response_class(status=304, headers=headers)
+    return current_app.response_class(payload.body, headers=headers, mimetype="application/json")
+
+
+@catalog_bp.route("/languages", methods=["GET"])
+def get_languages():
+    """언어 목록 (회원가입 드롭다운 등)"""
+    return _payload_response(catalog.payload("languages"))
+
+
+@catalog_bp.route("/countries", methods=["GET"])
+def get_countries():
+    """국가 목록"""
+    return _payload_response(catalog.payload("countries"))
+
+
+@catalog_bp.route("/schools", methods=["GET"])
+def get_schools():
+    """학교 목록"""
+    return _payload_response(catalog.payload("schools"))
+
+
+@catalog_bp.route("/schools/<int:school_id>/colleges", methods=["GET"])
+def get_colleges(school_id):
+    """학교의 단과대학 목록"""
+    payload = catalog.payload(("colleges", school_id))
+    if payload is None:
+        return jsonify({"error": "School not found"}), 404
+    return _payload_response(payload)
+
+
+@catalog_bp.route("/schools/<int:school_id>/departments", methods=["GET"])
+def get_departments(school_id):
+    """학교의 학과 목록 (college_id 포함)"""
+    payload = catalog.payload(("departments", school_id))
+    if payload is None:
+        return jsonify({"error": "School not found"}), 404
+    return _payload_response(payload)
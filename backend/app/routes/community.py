@@ -1,36 +1,115 @@
-from flask import Blueprint, jsonify, request
-from ..models import db, Boards, Posts
+from flask import Blueprint, jsonify, request, current_app
+from werkzeug.http import http_date
+from sqlalchemy import or_, and_
+from sqlalchemy.exc import IntegrityError
+from ..models import db, Users, Boards, Posts, PostLikes, Comments
 from ..schemas import post_schema, posts_schema
-from ..auth_utils import require_auth
+from ..auth_utils import require_auth, require_role
+from ..rate_limit import rate_limited
+from ..pagination import encode_cursor, decode_cursor, parse_limit
+from ..counters import post_counters
+from ..search import index_post, search_post_ids
+from ..serializers import post_list_query, serialize_post_row, dumps, json_response
+from ..response_cache import board_page_cache
+from ..home_feed import home_feed
+from ..translation import translation_service
+from ..catalog import catalog
 
 community_bp = Blueprint('community_bp', __name__, url_prefix='/api')
 
 @community_bp.route("/board/<int:board_id>/posts", methods=["GET"])
 def get_posts(board_id):
-    """특정 게시판의 글 목록 조회 (최신순 20개)"""
+    """특정 게시판의 글 목록 조회 (최신순, 커서 기반 페이지네이션)
+
+    - ?limit=N : 페이지 크기 (기본 POSTS_PAGE_SIZE, 최대 POSTS_MAX_PAGE_SIZE)
+    - ?cursor=... : 이전 응답의 next_cursor. (created_at, id) 기준으로 이어서 조회하므로
+      OFFSET과 달리 몇 번째 페이지든 인덱스 탐색 비용이 같습니다.
+    응답은 board_page_cache에 캐시되며, ETag가 일치하는 If-None-Match 요청에는 DB 조회 없이 304를 반환합니다.
+    """
+    return _board_page_response(board_id)
+
+
+@community_bp.route("/board/<int:board_id>/posts/translated", methods=["GET"])
+@require_auth
+def get_translated_posts(board_id):
+    """게시판 글 목록을 읽는 사람의 언어로 번역해서 반환
+
+    - ?lang=xx : 대상 언어 (기본: 로그인 사용자의 main_language)
+    - limit / cursor 는 글 목록 조회와 같음
+    각 글에 translated_title / translated_content / translated_lang 이 추가됩니다.
+    페이지의 미번역 문장은 번역 백엔드 한 번 호출로 처리하고, 결과는 (본문 해시, 언어) 단위로 캐시됩니다.
+    """
+    if not translation_service.enabled:
+        return jsonify({"error": "Translation is not configured"}), 503
+    lang = request.args.get("lang") or request.user.main_language
+    if not catalog.language(lang):
+        return jsonify({"error": "Unknown language"}), 400
+    return _board_page_response(board_id, variant=f"tr:{lang}",
+                                transform=lambda posts: translation_service.translate_posts(posts, lang))
+
+
+def _board_page_response(board_id, variant="", transform=None):
+    """게시판 한 페이지 응답 (커서 파싱 -> ETag/304 -> 응답 캐시 -> DB 조회 -> transform -> 캐시 저장)"""
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['POSTS_PAGE_SIZE'],
+                            current_app.config['POSTS_MAX_PAGE_SIZE'])
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    etag, last_modified = board_page_cache.validators(board_id, f"{cursor or ''}|{limit}|{variant}")
+    cache_headers = {"ETag": f'W/"{etag}"', "Last-Modified": http_date(last_modified),
+                     "Cache-Control": "no-cache"}
+
+    if request.if_none_match.contains_weak(etag):
+        board_page_cache.record_not_modified()
+        return current_app.response_class(status=304, headers=cache_headers)
+
+    body = board_page_cache.get(etag)
+    if body is not None:
+        return current_app.response_class(body, headers=cache_headers, mimetype="application/json")
     
     if not Boards.query.get(board_id):
         return jsonify({"error": "Board not found"}), 404
 
-    posts = Posts.query.filter_by(board_id=board_id)\
-                       .order_by(Posts.created_at.desc())\
-                       .limit(20)\
-                       .all()
+    q = post_list_query().filter(Posts.board_id == board_id)
+    if cursor:
+        q = q.filter(or_(
+            Posts.created_at < cursor_created_at,
+            and_(Posts.created_at == cursor_created_at, Posts.id < cursor_id)
+        ))
+
+    # 다음 페이지 존재 여부를 알기 위해 1개 더 조회
+    posts = q.order_by(Posts.created_at.desc(), Posts.id.desc())\
+             .limit(limit + 1)\
+             .all()
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        last = posts[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
     
-    # 익명 처리
-    result = []
-    for post in posts:
-        post_data = post_schema.dump(post)
-        if post.is_anonymous:
-            post_data['author'] = {"nickname": "익명"}
-            post_data['user_id'] = None
-        result.append(post_data)
+    # 직렬화 (익명 처리 포함)
+    result = [serialize_post_row(row) for row in posts]
+    if transform is not None:
+        result = transform(result)
 
-    return jsonify(result), 200
+    body = dumps({"posts": result, "next_cursor": next_cursor})
+    board_page_cache.put(etag, body)
+    return current_app.response_class(body, headers=cache_headers, mimetype="application/json")
 
 
 @community_bp.route("/board/<int:board_id>/posts", methods=["POST"])
 @require_auth # 로그인 필수
+@rate_limited("create_post")
 def create_post(board_id):
     """특정 게시판에 새 글 작성"""
     data = request.json
@@ -43,6 +122,10 @@ def create_post(board_id):
 
     user = request.user
 
+    board = Boards.query.get(board_id)
+    if not board:
+        return jsonify({"error": "Board not found"}), 404
+
     new_post = Posts(
         board_id=board_id,
         user_id=user.id,
@@ -53,6 +136,199 @@ def create_post(board_id):
     )
     
     db.session.add(new_post)
+    db.session.flush()
+    index_post(new_post, board.community_id) # 검색 색인도 같은 트랜잭션으로 저장
     db.session.commit()
+    version = board_page_cache.invalidate(board_id) # 게시판 목록 캐시/ETag 무효화
+    home_feed.record_post(board_id, new_post.created_at, new_post.id, version)
+    # 다른 언어 번역을 백그라운드에서 미리 캐시
+    translation_service.warm_post(title, content, new_post.original_lang,
+                                  [l.code for l in catalog.snapshot.languages])
     
-    return post_schema.jsonify(new_post), 201
\ No newline at end of file
+    return post_schema.jsonify(new_post), 201
+
+
+@community_bp.route("/feed/home", methods=["GET"])
+@require_auth
+def get_home_feed():
+    """내 커뮤니티(같은 학교 + 같은 국적)의 모든 게시판 글을 최신순으로 합친 홈 피드
+
+    - ?limit=N : 페이지 크기 (기본 HOME_FEED_PAGE_SIZE, 최대 HOME_FEED_MAX_PAGE_SIZE)
+    - ?cursor=... : 이전 응답의 next_cursor
+    게시판 수와 관계없이 요청 한 번, 게시판 목록 조회 + 페이지 글 조회 두 번의 쿼리로 처리됩니다.
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['HOME_FEED_PAGE_SIZE'],
+                            current_app.config['HOME_FEED_MAX_PAGE_SIZE'])
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            cursor = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+    else:
+        cursor = None
+
+    board_ids = home_feed.board_ids_for(request.user)
+    posts, next_key = home_feed.page(board_ids, limit, cursor)
+    next_cursor = encode_cursor(*next_key) if next_key else None
+    return json_response({"posts": posts, "next_cursor": next_cursor})
+
+
+@community_bp.route("/feed/home/stats", methods=["GET"])
+@require_role("admin")
+def home_feed_stats():
+    """홈 피드 링 사용 현황 (메모리 병합 / DB 폴백 페이지 수)"""
+    return jsonify(home_feed.stats()), 200
+
+
+@community_bp.route("/posts/<int:post_id>/like", methods=["POST"])
+@require_auth
+def like_post(post_id):
+    """글 좋아요 (이미 누른 경우 변화 없음)"""
+    user = request.user
+    if not Posts.query.get(post_id):
+        return jsonify({"error": "Post not found"}), 404
+
+    db.session.add(PostLikes(post_id=post_id, user_id=user.id))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"post_id": post_id, "liked": True}), 200
+
+    post_counters.add(post_id, "like_count", 1)
+    return jsonify({"post_id": post_id, "liked": True}), 201
+
+
+@community_bp.route("/posts/<int:post_id>/like", methods=["DELETE"])
+@require_auth
+def unlike_post(post_id):
+    """글 좋아요 취소"""
+    user = request.user
+    deleted = PostLikes.query.filter_by(post_id=post_id, user_id=user.id)\
+                             .delete(synchronize_session=False)
+    db.session.commit()
+
+    if deleted:
+        post_counters.add(post_id, "like_count", -deleted)
+    return jsonify({"post_id": post_id, "liked": False}), 200
+
+
+@community_bp.route("/posts/<int:post_id>/comments", methods=["POST"])
+@require_auth
+def create_comment(post_id):
+    """글에 댓글 작성"""
+    data = request.json or {}
+    content = data.get("content")
+    is_anonymous = data.get("is_anonymous", False)
+    if not content:
+        return jsonify({"error": "Content is required"}), 400
+
+    user = request.user
+    if not Posts.query.get(post_id):
+        return jsonify({"error": "Post not found"}), 404
+
+    comment = Comments(post_id=post_id, user_id=user.id, content=content,
+                       is_anonymous=is_anonymous)
+    db.session.add(comment)
+    db.session.commit()
+
+    post_counters.add(post_id, "comment_count", 1)
+    return jsonify({"id": comment.id, "post_id": post_id,
+                    "created_at": comment.created_at.isoformat()}), 201
+
+
+@community_bp.route("/posts/<int:post_id>/comments", methods=["GET"])
+def get_comments(post_id):
+    """글의 댓글 목록 (오래된 순, ?after_id= 로 이어서 조회)"""
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['COMMENTS_PAGE_SIZE'],
+                            current_app.config['COMMENTS_MAX_PAGE_SIZE'])
+        after_id = request.args.get("after_id")
+        after_id = int(after_id) if after_id is not None else None
+    except ValueError:
+        return jsonify({"error": "limit and after_id must be integers"}), 400
+
+    q = db.session.query(Comments, Users.nickname)\
+                  .join(Users, Users.id == Comments.user_id)\
+                  .filter(Comments.post_id == post_id)
+    if after_id is not None:
+        q = q.filter(Comments.id > after_id)
+    rows = q.order_by(Comments.id.asc()).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    result = []
+    for comment, nickname in rows[:limit]:
+        result.append({
+            "id": comment.id,
+            "post_id": comment.post_id,
+            "user_id": None if comment.is_anonymous else comment.user_id,
+            "author": {"nickname": "익명" if comment.is_anonymous else nickname},
+            "content": comment.content,
+            "created_at": comment.created_at.isoformat(),
+        })
+
+    return jsonify({"comments": result, "has_more": has_more}), 200
+
+
+@community_bp.route("/search/posts", methods=["GET"])
+def search_posts():
+    """게시글 검색 (제목 + 본문)
+
+    - ?q=검색어 (필수) / ?board_id= 또는 ?community_id= 로 범위 지정
+    - ?page=1&limit=20 : 점수순 결과의 페이지
+    역색인(post_search_terms)만 사용하며 LIKE 스캔은 하지 않습니다.
+    """
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['SEARCH_PAGE_SIZE'],
+                            current_app.config['SEARCH_MAX_PAGE_SIZE'])
+        page = max(1, int(request.args.get("page", 1)))
+        board_id = request.args.get("board_id")
+        board_id = int(board_id) if board_id is not None else None
+        community_id = request.args.get("community_id")
+        community_id = int(community_id) if community_id is not None else None
+    except ValueError:
+        return jsonify({"error": "page, limit, board_id and community_id must be integers"}), 400
+
+    hits, has_more = search_post_ids(query, board_id=board_id, community_id=community_id,
+                                     offset=(page - 1) * limit, limit=limit)
+
+    rows = {}
+    if hits:
+        rows = {row[0]: row for row in
+                post_list_query().filter(Posts.id.in_([pid for pid, _ in hits])).all()}
+    result = []
+    for post_id, score in hits:
+        row = rows.get(post_id)
+        if row is None:
+            continue
+        post_data = serialize_post_row(row)
+        post_data['score'] = score
+        result.append(post_data)
+
+    return json_response({"posts": result, "page": page, "has_more": has_more})
+
+
+@community_bp.route("/board-cache/stats", methods=["GET"])
+@require_role("admin")
+def board_cache_stats():
+    """게시판 목록 응답 캐시 적중률 (모니터링용)"""
+    return jsonify(board_page_cache.stats()), 200
+
+
+@community_bp.route("/translation-cache/stats", methods=["GET"])
+@require_role("admin")
+def translation_cache_stats():
+    """번역 캐시 적중률 / 번역 백엔드 호출 수 (모니터링용)"""
+    return jsonify(translation_service.stats()), 200
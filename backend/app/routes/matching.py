@@ -1,13 +1,27 @@
-from flask import Blueprint, jsonify, request
-from ..models import (db, Users, Departments, HelperProfiles, HelperLanguages, 
+import time
+from datetime import datetime
+from flask import Blueprint, Response, jsonify, request, current_app
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from ..models import (db, Users, 
                        MatchRequests, Matches, Conversations, ConversationParticipants, Messages)
-from ..auth_utils import require_auth
+from ..auth_utils import require_auth, require_role
+from ..rate_limit import rate_limited
+from ..pagination import parse_limit, encode_cursor, decode_cursor
+from ..broker import broker, conversation_channel, format_sse, message_event
+from ..helper_index import helper_index
+from ..request_queues import request_queues
+from ..inbox import inbox_for, mark_read, record_new_message
+from ..message_archive import message_archive
+from ..message_writer import message_writer, MessageWriteTimeout
 
 matching_bp = Blueprint('matching_bp', __name__, url_prefix='/api')
 
+
 # 1) 매칭 요청 생성
 @matching_bp.route("/match_requests", methods=["POST"])
 @require_auth # 로그인 필수
+@rate_limited("create_match_request")
 def create_match_request():
     data = request.json or {}
     user = request.user 
@@ -32,41 +46,101 @@ def create_match_request():
     )
     db.session.add(mr)
     db.session.commit()
+    request_queues.record_created(mr, user) # 도우미 받은편지함 큐에 추가
     return jsonify({"id": mr.id, "status": mr.status}), 201
 
 
-# 2) 도우미 후보 검색 (오류 수정됨)
+# 2) 도우미 후보 검색 (인메모리 색인 사용)
 @matching_bp.route("/match_requests/<int:request_id>/find_helpers", methods=["GET"])
 @require_auth 
 def find_helpers_for_request(request_id):
+    """요청 조건(언어, 선호 성별, 선호 단과대학)에 맞는 도우미 후보를 순위대로 반환
+
+    DB 조인 대신 helper_index의 집합 교집합으로 후보를 찾고
+    언어 일치 > 같은 학교 > 진행 중 매칭 수 > 프로필 최신순으로 정렬합니다.
+    """
     mr = MatchRequests.query.get(request_id)
     if not mr:
         return jsonify({"error": "request not found"}), 404
 
     requester = Users.query.get(mr.requester_user_id)
     requester_lang = requester.main_language if requester else None
-    
-    q = db.session.query(Users).join(HelperProfiles, HelperProfiles.user_id == Users.id)
-    q = q.filter(Users.is_helper == True)
-    
-    if requester_lang:
-        q = q.join(HelperLanguages, HelperLanguages.user_id == Users.id)
-        q = q.filter(HelperLanguages.language_code == requester_lang)
 
-    if mr.preferred_gender and mr.preferred_gender != "any":
-        q = q.filter(Users.gender == mr.preferred_gender)
+    try:
+        limit = int(request.args.get("limit", 10))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
 
-    if mr.preferred_college_id:
-        q = q.join(Departments, Users.department_id == Departments.id)
-        q = q.filter(Departments.college_id == mr.preferred_college_id)
-
-    limit = int(request.args.get("limit", 10))
-    helpers = q.limit(limit).all()
+    helpers = helper_index.candidates(
+        language=requester_lang,
+        gender=mr.preferred_gender,
+        college_id=mr.preferred_college_id,
+        school_id=requester.school_id if requester else None,
+        limit=limit
+    )
     
     results = [{"id": h.id, "nickname": h.nickname} for h in helpers]
     return jsonify(results), 200
 
 
+# 2-1) 도우미 받은편지함 (내가 받을 수 있는 pending 요청)
+@matching_bp.route("/match_requests/helper_inbox", methods=["GET"])
+@require_auth
+def helper_inbox():
+    """내 언어(HelperLanguages) / 단과대학 / 성별 조건에 맞는 pending 요청을 오래 기다린 순으로 반환
+
+    - ?limit=N : 페이지 크기 (기본 HELPER_INBOX_PAGE_SIZE, 최대 HELPER_INBOX_MAX_PAGE_SIZE)
+    - ?cursor=... : 이전 응답의 next_cursor
+    match_requests 테이블을 훑지 않고 request_queues의 언어/단과대학별 큐만 병합합니다.
+    """
+    user = request.user
+    if not user.is_helper:
+        return jsonify({"error": "Only helpers have a match request inbox"}), 403
+
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['HELPER_INBOX_PAGE_SIZE'],
+                            current_app.config['HELPER_INBOX_MAX_PAGE_SIZE'])
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            cursor = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+    else:
+        cursor = None
+
+    helper_index.ensure_fresh()
+    helper = helper_index.helpers.get(user.id)
+    if helper is None:
+        return jsonify({"requests": [], "next_cursor": None}), 200
+
+    entries, next_key = request_queues.page(helper, limit, cursor)
+    now = datetime.utcnow()
+    results = [{
+        "id": e.id,
+        "requester": {"id": e.requester_user_id, "nickname": nickname},
+        "language": e.language,
+        "preferred_college_id": e.preferred_college_id,
+        "preferred_gender": e.preferred_gender,
+        "same_school": e.school_id == helper.school_id,
+        "created_at": e.created_at.isoformat(),
+        "waiting_seconds": int((now - e.created_at).total_seconds()),
+    } for e, nickname in entries]
+    next_cursor = encode_cursor(*next_key) if next_key else None
+    return jsonify({"requests": results, "next_cursor": next_cursor}), 200
+
+
+@matching_bp.route("/match_requests/queues/stats", methods=["GET"])
+@require_role("admin")
+def request_queue_stats():
+    """도우미 받은편지함 큐 현황 (워커 프로세스별 값, 운영자 전용)"""
+    return jsonify(request_queues.stats()), 200
+
+
 # 3) 매칭 제안(offer) 생성
 @matching_bp.route("/match_requests/<int:request_id>/offer", methods=["POST"])
 @require_auth
@@ -81,53 +155,175 @@ def offer_match(request_id):
         return jsonify({"error": "request not found"}), 404
     
     mr.status = "offered"
+    mr.offered_mentor_user_id = mentor_user_id
     db.session.commit()
+    request_queues.discard([mr.id])
     return jsonify({"request_id": mr.id, "status": mr.status, "offered_to": mentor_user_id}), 200
 
 
+def _new_conversation(request_id, mentor_user_id, mentee_user_id, school_id):
+    """Matches + Conversations + 참여자 2명을 관계로 묶어 한 번의 flush로 저장되도록 구성"""
+    match = Matches(
+        mentor_user_id=mentor_user_id,
+        mentee_user_id=mentee_user_id,
+        school_id=school_id,
+        request_id=request_id,
+        status='active'
+    )
+    return Conversations(match=match, participants=[
+        ConversationParticipants(user_id=mentor_user_id),
+        ConversationParticipants(user_id=mentee_user_id),
+    ])
+
+
+def _accepted_conversations(request_ids):
+    """이미 수락된 요청들의 {request_id: (match_id, mentor_user_id, conversation_id)}"""
+    rows = db.session.query(Matches.request_id, Matches.id, Matches.mentor_user_id, Conversations.id)\
+                     .join(Conversations, Conversations.match_id == Matches.id)\
+                     .filter(Matches.request_id.in_(request_ids))\
+                     .all()
+    return {rid: (match_id, mentor_id, conv_id) for rid, match_id, mentor_id, conv_id in rows}
+
+
+def _replay_acceptance(request_id, mentor_user_id):
+    """같은 수락 요청의 재시도면 최초 결과를 그대로 반환"""
+    existing = _accepted_conversations([request_id]).get(request_id)
+    if not existing:
+        return jsonify({"error": "invalid request status, must be 'offered'"}), 400
+    match_id, accepted_mentor_id, conv_id = existing
+    if accepted_mentor_id != mentor_user_id:
+        return jsonify({"error": "request already accepted with another mentor"}), 409
+    return jsonify({"match_id": match_id, "conversation_id": conv_id}), 200
+
+
 # 4) 매칭 수락 및 대화방 생성
 @matching_bp.route("/match_requests/<int:request_id>/accept", methods=["POST"])
 @require_auth 
 def accept_match(request_id):
+    """매칭 수락 및 대화방 생성 (단일 트랜잭션, 멱등)
+
+    요청 상태 전환은 'offered'일 때만 성공하는 조건부 UPDATE로 처리하여 동시 수락 중
+    하나만 통과합니다. Matches / Conversations / 참여자는 한 번의 flush + commit으로 저장됩니다.
+    요청 id가 멱등 키 역할을 하므로, 같은 mentor로 재시도하면 최초 결과를 200으로 돌려줍니다.
+    """
+    data = request.json or {}
+    mentor_user_id = data.get("mentor_user_id")
+    if not mentor_user_id:
+         return jsonify({"error": "mentor_user_id required for accept"}), 400
+    try:
+        mentor_user_id = int(mentor_user_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "mentor_user_id must be an integer"}), 400
+
     mr = MatchRequests.query.get(request_id)
     if not mr:
         return jsonify({"error": "request not found"}), 404
+    if mr.status == 'accepted':
+        return _replay_acceptance(request_id, mentor_user_id)
     if mr.status != 'offered':
         return jsonify({"error": "invalid request status, must be 'offered'"}), 400
+    if mr.offered_mentor_user_id is not None and mr.offered_mentor_user_id != mentor_user_id:
+        return jsonify({"error": "mentor_user_id does not match the offer"}), 400
 
-    data = request.json or {}
-    mentor_user_id = data.get("mentor_user_id")
-    if not mentor_user_id:
-         return jsonify({"error": "mentor_user_id required for accept"}), 400
+    mentee_user_id = mr.requester_user_id
+    school_id = mr.requester.school_id
 
-    match = Matches(
-        mentor_user_id=mentor_user_id,
-        mentee_user_id=mr.requester_user_id,
-        school_id=mr.requester.school_id, 
-        request_id=mr.id,
-        status='active'
-    )
-    db.session.add(match)
-    
-    mr.status = 'accepted'
-    db.session.commit() 
+    claimed = db.session.execute(
+        update(MatchRequests)
+        .where(MatchRequests.id == request_id, MatchRequests.status == 'offered')
+        .values(status='accepted')
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not claimed:
+        # 다른 요청이 먼저 수락함
+        db.session.rollback()
+        return _replay_acceptance(request_id, mentor_user_id)
 
-    conv = Conversations(match_id=match.id)
+    conv = _new_conversation(request_id, mentor_user_id, mentee_user_id, school_id)
     db.session.add(conv)
-    db.session.commit() 
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return _replay_acceptance(request_id, mentor_user_id)
+    request_queues.discard([request_id])
 
-    p1 = ConversationParticipants(conversation_id=conv.id, user_id=mentor_user_id)
-    p2 = ConversationParticipants(conversation_id=conv.id, user_id=mr.requester_user_id)
-    db.session.add_all([p1, p2])
-    
+    return jsonify({"match_id": conv.match_id, "conversation_id": conv.id}), 201
+
+
+# 4-1) 관리자 도구용 일괄 수락
+@matching_bp.route("/match_requests/accept_bulk", methods=["POST"])
+@require_role("admin", "coordinator")
+def accept_matches_bulk():
+    """여러 매칭 제안을 한 트랜잭션으로 수락 (운영자 / 매칭 코디네이터 전용)
+
+    body: {"items": [{"request_id": 1, "mentor_user_id": 2}, ...]}
+    mentor_user_id를 생략하면 제안된 도우미(offered_mentor_user_id)로 수락합니다.
+    대상 요청 행은 SELECT ... FOR UPDATE로 잠근 뒤 상태 전환 UPDATE 1회, commit 1회로 처리하며
+    이미 수락된 요청은 기존 결과를 그대로 돌려줍니다.
+    """
+    items = (request.json or {}).get("items") or []
+    wanted = {}
+    try:
+        for item in items:
+            mentor = item.get("mentor_user_id")
+            wanted[int(item["request_id"])] = int(mentor) if mentor is not None else None
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return jsonify({"error": "each item needs an integer request_id"}), 400
+    if not wanted:
+        return jsonify({"error": "items required"}), 400
+
+    # FOR UPDATE OF match_requests 로 users 행은 잠그지 않음 (OF 절은 MySQL 8.0 이상 / PostgreSQL, SQLite는 무시)
+    rows = db.session.query(MatchRequests.id, MatchRequests.requester_user_id,
+                            MatchRequests.offered_mentor_user_id, Users.school_id)\
+                     .join(Users, Users.id == MatchRequests.requester_user_id)\
+                     .filter(MatchRequests.id.in_(list(wanted)), MatchRequests.status == 'offered')\
+                     .with_for_update(of=MatchRequests)\
+                     .all()
+
+    results = {}
+    convs = []
+    for rid, mentee_id, offered_mentor_id, school_id in rows:
+        mentor_id = wanted[rid] or offered_mentor_id
+        if mentor_id is None:
+            results[rid] = {"request_id": rid, "error": "mentor_user_id required"}
+        elif offered_mentor_id is not None and mentor_id != offered_mentor_id:
+            results[rid] = {"request_id": rid, "error": "mentor_user_id does not match the offer"}
+        else:
+            convs.append((rid, _new_conversation(rid, mentor_id, mentee_id, school_id)))
+
+    if convs:
+        db.session.execute(
+            update(MatchRequests)
+            .where(MatchRequests.id.in_([rid for rid, _ in convs]))
+            .values(status='accepted')
+            .execution_options(synchronize_session=False)
+        )
+        db.session.add_all([conv for _, conv in convs])
     db.session.commit()
+    request_queues.discard([rid for rid, _ in convs])
+
+    for rid, conv in convs:
+        results[rid] = {"request_id": rid, "status": "accepted",
+                        "match_id": conv.match_id, "conversation_id": conv.id}
 
-    return jsonify({"match_id": match.id, "conversation_id": conv.id}), 201
+    missing = [rid for rid in wanted if rid not in results]
+    accepted = _accepted_conversations(missing) if missing else {}
+    for rid in missing:
+        if rid in accepted:
+            match_id, _, conv_id = accepted[rid]
+            results[rid] = {"request_id": rid, "status": "accepted",
+                            "match_id": match_id, "conversation_id": conv_id}
+        else:
+            results[rid] = {"request_id": rid, "error": "request not found or not offered"}
+
+    return jsonify({"results": [results[rid] for rid in wanted]}), 200
 
 
 # 5) 메시지 전송
 @matching_bp.route("/conversations/<int:conv_id>/messages", methods=["POST"])
 @require_auth
+@rate_limited("send_message")
 def send_message(conv_id):
     user = request.user
     data = request.json or {}
@@ -143,35 +339,217 @@ def send_message(conv_id):
     if not participant:
         return jsonify({"error": "You are not a participant in this conversation"}), 403
 
-    msg = Messages(
-        conversation_id=conv_id, 
-        sender_user_id=user.id, 
-        content=content
-    )
-    db.session.add(msg)
-    db.session.commit()
+    if message_writer.enabled:
+        # group commit: 다른 요청의 메시지와 한 트랜잭션으로 묶여 커밋될 때까지 대기
+        try:
+            msg = message_writer.write(conv_id, user.id, content)
+        except MessageWriteTimeout:
+            response = jsonify({"error": "Message could not be saved in time, please retry"})
+            response.headers["Retry-After"] = "1"
+            return response, 503
+    else:
+        msg = Messages(
+            conversation_id=conv_id, 
+            sender_user_id=user.id, 
+            content=content
+        )
+        db.session.add(msg)
+        db.session.flush()
+        record_new_message(conv_id, msg.id, user.id) # 마지막 메시지 / 안 읽은 수 갱신
+        db.session.commit()
+
+    # 스트림(SSE) 구독자에게 커밋된 메시지 전달
+    broker.publish(conversation_channel(conv_id), message_event(msg))
     
     return jsonify({"message_id": msg.id, "created_at": msg.created_at.isoformat()}), 201
 
 
+def _messages_after(conv_id, archived_until, after_id, limit, before_id=None):
+    """after_id 이후 메시지를 오래된 순으로 최대 limit개 (archived_until_id 이하는 세그먼트 파일에서 읽어 앞에 붙임)"""
+    msgs = []
+    if archived_until is not None and after_id < archived_until:
+        msgs = message_archive.read(conv_id, after_id=after_id, before_id=before_id, limit=limit)
+    if len(msgs) < limit:
+        q = Messages.query.filter(Messages.conversation_id == conv_id, Messages.id > after_id)
+        if before_id is not None:
+            q = q.filter(Messages.id < before_id)
+        msgs += q.order_by(Messages.id.asc()).limit(limit - len(msgs)).all()
+    return msgs
+
+
 # 6) 대화 메시지 조회
 @matching_bp.route("/conversations/<int:conv_id>/messages", methods=["GET"])
 @require_auth
 def get_messages(conv_id):
+    """대화 메시지 조회
+
+    - ?after_id=N : N 이후의 새 메시지만 (폴링 시 마지막으로 받은 id 전달)
+    - ?before_id=N : N 이전의 과거 메시지 (위로 스크롤)
+    - ?limit=N : 최대 개수 (기본 MESSAGES_PAGE_SIZE)
+    has_more가 true이면 같은 방향으로 더 가져올 메시지가 있습니다.
+    아카이브된(archived_until_id 이하) 메시지는 세그먼트 파일에서 읽어 이어 붙입니다.
+    """
     user = request.user
     
+    participant = db.session.query(ConversationParticipants.id, Conversations.archived_until_id)\
+                            .join(Conversations, Conversations.id == ConversationParticipants.conversation_id)\
+                            .filter(ConversationParticipants.conversation_id == conv_id,
+                                    ConversationParticipants.user_id == user.id)\
+                            .first()
+    if not participant:
+        return jsonify({"error": "You are not a participant in this conversation"}), 403
+    archived_until = participant.archived_until_id
+
+    try:
+        limit = parse_limit(request.args.get("limit"),
+                            current_app.config['MESSAGES_PAGE_SIZE'],
+                            current_app.config['MESSAGES_MAX_PAGE_SIZE'])
+        after_id = request.args.get("after_id")
+        after_id = int(after_id) if after_id is not None else None
+        before_id = request.args.get("before_id")
+        before_id = int(before_id) if before_id is not None else None
+    except ValueError:
+        return jsonify({"error": "limit, after_id and before_id must be integers"}), 400
+
+    # after_id: 그 이후 새 메시지를 오래된 순으로 (폴링용)
+    # 그 외: before_id 이전(없으면 최신) 메시지를 최신 순으로 잘라온 뒤 뒤집음 (과거 스크롤용)
+    # 아카이브 메시지의 id는 항상 테이블에 남은 메시지보다 작으므로 앞/뒤에 이어 붙이기만 하면 됨
+    if after_id is not None:
+        msgs = _messages_after(conv_id, archived_until, after_id, limit + 1, before_id=before_id)
+        has_more = len(msgs) > limit
+        msgs = msgs[:limit]
+    else:
+        q = Messages.query.filter_by(conversation_id=conv_id)
+        if before_id is not None:
+            q = q.filter(Messages.id < before_id)
+        msgs = q.order_by(Messages.id.desc()).limit(limit + 1).all()
+        if len(msgs) <= limit and archived_until is not None:
+            msgs += message_archive.read(conv_id, before_id=before_id, limit=limit + 1 - len(msgs),
+                                         newest_first=True)
+        has_more = len(msgs) > limit
+        msgs = list(reversed(msgs[:limit]))
+    
+    out = [message_event(m) for m in msgs]
+    
+    return jsonify({"messages": out, "has_more": has_more}), 200
+
+
+# 7) 대화 메시지 실시간 수신 (Server-Sent Events)
+@matching_bp.route("/conversations/<int:conv_id>/stream", methods=["GET"])
+@require_auth
+def stream_messages(conv_id):
+    """새 메시지를 SSE(text/event-stream)로 푸시
+
+    참여자 확인은 연결 시 한 번만 하고, 이후에는 DB를 거치지 않고 브로커 이벤트만 전달합니다.
+    재연결 시 Last-Event-ID 헤더(또는 ?after_id)를 주면 그 사이 놓친 메시지를 (아카이브 구간 포함) 먼저 보내줍니다.
+    놓친 메시지가 너무 많거나 수신이 밀리면 'resync' 이벤트 후 연결을 끊으므로
+    클라이언트는 GET /messages?after_id=... 로 따라잡은 뒤 다시 연결하면 됩니다.
+    """
+    user = request.user
+
+    participant = db.session.query(ConversationParticipants.id, Conversations.archived_until_id)\
+                            .join(Conversations, Conversations.id == ConversationParticipants.conversation_id)\
+                            .filter(ConversationParticipants.conversation_id == conv_id,
+                                    ConversationParticipants.user_id == user.id)\
+                            .first()
+    if not participant:
+        return jsonify({"error": "You are not a participant in this conversation"}), 403
+
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("after_id")
+    try:
+        last_id = int(last_id) if last_id is not None else None
+    except ValueError:
+        return jsonify({"error": "after_id must be an integer"}), 400
+
+    backlog_limit = current_app.config['MESSAGES_MAX_PAGE_SIZE']
+    heartbeat = current_app.config['MESSAGE_STREAM_HEARTBEAT_SECONDS']
+    max_seconds = current_app.config['MESSAGE_STREAM_MAX_SECONDS']
+
+    # 백필 조회 전에 먼저 구독해야 조회와 구독 사이에 보낸 메시지를 놓치지 않음
+    sub = broker.subscribe(conversation_channel(conv_id))
+    try:
+        backlog = []
+        if last_id is not None:
+            msgs = _messages_after(conv_id, participant.archived_until_id, last_id, backlog_limit + 1)
+            backlog = [message_event(m) for m in msgs]
+    except Exception:
+        sub.close()
+        raise
+
+    def generate():
+        try:
+            if len(backlog) > backlog_limit:
+                yield format_sse({"reason": "backlog"}, event="resync")
+                return
+
+            sent_id = last_id or 0
+            for event in backlog:
+                sent_id = event["id"]
+                yield format_sse(event, event="message", event_id=event["id"])
+
+            deadline = time.monotonic() + max_seconds
+            while time.monotonic() < deadline:
+                if sub.overflowed:
+                    yield format_sse({"reason": "overflow"}, event="resync")
+                    return
+                event = sub.get(timeout=heartbeat)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event["id"] <= sent_id:  # 백필과 중복된 이벤트
+                    continue
+                sent_id = event["id"]
+                yield format_sse(event, event="message", event_id=event["id"])
+        finally:
+            sub.close()
+
+    return Response(generate(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# 8) 받은편지함 (대화방 목록 + 마지막 메시지 + 안 읽은 수)
+@matching_bp.route("/conversations", methods=["GET"])
+@require_auth
+def get_inbox():
+    """내 대화방 목록을 최근 활동순으로 반환
+
+    참여자별 unread_count와 대화방의 last_message_id를 메시지 전송 시 갱신해 두므로
+    메시지 수와 관계없이 대화방 수에 비례하는 쿼리 한 번으로 처리됩니다.
+    """
+    user = request.user
+    return jsonify({"conversations": inbox_for(user.id)}), 200
+
+
+# 9) 읽음 처리
+@matching_bp.route("/conversations/<int:conv_id>/read", methods=["POST"])
+@require_auth
+def mark_conversation_read(conv_id):
+    """last_read_at을 앞으로 옮기고 안 읽은 수를 갱신
+
+    body(선택): {"message_id": N} - N번 메시지까지 읽음. 생략하면 전부 읽음.
+    """
+    user = request.user
+    data = request.json or {}
+
     participant = ConversationParticipants.query.filter_by(
-        conversation_id=conv_id, 
+        conversation_id=conv_id,
         user_id=user.id
     ).first()
     if not participant:
         return jsonify({"error": "You are not a participant in this conversation"}), 403
 
-    msgs = Messages.query.filter_by(conversation_id=conv_id)\
-                         .order_by(Messages.created_at.asc())\
-                         .all()
-    
-    out = [{"id": m.id, "sender_user_id": m.sender_user_id, "content": m.content,
-            "created_at": m.created_at.isoformat()} for m in msgs]
-    
-    return jsonify(out), 200
\ No newline at end of file
+    message_id = data.get("message_id")
+    try:
+        message_id = int(message_id) if message_id is not None else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "message_id must be an integer"}), 400
+
+    if mark_read(participant, message_id) is None:
+        return jsonify({"error": "message not found in this conversation"}), 404
+    db.session.commit()
+
+    return jsonify({
+        "conversation_id": conv_id,
+        "last_read_at": participant.last_read_at.isoformat() if participant.last_read_at else None,
+        "unread_count": participant.unread_count
+    }), 200
@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify, request
-from ..models import Schools
+from ..catalog import catalog
 from ..auth_utils import require_auth
 
 school_bp = Blueprint('school_bp', __name__, url_prefix='/api/school')
@@ -10,7 +10,7 @@ def get_my_school_homepage_translation():
     """로그인한 사용자의 학교 홈페이지 번역 URL 반환"""
     
     user = request.user 
-    school = Schools.query.get(user.school_id)
+    school = catalog.school(user.school_id)
 
     if not school or not school.website_url:
         return jsonify({"error": "School website URL not found"}), 404
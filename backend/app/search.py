@@ -0,0 +1,132 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from itertools import groupby
+from sqlalchemy import case, distinct, func
+from .database import db
+from .models import Boards, Posts, PostSearchTerms
+
+MAX_TERM_LEN = 32
+
+# 띄어쓰기로 단어가 잘 나뉘지 않는 문자(한글, 한자, 가나, 태국어, 미얀마어)는 2-gram으로 색인
+_NGRAM_RANGES = (
+    ("\u1100", "\u11ff"), ("\u3130", "\u318f"), ("\uac00", "\ud7a3"),  # 한글
+    ("\u3040", "\u30ff"),                                 # 히라가나/가타카나
+    ("\u3400", "\u4dbf"), ("\u4e00", "\u9fff"),           # 한자
+    ("\u0e00", "\u0e7f"),                                 # 태국어
+    ("\u1000", "\u109f"),                                 # 미얀마어
+)
+_RUN_RE = re.compile(r"[\w\u0e00-\u0e7f\u1000-\u109f]+")
+
+
+def _is_ngram_char(ch):
+    return any(lo <= ch <= hi for lo, hi in _NGRAM_RANGES)
+
+
+def tokenize(text):
+    """텍스트를 검색어 빈도(Counter)로 변환
+
+    NFKC 정규화 + 소문자화 후, 라틴 문자 등은 단어 단위로, 한글/CJK 등은 2-gram으로 자릅니다.
+    한 글자짜리 한글/CJK 구간은 그 글자 자체가 term이 됩니다.
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    terms = Counter()
+    for run in _RUN_RE.findall(text):
+        for is_ngram, chars in groupby(run, key=_is_ngram_char):
+            segment = "".join(chars)
+            if not is_ngram:
+                terms[segment[:MAX_TERM_LEN]] += 1
+            elif len(segment) == 1:
+                terms[segment] += 1
+            else:
+                for i in range(len(segment) - 1):
+                    terms[segment[i:i + 2]] += 1
+    return terms
+
+
+def postings_for(post_id, board_id, community_id, title, content):
+    """글 하나의 색인 행(dict) 목록. 제목의 term은 가중치 2배"""
+    tf = tokenize(title)
+    for term in tf:
+        tf[term] *= 2
+    tf.update(tokenize(content))
+    return [{"term": term, "post_id": post_id, "board_id": board_id,
+             "community_id": community_id, "tf": count}
+            for term, count in tf.items()]
+
+
+def index_post(post, community_id):
+    """새 글의 색인 행을 현재 세션에 추가 (글과 같은 트랜잭션으로 commit)"""
+    rows = postings_for(post.id, post.board_id, community_id, post.title, post.content)
+    if rows:
+        db.session.execute(PostSearchTerms.__table__.insert(), rows)
+
+
+def rebuild_index(batch_size=1000):
+    """posts를 id keyset 페이지(id > 마지막 id ORDER BY id LIMIT batch_size)로 읽으며 글 단위로 색인을 교체
+
+    페이지마다 그 글들의 기존 색인 행을 지우고 새로 넣은 뒤 commit합니다. 색인 전체를 먼저 비우지 않으므로
+    재빌드 중에도 아직 처리하지 않은 글은 기존 색인으로 검색되고, 커서를 열어 둔 채 commit하지도 않습니다.
+    """
+    table = PostSearchTerms.__table__
+    indexed = 0
+    last_id = 0
+    while True:
+        page = db.session.query(Posts.id, Posts.board_id, Boards.community_id, Posts.title, Posts.content)\
+                         .join(Boards, Boards.id == Posts.board_id)\
+                         .filter(Posts.id > last_id)\
+                         .order_by(Posts.id)\
+                         .limit(batch_size)\
+                         .all()
+        if not page:
+            break
+        post_ids = [row[0] for row in page]
+        rows = []
+        for post_id, board_id, community_id, title, content in page:
+            rows.extend(postings_for(post_id, board_id, community_id, title, content))
+        db.session.execute(table.delete().where(table.c.post_id.in_(post_ids)))
+        if rows:
+            db.session.execute(table.insert(), rows)
+        db.session.commit()
+        indexed += len(page)
+        last_id = post_ids[-1]
+        if len(page) < batch_size:
+            break
+    return indexed
+
+
+def search_post_ids(query, board_id=None, community_id=None, offset=0, limit=20):
+    """검색어의 모든 term을 포함하는 글을 점수순으로 반환: ([(post_id, score)], has_more)
+
+    점수는 sum(tf * w), w = 1 / (1 + ln(df)) 로 드문 term일수록 높습니다.
+    LIKE 스캔 없이 (term, board_id|community_id) 인덱스만 사용합니다.
+    """
+    terms = list(tokenize(query))
+    if not terms:
+        return [], False
+
+    df = dict(db.session.query(PostSearchTerms.term, func.count(PostSearchTerms.id))
+                        .filter(PostSearchTerms.term.in_(terms))
+                        .group_by(PostSearchTerms.term)
+                        .all())
+    if len(df) < len(terms):
+        return [], False  # 한 번도 등장하지 않은 term이 있으면 결과 없음
+
+    weights = {term: 1.0 / (1.0 + math.log(df[term])) for term in terms}
+    score = func.sum(PostSearchTerms.tf * case(weights, value=PostSearchTerms.term)).label("score")
+
+    q = db.session.query(PostSearchTerms.post_id, score)\
+                  .filter(PostSearchTerms.term.in_(terms))
+    if board_id is not None:
+        q = q.filter(PostSearchTerms.board_id == board_id)
+    if community_id is not None:
+        q = q.filter(PostSearchTerms.community_id == community_id)
+    rows = q.group_by(PostSearchTerms.post_id)\
+            .having(func.count(distinct(PostSearchTerms.term)) == len(terms))\
+            .order_by(score.desc(), PostSearchTerms.post_id.desc())\
+            .offset(offset)\
+            .limit(limit + 1)\
+            .all()
+
+    return [(post_id, float(s)) for post_id, s in rows[:limit]], len(rows) > limit
@@ -0,0 +1,63 @@
+import json
+from flask import current_app
+from .database import db
+from .models import Users, Posts
+from .counters import post_counters
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+ANONYMOUS_NICKNAME = "익명"
+
+# 목록 응답에 필요한 컬럼만 조회 (작성자는 nickname만 조인)
+POST_LIST_COLUMNS = (
+    Posts.id, Posts.board_id, Posts.user_id, Posts.title, Posts.content, Posts.original_lang,
+    Posts.is_anonymous, Posts.like_count, Posts.comment_count, Posts.created_at, Posts.updated_at,
+    Users.nickname,
+)
+
+
+def post_list_query():
+    """글 목록용 쿼리: ORM 객체/관계 로딩 없이 한 번의 조인으로 작성자 닉네임까지 가져옴"""
+    return db.session.query(*POST_LIST_COLUMNS).join(Users, Users.id == Posts.user_id)
+
+
+def serialize_post_row(row):
+    """post_list_query()의 행 하나를 PostSchema와 같은 형태의 dict로 변환 (익명 처리 포함)"""
+    (post_id, board_id, user_id, title, content, original_lang, is_anonymous,
+     like_count, comment_count, created_at, updated_at, nickname) = row
+    like_count = like_count or 0
+    comment_count = comment_count or 0
+    pending = post_counters.pending(post_id)
+    if pending:
+        like_count += pending.get("like_count", 0)
+        comment_count += pending.get("comment_count", 0)
+    return {
+        "id": post_id,
+        "board_id": board_id,
+        "user_id": None if is_anonymous else user_id,
+        "title": title,
+        "content": content,
+        "original_lang": original_lang,
+        "is_anonymous": is_anonymous,
+        "like_count": like_count,
+        "comment_count": comment_count,
+        "created_at": created_at.isoformat() if created_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "author": {"nickname": ANONYMOUS_NICKNAME if is_anonymous else nickname},
+    }
+
+
+def dumps(payload):
+    """JSON bytes 직렬화 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(payload, status=200, headers=None):
+    """jsonify 대신 dumps()로 만든 응답"""
+    return current_app.response_class(dumps(payload), status=status, headers=headers,
+                                      mimetype="application/json")
@@ -0,0 +1,281 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class Translator:
+    """번역 백엔드 인터페이스
+
+    translate_batch는 한 페이지의 미번역 문장 전체를 한 번에 받습니다.
+    segments: [(text, source_lang), ...] (source_lang이 None이면 자동 감지)
+    반환: segments와 같은 순서의 번역문 목록
+    외부 번역 API를 쓰려면 이 인터페이스를 구현해 TRANSLATOR_BACKENDS에 등록하세요.
+    name / version은 캐시 키에 들어가므로 번역 결과가 달라지는 변경(모델 교체 등)이 있으면 version을 올리세요.
+    """
+
+    name = None
+    version = "1"
+
+    @property
+    def cache_namespace(self):
+        return f"{self.name}.{self.version}"
+
+    def translate_batch(self, segments, target_lang):
+        raise NotImplementedError
+
+
+class FakeTranslator(Translator):
+    """외부 호출 없이 `[언어] 원문` 형태로 돌려주는 로컬 백엔드 (개발/테스트용)"""
+
+    name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+        self.segments = 0
+
+    def translate_batch(self, segments, target_lang):
+        self.calls += 1
+        self.segments += len(segments)
+        return [f"[{target_lang}] {text}" for text, _ in segments]
+
+
+TRANSLATOR_BACKENDS = {
+    "fake": FakeTranslator,
+}
+
+
+def content_key(text, target_lang, namespace):
+    """(원문 해시, 대상 언어, 백엔드 이름.버전) 캐시 키. 같은 문장은 어느 글에 있든 한 번만 번역됨
+
+    백엔드가 바뀌면 키도 바뀌므로 이전 백엔드(예: fake)의 결과가 디스크 캐시에서 계속 쓰이지 않습니다.
+    """
+    return f"{hashlib.sha256(text.encode('utf-8')).hexdigest()}-{target_lang}-{namespace}"
+
+
+class DiskStore:
+    """번역 결과를 키별 파일로 보관 (<dir>/<앞 2글자>/<키>). 여러 워커 프로세스가 공유"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(value)
+        os.replace(tmp, path)
+
+
+class TranslationService:
+    """게시글 번역 + 2단계 캐시 (메모리 LRU -> 디스크)
+
+    - 페이지의 미번역 문장을 모아 백엔드를 한 번만 호출
+    - 같은 키를 다른 요청이 번역 중이면 끝날 때까지 기다렸다가 그 결과를 사용 (중복 번역 없음)
+    - 글 작성 직후 warm_post로 백그라운드에서 주요 언어 번역을 미리 채움
+    - TRANSLATOR_BACKEND가 비어 있으면 꺼짐 (enabled=False, 번역 API는 503)
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.maxsize = 10000
+        self.disk = None
+        self.warm_languages = ()
+        self.warm_workers = 2
+        self._executor = None
+        self._executor_pid = None  # 실행기를 만든 프로세스 (preload 후 fork된 워커에서는 새로 만듦)
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._inflight = {}  # key -> threading.Event
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.backend_calls = 0
+
+    def init_app(self, app):
+        name = app.config['TRANSLATOR_BACKEND']
+        self.backend = TRANSLATOR_BACKENDS[name]() if name else None
+        if name == "fake" and not (app.testing or app.debug):
+            logger.warning("TRANSLATOR_BACKEND 'fake' returns placeholder translations; use it only for development")
+        self.maxsize = app.config['TRANSLATION_CACHE_SIZE']
+        cache_dir = app.config['TRANSLATION_CACHE_DIR']
+        self.disk = DiskStore(cache_dir) if cache_dir else None
+        self.warm_languages = tuple(code.strip() for code in
+                                    app.config['TRANSLATION_WARM_LANGUAGES'].split(",") if code.strip())
+        self.warm_workers = app.config['TRANSLATION_WARM_WORKERS']
+        if self._executor is not None and self._executor_pid == os.getpid():
+            self._executor.shutdown(wait=False)
+        self._executor = self._executor_pid = None
+        with self._lock:
+            self._memory.clear()
+            self.memory_hits = self.disk_hits = self.misses = self.backend_calls = 0
+        app.extensions['translation'] = self
+
+    @property
+    def enabled(self):
+        return self.backend is not None
+
+    # --- 캐시 ---
+
+    def _remember(self, key, value):
+        # self._lock 안에서 호출
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key):
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                with self._lock:
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                return value
+        return None
+
+    # --- 번역 ---
+
+    def translate(self, segments, target_lang):
+        """[(text, source_lang), ...]를 target_lang으로 번역한 목록 (원문과 같은 언어/빈 문자열은 그대로)"""
+        results = [None] * len(segments)
+        todo = {}  # key -> (text, source_lang)
+        for i, (text, source_lang) in enumerate(segments):
+            if not text or source_lang == target_lang:
+                results[i] = text
+                continue
+            key = content_key(text, target_lang, self.backend.cache_namespace)
+            value = self._lookup(key)
+            if value is None:
+                todo.setdefault(key, (text, source_lang))
+            else:
+                results[i] = value
+
+        if todo:
+            translated = self._translate_missing(todo, target_lang)
+            for i, (text, source_lang) in enumerate(segments):
+                if results[i] is None:
+                    results[i] = translated.get(content_key(text, target_lang, self.backend.cache_namespace), text)
+        return results
+
+    def _translate_missing(self, todo, target_lang):
+        """캐시에 없는 키를 번역. 이미 다른 스레드가 번역 중인 키는 기다렸다가 캐시에서 읽음"""
+        owned, waiting = [], []
+        with self._lock:
+            for key in todo:
+                event = self._inflight.get(key)
+                if event is None:
+                    self._inflight[key] = threading.Event()
+                    owned.append(key)
+                else:
+                    waiting.append((key, event))
+
+        translated = {}
+        if owned:
+            try:
+                # 앞에서 조회한 뒤 다른 스레드가 채웠을 수 있으므로 한 번 더 확인
+                for key in owned:
+                    value = self._lookup(key)
+                    if value is not None:
+                        translated[key] = value
+                missing = [key for key in owned if key not in translated]
+                if missing:
+                    values = self.backend.translate_batch([todo[key] for key in missing], target_lang)
+                    with self._lock:
+                        self.backend_calls += 1
+                        self.misses += len(missing)
+                        for key, value in zip(missing, values):
+                            self._remember(key, value)
+                    if self.disk is not None:
+                        for key, value in zip(missing, values):
+                            self.disk.put(key, value)
+                    translated.update(zip(missing, values))
+            finally:
+                with self._lock:
+                    for key in owned:
+                        self._inflight.pop(key).set()
+
+        for key, event in waiting:
+            event.wait(timeout=30)
+            value = self._lookup(key)
+            if value is not None:
+                translated[key] = value
+        return translated
+
+    def translate_posts(self, posts, target_lang):
+        """직렬화된 글 목록(dict)에 translated_title / translated_content / translated_lang 추가"""
+        segments = []
+        for post in posts:
+            segments.append((post["title"], post["original_lang"]))
+            segments.append((post["content"], post["original_lang"]))
+        translated = self.translate(segments, target_lang)
+        for i, post in enumerate(posts):
+            post["translated_lang"] = target_lang
+            post["translated_title"] = translated[2 * i]
+            post["translated_content"] = translated[2 * i + 1]
+        return posts
+
+    # --- 미리 번역 ---
+
+    def warm_post(self, title, content, source_lang, target_langs):
+        """글 작성 직후 호출. 대상 언어별 번역을 백그라운드 스레드에서 캐시에 채움"""
+        targets = [lang for lang in (self.warm_languages or target_langs) if lang != source_lang]
+        if not self.enabled or not targets or self.warm_workers <= 0:
+            return
+        self._warm_executor().submit(self._warm, [(title, source_lang), (content, source_lang)], targets)
+
+    def _warm_executor(self):
+        """워커 프로세스마다 처음 쓸 때 실행기를 만듦 (create_app 후 fork된 워커 포함)"""
+        pid = os.getpid()
+        if self._executor_pid != pid:
+            with self._lock:
+                if self._executor_pid != pid:
+                    self._executor = ThreadPoolExecutor(max_workers=self.warm_workers,
+                                                        thread_name_prefix="translation-warm")
+                    self._executor_pid = pid
+        return self._executor
+
+    def _warm(self, segments, targets):
+        for lang in targets:
+            try:
+                self.translate(segments, lang)
+            except Exception:
+                logger.warning("translation warm-up failed for %s", lang, exc_info=True)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "backend": self.backend.cache_namespace if self.enabled else None,
+                "memory_size": len(self._memory),
+                "memory_maxsize": self.maxsize,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "backend_calls": self.backend_calls,
+                "hit_ratio": ((self.memory_hits + self.disk_hits) / lookups) if lookups else 0.0,
+            }
+
+
+translation_service = TranslationService()
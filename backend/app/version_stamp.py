@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없으면 동시에 bump할 때 증가분 하나가 합쳐질 수 있음
+    fcntl = None
+
+
+class VersionStamp:
+    """파일 하나로 여러 워커 프로세스에 '다시 로드하라'는 신호를 전달
+
+    CLI 등에서 bump()하면 파일에 든 버전 번호가 1 올라가고, 각 프로세스는 changed()로
+    마지막으로 본 값과 비교해 재빌드 여부를 판단합니다. (파일 읽기 1회 비용)
+    파일 내용은 "<버전> <변경 시각(epoch 초)>" 한 줄입니다. bump는 <파일>.lock에 flock을 건 채
+    읽고 1 올려 임시 파일 + os.replace로 쓰므로, 같은 시계 틱 안에 여러 번 bump해도 값이 모두 다릅니다
+    (mtime 해상도에 의존하지 않음). 파일을 새로 만들 때는 time.time_ns()에서 시작하므로
+    파일을 지웠다 다시 만들어도 이전 버전 번호와 겹치지 않습니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._seen = None
+
+    def read(self):
+        """(버전, 변경 시각) 또는 파일이 없거나 비어 있으면 None"""
+        if not self.path:
+            return None
+        try:
+            with open(self.path, encoding="ascii") as f:
+                version, changed_at = f.read().split()
+            return int(version), float(changed_at)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def current(self):
+        state = self.read()
+        return state[0] if state is not None else None
+
+    def bump(self):
+        """버전을 1 올리고 새 버전 반환"""
+        if not self.path:
+            return None
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            state = self.read()
+            version = state[0] + 1 if state is not None else time.time_ns()
+            tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="ascii") as f:
+                f.write(f"{version} {time.time()}\n")
+            os.replace(tmp, self.path)
+        return version
+
+    def changed(self):
+        """마지막 mark_seen() 이후 bump가 있었는지"""
+        return self.current() != self._seen
+
+    def mark_seen(self, value=None):
+        self._seen = self.current() if value is None else value
@@ -0,0 +1,527 @@
+"""Flask API 부하 테스트 / 벤치마크
+
+create_app으로 앱을 만들고 (기본: 임시 디렉터리의 SQLite 파일) seed.py로 합성 데이터를 채운 뒤,
+여러 스레드가 각자 test_client로 모든 블루프린트 라우트를 가중치에 따라 동시에 호출합니다.
+라우트별/전체 p50/p95/p99 지연, 처리량, 요청당 쿼리 수(X-DB-Query-Count)를 출력하고
+결과를 JSON으로 저장하여 이전 실행과 비교할 수 있습니다.
+
+실행:
+    python -m benchmarks.api_load --workers 8 --duration 30
+    python -m benchmarks.api_load --compare benchmarks/results/api-20260101-120000.json
+    python -m benchmarks.api_load --database-url mysql+pymysql://user:pw@127.0.0.1/hi_campus_bench
+
+SSE 스트림(/conversations/<id>/stream)은 연결을 오래 유지하는 엔드포인트라 지연 측정 대상에서 제외합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+from app import create_app
+from app.database import db
+from app.pagination import encode_cursor
+from app.search import rebuild_index
+from benchmarks.seed import SeedSizes, seed_database, PASSWORD, WORDS
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+SCENARIOS = []
+
+
+def scenario(route, weight):
+    """시나리오 등록. fn(state, rng) -> (method, path, 요청 kwargs) 또는 None(이번엔 건너뜀)"""
+    def decorator(fn):
+        SCENARIOS.append((route, weight, fn))
+        return fn
+    return decorator
+
+
+class LoadState:
+    """워커 스레드가 공유하는 시드 데이터 / 토큰 / 한 번만 쓸 수 있는 자원(요청 id 등)"""
+
+    def __init__(self, seeded, secret_key):
+        self.seeded = seeded
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._secret_key = secret_key
+        self._pending = list(seeded.pending_request_ids)
+        self._offered = list(seeded.offered_requests)
+        self._idle_students = list(seeded.idle_student_ids)
+        self._register_seq = 0
+        self.etags = {}  # board_id -> 마지막으로 받은 ETag
+        self.admin_id = min(seeded.user_emails)  # 통계 엔드포인트 호출용 (ADMIN_USER_IDS에 등록)
+
+    def token(self, user_id):
+        token = self._tokens.get(user_id)
+        if token is None:
+            now = datetime.now(timezone.utc)
+            token = jwt.encode({"user_id": user_id, "sub": self.seeded.user_emails[user_id],
+                                "iat": now, "exp": now + timedelta(days=1)},
+                               self._secret_key, algorithm="HS256")
+            self._tokens[user_id] = token
+        return token
+
+    def auth(self, user_id):
+        return {"Authorization": f"Bearer {self.token(user_id)}"}
+
+    def admin_auth(self):
+        return self.auth(self.admin_id)
+
+    def take(self, name):
+        with self._lock:
+            items = getattr(self, name)
+            return items.pop() if items else None
+
+    def give_back(self, name, item):
+        with self._lock:
+            getattr(self, name).append(item)
+
+    def next_register_seq(self):
+        with self._lock:
+            self._register_seq += 1
+            return self._register_seq
+
+
+# --- 시나리오 (라우트 이름은 Flask url_rule 형식) ---
+
+@scenario("POST /api/auth/login", 2)
+def login(state, rng):
+    user_id = rng.choice(list(state.seeded.user_emails))
+    return "POST", "/api/auth/login", {"json": {"email": state.seeded.user_emails[user_id],
+                                                "password": PASSWORD}}
+
+
+@scenario("POST /api/auth/register", 1)
+def register(state, rng):
+    seq = state.next_register_seq()
+    return "POST", "/api/auth/register", {"json": {
+        "email": f"load{seq}-{threading.get_ident()}@bench.example.com", "password": PASSWORD,
+        "nickname": f"load{seq}", "realname": f"Load {seq}", "gender": "female",
+        "main_language": "vi", "nationality_iso2": "VN", "school_id": state.seeded.school_ids[0],
+        "department_id": 1, "enrollment_year": 2025}}
+
+
+@scenario("GET /api/auth/principal-cache/stats", 1)
+def principal_cache_stats(state, rng):
+    return "GET", "/api/auth/principal-cache/stats", {"headers": state.admin_auth()}
+
+
+@scenario("GET /api/school/my-homepage-translation", 3)
+def school_translation(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "GET", "/api/school/my-homepage-translation", {"headers": state.auth(user_id)}
+
+
+@scenario("GET /api/catalog/<resource>", 4)
+def catalog_lists(state, rng):
+    resource = rng.choice(["languages", "countries", "schools"])
+    return "GET", f"/api/catalog/{resource}", {}
+
+
+@scenario("GET /api/catalog/schools/<school_id>/<resource>", 4)
+def catalog_school(state, rng):
+    resource = rng.choice(["colleges", "departments"])
+    return "GET", f"/api/catalog/schools/{rng.choice(state.seeded.school_ids)}/{resource}", {}
+
+
+@scenario("GET /api/board/<board_id>/posts", 25)
+def board_posts(state, rng):
+    board_id = rng.choice(state.seeded.board_ids)
+    return "GET", f"/api/board/{board_id}/posts", {}
+
+
+@scenario("GET /api/board/<board_id>/posts?cursor", 6)
+def board_posts_deep(state, rng):
+    # 뒤쪽 페이지: 임의의 글 시각을 커서로 사용
+    post_id = rng.choice(state.seeded.post_ids)
+    created_at = state.seeded.post_created_at[post_id]
+    board_id = rng.choice(state.seeded.board_ids)
+    return "GET", f"/api/board/{board_id}/posts", {
+        "query_string": {"cursor": encode_cursor(created_at, post_id)}}
+
+
+@scenario("GET /api/board/<board_id>/posts (If-None-Match)", 6)
+def board_posts_revalidate(state, rng):
+    board_id = rng.choice(state.seeded.board_ids)
+    etag = state.etags.get(board_id)
+    headers = {"If-None-Match": etag} if etag else {}
+    return "GET", f"/api/board/{board_id}/posts", {"headers": headers, "board_id": board_id}
+
+
+@scenario("GET /api/board/<board_id>/posts/translated", 6)
+def board_posts_translated(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "GET", f"/api/board/{rng.choice(state.seeded.board_ids)}/posts/translated", {
+        "headers": state.auth(user_id)}
+
+
+@scenario("GET /api/feed/home", 10)
+def home(state, rng):
+    return "GET", "/api/feed/home", {"headers": state.auth(rng.choice(state.seeded.student_ids))}
+
+
+@scenario("GET /api/translation-cache/stats", 1)
+def translation_cache_stats(state, rng):
+    return "GET", "/api/translation-cache/stats", {"headers": state.admin_auth()}
+
+
+@scenario("POST /api/board/<board_id>/posts", 3)
+def create_post(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "POST", f"/api/board/{rng.choice(state.seeded.board_ids)}/posts", {
+        "headers": state.auth(user_id),
+        "json": {"title": "부하 테스트 글", "content": "기숙사 수강신청 질문 있습니다 " * 5}}
+
+
+@scenario("POST /api/posts/<post_id>/like", 4)
+def like(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "POST", f"/api/posts/{rng.choice(state.seeded.post_ids)}/like", {"headers": state.auth(user_id)}
+
+
+@scenario("DELETE /api/posts/<post_id>/like", 2)
+def unlike(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "DELETE", f"/api/posts/{rng.choice(state.seeded.post_ids)}/like", {"headers": state.auth(user_id)}
+
+
+@scenario("POST /api/posts/<post_id>/comments", 3)
+def create_comment(state, rng):
+    user_id = rng.choice(state.seeded.student_ids)
+    return "POST", f"/api/posts/{rng.choice(state.seeded.post_ids)}/comments", {
+        "headers": state.auth(user_id), "json": {"content": "좋은 정보 감사합니다"}}
+
+
+@scenario("GET /api/posts/<post_id>/comments", 5)
+def get_comments(state, rng):
+    return "GET", f"/api/posts/{rng.choice(state.seeded.post_ids)}/comments", {}
+
+
+@scenario("GET /api/search/posts", 5)
+def search(state, rng):
+    return "GET", "/api/search/posts", {"query_string": {"q": rng.choice(WORDS)}}
+
+
+@scenario("GET /api/board-cache/stats", 1)
+def board_cache_stats(state, rng):
+    return "GET", "/api/board-cache/stats", {"headers": state.admin_auth()}
+
+
+@scenario("POST /api/match_requests", 1)
+def create_match_request(state, rng):
+    user_id = state.take("_idle_students")
+    if user_id is None:
+        return None
+    return "POST", "/api/match_requests", {"headers": state.auth(user_id),
+                                           "json": {"preferred_gender": "any"}}
+
+
+@scenario("GET /api/match_requests/<request_id>/find_helpers", 4)
+def find_helpers(state, rng):
+    request_id = rng.choice(state.seeded.pending_request_ids)
+    return "GET", f"/api/match_requests/{request_id}/find_helpers", {
+        "headers": state.auth(rng.choice(state.seeded.helper_ids))}
+
+
+@scenario("GET /api/match_requests/helper_inbox", 4)
+def helper_inbox(state, rng):
+    return "GET", "/api/match_requests/helper_inbox", {"headers": state.auth(rng.choice(state.seeded.helper_ids))}
+
+
+@scenario("POST /api/match_requests/<request_id>/offer", 1)
+def offer(state, rng):
+    request_id = state.take("_pending")
+    if request_id is None:
+        return None
+    mentor = rng.choice(state.seeded.helper_ids)
+    state.give_back("_offered", (request_id, mentor))
+    return "POST", f"/api/match_requests/{request_id}/offer", {
+        "headers": state.auth(mentor), "json": {"mentor_user_id": mentor}}
+
+
+@scenario("POST /api/match_requests/<request_id>/accept", 1)
+def accept(state, rng):
+    item = state.take("_offered")
+    if item is None:
+        return None
+    request_id, mentor = item
+    return "POST", f"/api/match_requests/{request_id}/accept", {
+        "headers": state.auth(mentor), "json": {"mentor_user_id": mentor}}
+
+
+@scenario("POST /api/match_requests/accept_bulk", 1)
+def accept_bulk(state, rng):
+    items = [item for item in (state.take("_offered") for _ in range(5)) if item]
+    if not items:
+        return None
+    return "POST", "/api/match_requests/accept_bulk", {
+        "headers": state.admin_auth(),
+        "json": {"items": [{"request_id": rid, "mentor_user_id": m} for rid, m in items]}}
+
+
+@scenario("POST /api/conversations/<conv_id>/messages", 8)
+def send_message(state, rng):
+    conv_id, mentor, mentee, _ = rng.choice(state.seeded.conversations)
+    return "POST", f"/api/conversations/{conv_id}/messages", {
+        "headers": state.auth(rng.choice([mentor, mentee])), "json": {"content": "안녕하세요!"}}
+
+
+@scenario("GET /api/conversations/<conv_id>/messages", 8)
+def get_messages(state, rng):
+    conv_id, mentor, mentee, last_id = rng.choice(state.seeded.conversations)
+    query = rng.choice([{}, {"after_id": max(1, last_id - 20)}, {"before_id": last_id}])
+    return "GET", f"/api/conversations/{conv_id}/messages", {
+        "headers": state.auth(rng.choice([mentor, mentee])), "query_string": query}
+
+
+@scenario("GET /api/conversations", 6)
+def inbox(state, rng):
+    _, mentor, mentee, _ = rng.choice(state.seeded.conversations)
+    return "GET", "/api/conversations", {"headers": state.auth(rng.choice([mentor, mentee]))}
+
+
+@scenario("POST /api/conversations/<conv_id>/read", 3)
+def mark_read(state, rng):
+    conv_id, mentor, mentee, _ = rng.choice(state.seeded.conversations)
+    return "POST", f"/api/conversations/{conv_id}/read", {
+        "headers": state.auth(rng.choice([mentor, mentee])), "json": {}}
+
+
+@scenario("GET /api/rate-limit/stats", 1)
+def rate_limit_stats(state, rng):
+    return "GET", "/api/rate-limit/stats", {"headers": state.admin_auth()}
+
+
+@scenario("GET /api/db-profiler/stats", 1)
+def db_profiler_stats(state, rng):
+    return "GET", "/api/db-profiler/stats", {"headers": state.admin_auth()}
+
+
+# --- 실행 / 집계 ---
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.queries = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, route, elapsed, status, query_count):
+        with self._lock:
+            self.latencies[route].append(elapsed)
+            self.statuses[route][status] += 1
+            if query_count is not None:
+                self.queries[route].append(query_count)
+
+    @staticmethod
+    def _summary(latencies, queries, statuses, duration):
+        values = sorted(latencies)
+        errors = sum(n for status, n in statuses.items() if status >= 500)
+        return {
+            "requests": len(values),
+            "throughput_rps": len(values) / duration if duration else 0.0,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "max_ms": (values[-1] * 1000) if values else 0.0,
+            "avg_queries": (sum(queries) / len(queries)) if queries else None,
+            "max_queries": max(queries) if queries else None,
+            "errors_5xx": errors,
+            "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        }
+
+    def summary(self, duration):
+        routes = {route: self._summary(self.latencies[route], self.queries[route],
+                                       self.statuses[route], duration)
+                  for route in sorted(self.latencies)}
+        all_statuses = defaultdict(int)
+        for statuses in self.statuses.values():
+            for status, n in statuses.items():
+                all_statuses[status] += n
+        overall = self._summary([v for vs in self.latencies.values() for v in vs],
+                                [v for vs in self.queries.values() for v in vs],
+                                all_statuses, duration)
+        return routes, overall
+
+
+def run_worker(app, state, recorder, deadline, seed, record=True):
+    rng = random.Random(seed)
+    routes = [s[0] for s in SCENARIOS]
+    weights = [s[1] for s in SCENARIOS]
+    builders = {s[0]: s[2] for s in SCENARIOS}
+    client = app.test_client()
+    while time.perf_counter() < deadline:
+        route = rng.choices(routes, weights)[0]
+        spec = builders[route](state, rng)
+        if spec is None:
+            continue
+        method, path, kwargs = spec
+        board_id = kwargs.pop("board_id", None)
+        started = time.perf_counter()
+        response = client.open(path, method=method, **kwargs)
+        elapsed = time.perf_counter() - started
+        if board_id is not None and response.headers.get("ETag"):
+            state.etags[board_id] = response.headers["ETag"]
+        if record:
+            count = response.headers.get("X-DB-Query-Count")
+            recorder.record(route, elapsed, response.status_code, int(count) if count else None)
+        response.close()
+
+
+def run_phase(app, state, recorder, workers, seconds, seed, record=True):
+    deadline = time.perf_counter() + seconds
+    threads = [threading.Thread(target=run_worker,
+                                args=(app, state, recorder, deadline, seed + i, record), daemon=True)
+               for i in range(workers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - started
+
+
+def build_app(args, workdir):
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    overrides = {
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "DB_PROFILER_ENABLED": True,
+        "DB_PROFILER_HEADERS": True,
+        "BCRYPT_ROUNDS": args.bcrypt_rounds,
+        # 가상 사용자를 한 프로세스의 스레드로 돌리므로 스레드 워커처럼 해싱 풀을 켬
+        "HASH_POOL_WORKERS": os.cpu_count() or 2,
+        "HASH_POOL_QUEUE_SIZE": args.workers,
+        "CATALOG_PRELOAD": False,
+        "HELPER_INDEX_VERSION_FILE": os.path.join(workdir, "helper_index.version"),
+        "CATALOG_VERSION_FILE": os.path.join(workdir, "catalog.version"),
+        "BOARD_CACHE_VERSION_DIR": os.path.join(workdir, "board_versions"),
+        "TRANSLATION_CACHE_DIR": os.path.join(workdir, "translations"),
+        "TRANSLATOR_BACKEND": "fake",
+        # 모든 가상 사용자가 같은 IP(127.0.0.1)로 들어오므로 요청 제한은 끔 (--rate-limit 으로 켜기)
+        "RATE_LIMIT_ENABLED": args.rate_limit,
+        "RATE_LIMIT_BACKEND": "local",
+    }
+    if database_url.startswith("sqlite"):
+        # SQLite에는 커넥션 풀 옵션 대신 잠금 대기 시간만 지정
+        overrides["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "connect_args": {"timeout": 30, "check_same_thread": False}}
+    return create_app(overrides)
+
+
+def print_table(routes, overall):
+    print(f"{'route':<55} {'req':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6} {'5xx':>5}")
+    for route, s in list(routes.items()) + [("OVERALL", overall)]:
+        queries = f"{s['avg_queries']:.1f}" if s["avg_queries"] is not None else "-"
+        print(f"{route:<55} {s['requests']:>7} {s['throughput_rps']:>8.1f} {s['p50_ms']:>8.2f} "
+              f"{s['p95_ms']:>8.2f} {s['p99_ms']:>8.2f} {queries:>6} {s['errors_5xx']:>5}")
+
+
+def print_comparison(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\n비교 기준: {baseline_path} ({baseline.get('started_at')})")
+    print(f"{'route':<55} {'p50 Δ%':>8} {'p95 Δ%':>8} {'p99 Δ%':>8} {'rps Δ%':>8} {'q/req Δ':>8}")
+
+    def delta(new, old):
+        return f"{(new - old) / old * 100:+.1f}" if old else "-"
+
+    pairs = [(route, s, baseline["routes"].get(route)) for route, s in current["routes"].items()]
+    pairs.append(("OVERALL", current["overall"], baseline["overall"]))
+    for route, new, old in pairs:
+        if old is None:
+            print(f"{route:<55} {'(new)':>8}")
+            continue
+        q_delta = "-"
+        if new["avg_queries"] is not None and old.get("avg_queries") is not None:
+            q_delta = f"{new['avg_queries'] - old['avg_queries']:+.1f}"
+        print(f"{route:<55} {delta(new['p50_ms'], old['p50_ms']):>8} {delta(new['p95_ms'], old['p95_ms']):>8} "
+              f"{delta(new['p99_ms'], old['p99_ms']):>8} "
+              f"{delta(new['throughput_rps'], old['throughput_rps']):>8} {q_delta:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="기본값: 임시 디렉터리의 SQLite 파일 (빈 DB여야 함)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정 전 예열 시간(초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--rate-limit", action="store_true", help="요청 제한(RATE_LIMITS)을 켠 채로 측정")
+    parser.add_argument("--users", type=int, default=SeedSizes.users)
+    parser.add_argument("--helpers", type=int, default=SeedSizes.helpers)
+    parser.add_argument("--posts", type=int, default=SeedSizes.posts)
+    parser.add_argument("--conversations", type=int, default=SeedSizes.conversations)
+    parser.add_argument("--messages-per-conversation", type=int, default=SeedSizes.messages_per_conversation)
+    parser.add_argument("--output", help=f"결과 JSON 경로 (기본: {RESULTS_DIR}/api-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    sizes = SeedSizes(users=args.users, helpers=args.helpers, posts=args.posts,
+                      conversations=args.conversations,
+                      messages_per_conversation=args.messages_per_conversation)
+
+    with tempfile.TemporaryDirectory(prefix="hi-campus-bench-") as workdir:
+        app = build_app(args, workdir)
+        with app.app_context():
+            db.create_all()
+            started = time.perf_counter()
+            seeded = seed_database(sizes, seed=args.seed, bcrypt_rounds=args.bcrypt_rounds)
+            rebuild_index()
+            print(f"seeded in {time.perf_counter() - started:.1f}s: {sizes}")
+
+        state = LoadState(seeded, app.config["SECRET_KEY"])
+        app.config["ADMIN_USER_IDS"] = str(state.admin_id)
+        recorder = Recorder()
+        if args.warmup > 0:
+            run_phase(app, state, recorder, args.workers, args.warmup, args.seed, record=False)
+        started_at = datetime.now(timezone.utc).isoformat()
+        duration = run_phase(app, state, recorder, args.workers, args.duration, args.seed + 1000)
+        routes, overall = recorder.summary(duration)
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    result = {
+        "started_at": started_at,
+        "duration_s": duration,
+        "workers": args.workers,
+        "database": "sqlite (temp file)" if not args.database_url else args.database_url.split("@")[-1],
+        "python": platform.python_version(),
+        "seed_sizes": vars(sizes),
+        "skipped_routes": ["GET /api/conversations/<conv_id>/stream (SSE, long-lived)"],
+        "routes": routes,
+        "overall": overall,
+    }
+    print_table(routes, overall)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"api-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\nresults: {output}")
+
+    if args.compare:
+        print_comparison(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""FastAPI 서비스 커넥션 풀 벤치마크
+
+요청마다 mysql.connector.connect()로 새 커넥션을 여는 기존 방식과 database.ConnectionPool을 비교합니다.
+
+1) DB 단독: 스레드 N개가 "커넥션 획득 -> 조회 1회 -> 반납/닫기"를 반복 (초당 처리량, 초당 새 커넥션 수)
+2) HTTP: httpx + ASGITransport로 같은 조회를 하는 두 엔드포인트에 동시 요청
+   - /legacy : 동기 핸들러, 요청마다 connect/close (기존 routers/auth.py 방식)
+   - /pooled : async 핸들러, 풀 커넥션으로 스레드 풀에서 조회
+
+MySQL이 필요합니다 (DB_HOST / DB_USER / DB_PASS / DB_NAME 환경 변수).
+실행: python -m benchmarks.fastapi_pool --threads 16 --duration 10 --concurrency 64
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+
+import database
+
+QUERY = "SELECT id FROM users ORDER BY id LIMIT 1"
+
+
+def _query(conn):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(QUERY)
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def legacy_once():
+    conn = database.get_db_connection()
+    try:
+        _query(conn)
+    finally:
+        conn.close()
+
+
+def pooled_once():
+    with database.pool.connection() as conn:
+        _query(conn)
+
+
+def run_threads(fn, threads, duration):
+    counts = [0] * threads
+    deadline = time.perf_counter() + duration
+
+    def worker(i):
+        while time.perf_counter() < deadline:
+            fn()
+            counts[i] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return sum(counts), time.perf_counter() - started
+
+
+def build_app():
+    app = FastAPI()
+
+    @app.get("/legacy")
+    def legacy():
+        legacy_once()
+        return {"ok": True}
+
+    @app.get("/pooled")
+    async def pooled():
+        await run_in_threadpool(pooled_once)
+        return {"ok": True}
+
+    return app
+
+
+async def drive(app, path, concurrency, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16, help="DB 단독 측정 스레드 수")
+    parser.add_argument("--duration", type=float, default=10, help="측정 구간별 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=64, help="HTTP 동시 요청 수")
+    parser.add_argument("--pool-size", type=int, default=database.POOL_SIZE)
+    args = parser.parse_args()
+
+    database.init_pool(size=args.pool_size)
+    try:
+        print(f"DB only ({args.threads} threads, {args.duration:.0f}s each)")
+        legacy_ops, legacy_elapsed = run_threads(legacy_once, args.threads, args.duration)
+        before = database.pool.stats()["created"]
+        pooled_ops, pooled_elapsed = run_threads(pooled_once, args.threads, args.duration)
+        opened = database.pool.stats()["created"] - before
+        print(f"  per-request connect: {legacy_ops / legacy_elapsed:10.1f} ops/s, "
+              f"{legacy_ops / legacy_elapsed:10.1f} new connections/s")
+        print(f"  pooled             : {pooled_ops / pooled_elapsed:10.1f} ops/s, "
+              f"{opened / pooled_elapsed:10.1f} new connections/s")
+        print(f"  connections saved  : {(legacy_ops / legacy_elapsed) - (opened / pooled_elapsed):10.1f} /s")
+
+        app = build_app()
+        print(f"\nHTTP ({args.concurrency} concurrent, pool size {args.pool_size})")
+        for path in ("/legacy", "/pooled"):
+            result = asyncio.run(drive(app, path, args.concurrency, args.duration))
+            print(f"  {path:<8} {result['rps']:10.1f} req/s  p50 {result['p50_ms']:7.2f} ms  "
+                  f"p95 {result['p95_ms']:7.2f} ms  ({result['requests']} requests)")
+        print(f"\npool stats: {database.pool.stats()}")
+    finally:
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
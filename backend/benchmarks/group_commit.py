@@ -0,0 +1,151 @@
+"""메시지 group commit 벤치마크
+
+채팅이 몰리는 상황을 스레드 N개(요청 워커)가 쉬지 않고 메시지를 보내는 것으로 흉내 내고
+초당 저장 메시지 수와 전송 지연(p50/p95/p99)을 비교합니다.
+
+- per-request : 기존 send_message 방식. 요청마다 INSERT + 대화방 요약 갱신 + commit
+- group       : GroupCommitWriter 경유. 여러 요청의 메시지를 다중 INSERT 1회 + commit 1회로 저장
+
+create_app으로 앱을 만들고 (기본: 임시 디렉터리의 SQLite 파일) seed.py로 대화방을 채운 뒤 측정합니다.
+실행: python -m benchmarks.group_commit --threads 32 --duration 10 --max-batch 200 --max-wait-ms 5
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from app import create_app
+from app.database import db
+from app.inbox import record_new_message
+from app.message_writer import GroupCommitWriter
+from app.models import Messages
+from benchmarks.seed import SeedSizes, seed_database
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def send_per_request(conv_id, sender_id, content):
+    msg = Messages(conversation_id=conv_id, sender_user_id=sender_id, content=content)
+    db.session.add(msg)
+    db.session.flush()
+    record_new_message(conv_id, msg.id, sender_id)
+    db.session.commit()
+    return msg.id
+
+
+def run(mode, app, conversations, args):
+    writer = None
+    if mode == "group":
+        writer = GroupCommitWriter()
+        writer.max_batch = args.max_batch
+        writer.max_wait = args.max_wait_ms / 1000
+        writer.start(app)
+
+    latencies = [[] for _ in range(args.threads)]
+    errors = [0] * args.threads
+    deadline = time.perf_counter() + args.duration
+
+    def worker(i):
+        rng = random.Random(args.seed + i)
+        with app.app_context():
+            while time.perf_counter() < deadline:
+                conv_id, mentor_id, mentee_id, _ = rng.choice(conversations)
+                sender_id = rng.choice((mentor_id, mentee_id))
+                content = f"bench message {i}-{len(latencies[i])}"
+                started = time.perf_counter()
+                try:
+                    if writer is not None:
+                        writer.write(conv_id, sender_id, content)
+                    else:
+                        send_per_request(conv_id, sender_id, content)
+                except Exception:
+                    db.session.rollback()
+                    errors[i] += 1
+                    continue
+                latencies[i].append((time.perf_counter() - started) * 1000)
+            db.session.remove()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    if writer is not None:
+        writer._stop()
+
+    samples = [ms for per_thread in latencies for ms in per_thread]
+    result = {
+        "mode": mode,
+        "messages": len(samples),
+        "errors": sum(errors),
+        "messages_per_s": len(samples) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "p99_ms": percentile(samples, 99),
+        "avg_batch": writer.stats()["avg_batch"] if writer is not None else 1.0,
+    }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="기본값: 임시 디렉터리의 SQLite 파일 (빈 DB여야 함)")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10, help="모드별 측정 시간(초)")
+    parser.add_argument("--max-batch", type=int, default=200)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    parser.add_argument("--conversations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hi-campus-group-commit-") as workdir:
+        database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        overrides = {
+            "SQLALCHEMY_DATABASE_URI": database_url,
+            "BCRYPT_ROUNDS": 4,
+            "CATALOG_PRELOAD": False,
+            "HELPER_INDEX_VERSION_FILE": os.path.join(workdir, "helper_index.version"),
+            "CATALOG_VERSION_FILE": os.path.join(workdir, "catalog.version"),
+            "BOARD_CACHE_VERSION_DIR": os.path.join(workdir, "board_versions"),
+            "TRANSLATION_CACHE_DIR": os.path.join(workdir, "translations"),
+            "RATE_LIMIT_ENABLED": False,
+            "RATE_LIMIT_BACKEND": "local",
+        }
+        if database_url.startswith("sqlite"):
+            overrides["SQLALCHEMY_ENGINE_OPTIONS"] = {
+                "connect_args": {"timeout": 30, "check_same_thread": False}}
+        app = create_app(overrides)
+
+        sizes = SeedSizes(users=200, helpers=50, posts=0, conversations=args.conversations,
+                          messages_per_conversation=10, pending_requests=0, offered_requests=0)
+        with app.app_context():
+            db.create_all()
+            seeded = seed_database(sizes, seed=args.seed, bcrypt_rounds=4)
+
+        print(f"{'mode':<13}{'msgs':>8}{'err':>5}{'msg/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+              f"{'batch':>8}  (ms)")
+        results = [run(mode, app, seeded.conversations, args) for mode in ("per-request", "group")]
+        for r in results:
+            print(f"{r['mode']:<13}{r['messages']:>8}{r['errors']:>5}{r['messages_per_s']:>10.1f}"
+                  f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['avg_batch']:>8.1f}")
+        baseline = results[0]["messages_per_s"]
+        if baseline:
+            print(f"group commit: x{results[1]['messages_per_s'] / baseline:.2f} messages/s")
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
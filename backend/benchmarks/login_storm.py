@@ -0,0 +1,103 @@
+"""로그인 폭주 벤치마크
+
+요청 워커(WSGI 스레드)를 스레드 풀로 흉내 내고, 로그인 요청을 한꺼번에 몰아넣는 동안
+가벼운 "다른 라우트" 요청을 일정 간격으로 보내 지연 시간을 측정합니다.
+
+- direct : 요청 워커에서 bcrypt.checkpw 직접 실행 (기존 방식)
+- pool   : PasswordHasher 해싱 풀 경유, 포화 시 즉시 503
+
+실행: python -m benchmarks.login_storm --logins 200 --request-workers 16
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app.hashing import PasswordHasher, HashPoolSaturated
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(mode, args, password, password_hash):
+    hasher = PasswordHasher(rounds=args.rounds, workers=args.hash_workers,
+                            queue_size=args.hash_queue)
+    workers = ThreadPoolExecutor(max_workers=args.request_workers)
+
+    def login():
+        start = time.perf_counter()
+        try:
+            if mode == "direct":
+                bcrypt.checkpw(password, password_hash)
+            else:
+                hasher.check_password(password.decode('utf-8'), password_hash.decode('utf-8'))
+            status = 200
+        except HashPoolSaturated:
+            status = 503
+        return status, time.perf_counter() - start
+
+    def other_route(submitted_at):
+        time.sleep(args.other_cost_ms / 1000)
+        return time.perf_counter() - submitted_at
+
+    started = time.perf_counter()
+    login_futures = [workers.submit(login) for _ in range(args.logins)]
+
+    other_futures = []
+    while not all(f.done() for f in login_futures):
+        other_futures.append(workers.submit(other_route, time.perf_counter()))
+        time.sleep(args.other_interval_ms / 1000)
+
+    results = [f.result() for f in login_futures]
+    elapsed = time.perf_counter() - started
+    other_latencies = [f.result() * 1000 for f in other_futures]
+    workers.shutdown()
+
+    ok = sum(1 for status, _ in results if status == 200)
+    rejected = len(results) - ok
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "logins_ok": ok,
+        "logins_503": rejected,
+        "login_throughput_per_s": ok / elapsed if elapsed else 0.0,
+        "other_p50_ms": percentile(other_latencies, 50),
+        "other_p95_ms": percentile(other_latencies, 95),
+        "other_p99_ms": percentile(other_latencies, 99),
+        "other_mean_ms": statistics.mean(other_latencies) if other_latencies else 0.0,
+        "other_samples": len(other_latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--request-workers", type=int, default=16)
+    parser.add_argument("--hash-workers", type=int, default=4)
+    parser.add_argument("--hash-queue", type=int, default=4)
+    parser.add_argument("--other-cost-ms", type=float, default=1.0)
+    parser.add_argument("--other-interval-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    password = b"correct horse battery staple"
+    password_hash = bcrypt.hashpw(password, bcrypt.gensalt(args.rounds))
+
+    print(f"{'mode':<8}{'ok':>6}{'503':>6}{'login/s':>10}"
+          f"{'other p50':>11}{'p95':>9}{'p99':>9}  (ms)")
+    for mode in ("direct", "pool"):
+        r = run(mode, args, password, password_hash)
+        print(f"{r['mode']:<8}{r['logins_ok']:>6}{r['logins_503']:>6}"
+              f"{r['login_throughput_per_s']:>10.1f}{r['other_p50_ms']:>11.1f}"
+              f"{r['other_p95_ms']:>9.1f}{r['other_p99_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""요청 계측(/metrics) 오버헤드 벤치마크
+
+가장 가벼운 라우트(GET /)를 Flask test client로 반복 호출해 요청당 평균 시간을 비교합니다.
+DB를 쓰지 않는 라우트라 실제 라우트보다 계측 비율이 크게 나오는 최악의 경우입니다.
+
+- off      : METRICS_ENABLED=0
+- metrics  : 히스토그램 / 상태 코드 / 처리 중 요청 수 기록
+- profiler : metrics + 샘플링 프로파일러 (임계값을 넘는 요청이 없으므로 파일은 쓰지 않음)
+
+실행: python -m benchmarks.metrics_overhead --requests 20000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from app import create_app
+
+
+def build_app(mode, workdir):
+    return create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "CATALOG_PRELOAD": False,
+        "DB_PROFILER_ENABLED": False,
+        "RATE_LIMIT_ENABLED": False,
+        "RATE_LIMIT_BACKEND": "local",
+        "HELPER_INDEX_VERSION_FILE": os.path.join(workdir, "helper_index.version"),
+        "CATALOG_VERSION_FILE": os.path.join(workdir, "catalog.version"),
+        "BOARD_CACHE_VERSION_DIR": os.path.join(workdir, "board_versions"),
+        "TRANSLATION_CACHE_DIR": os.path.join(workdir, "translations"),
+        "METRICS_ENABLED": mode != "off",
+        "METRICS_DIR": os.path.join(workdir, "metrics"),
+        "PROFILER_ENABLED": mode == "profiler",
+        "PROFILER_DIR": os.path.join(workdir, "profiles"),
+    })
+
+
+def run(mode, args, workdir):
+    client = build_app(mode, workdir).test_client()
+    for _ in range(args.warmup):
+        client.get("/")
+    rounds = []
+    per_round = args.requests // args.rounds
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        for _ in range(per_round):
+            client.get("/")
+        rounds.append((time.perf_counter() - started) / per_round * 1e6)
+    return statistics.median(rounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hi-campus-metrics-") as workdir:
+        results = {mode: run(mode, args, workdir) for mode in ("off", "metrics", "profiler")}
+
+    baseline = results["off"]
+    print(f"{'mode':<10}{'us/req':>10}{'overhead':>11}")
+    for mode, us in results.items():
+        print(f"{mode:<10}{us:>10.1f}{(us - baseline) / baseline * 100:>+10.1f}%")
+
+
+if __name__ == "__main__":
+    main()
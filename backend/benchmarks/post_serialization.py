@@ -0,0 +1,111 @@
+"""게시글 목록 직렬화 벤치마크
+
+기존 방식(ORM 로딩 + PostSchema.dump, 작성자 lazy load)과
+serializers.post_list_query + serialize_post_row + dumps 경로를 비교합니다.
+SQLite 메모리 DB에 합성 데이터를 넣고 페이지당 쿼리 수와 처리 시간을 측정합니다.
+
+실행: python -m benchmarks.post_serialization --posts 2000 --page-size 20 --rounds 200
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from flask import jsonify
+from sqlalchemy import event
+
+from app import create_app
+from app.database import db
+from app.models import Language, Country, Schools, Colleges, Departments, Users, \
+    Communities, Boards, Posts
+from app.schemas import post_schema
+from app.serializers import post_list_query, serialize_post_row, dumps
+
+
+def seed(n_users, n_posts):
+    db.session.add_all([
+        Language(code="ko", name="Korean", native_name="한국어"),
+        Country(iso2="VN", name="Vietnam"),
+        Schools(id=1, school_name="Keimyung University"),
+        Colleges(id=1, school_id=1, college_name="Engineering"),
+        Departments(id=1, school_id=1, college_id=1, department_name="Computer Engineering"),
+        Communities(id=1, school_id=1, community_name="Vietnamese", nationality_iso2="VN"),
+        Boards(id=1, community_id=1, board_name="Free"),
+    ])
+    db.session.flush()
+    db.session.add_all([
+        Users(id=i, email=f"user{i}@example.com", password_hash="x", nickname=f"user{i}",
+              realname=f"User {i}", gender="male", main_language="ko", nationality_iso2="VN",
+              school_id=1, department_id=1, enrollment_year=2024)
+        for i in range(1, n_users + 1)
+    ])
+    db.session.flush()
+    now = datetime.utcnow()
+    db.session.add_all([
+        Posts(id=i, board_id=1, user_id=(i % n_users) + 1, title=f"제목 {i}",
+              content="본문 " * 40, original_lang="ko", is_anonymous=(i % 5 == 0),
+              like_count=i % 7, comment_count=i % 3,
+              created_at=now - timedelta(minutes=i), updated_at=now)
+        for i in range(1, n_posts + 1)
+    ])
+    db.session.commit()
+
+
+def schema_path(limit):
+    posts = Posts.query.filter_by(board_id=1).order_by(Posts.created_at.desc()).limit(limit).all()
+    result = []
+    for post in posts:
+        post_data = post_schema.dump(post)
+        if post.is_anonymous:
+            post_data['author'] = {"nickname": "익명"}
+            post_data['user_id'] = None
+        result.append(post_data)
+    return jsonify(result).get_data()
+
+
+def fast_path(limit):
+    rows = post_list_query().filter(Posts.board_id == 1)\
+                            .order_by(Posts.created_at.desc(), Posts.id.desc())\
+                            .limit(limit).all()
+    return dumps({"posts": [serialize_post_row(row) for row in rows]})
+
+
+def measure(fn, limit, rounds, counter):
+    db.session.expunge_all()
+    counter["n"] = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(limit)
+        db.session.expunge_all()  # 요청마다 새 세션인 것처럼 identity map 비움
+    elapsed = time.perf_counter() - start
+    return elapsed / rounds * 1000, counter["n"] / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://", "SQLALCHEMY_ENGINE_OPTIONS": {},
+                      "POST_COUNTER_FLUSH_INTERVAL": 0, "CATALOG_PRELOAD": False,
+                      "BOARD_CACHE_BACKEND": "local"})
+    with app.app_context():
+        db.create_all()
+        seed(args.users, args.posts)
+
+        counter = {"n": 0}
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def count_queries(*_):
+            counter["n"] += 1
+
+        with app.test_request_context():
+            for name, fn in (("PostSchema", schema_path), ("fast path", fast_path)):
+                ms, queries = measure(fn, args.page_size, args.rounds, counter)
+                print(f"{name:<12} {ms:8.3f} ms/page  {queries:5.1f} queries/page")
+
+
+if __name__ == "__main__":
+    main()
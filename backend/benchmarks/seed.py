@@ -0,0 +1,203 @@
+"""벤치마크용 합성 데이터 생성
+
+학교/단과대학/학과, 사용자(도우미 + 외국인 학생), 커뮤니티/게시판, 글, 매칭/대화방/메시지,
+대기(pending)/제안(offered) 매칭 요청을 id를 직접 지정한 다중 INSERT로 빠르게 채웁니다.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import bcrypt
+
+from app.database import db
+from app.models import (Language, Country, Schools, Colleges, Departments, Users, HelperProfiles,
+                        HelperLanguages, Communities, Boards, Posts, MatchRequests, Matches,
+                        Conversations, ConversationParticipants, Messages)
+
+LANGUAGES = [("ko", "Korean", "한국어"), ("en", "English", "English"), ("vi", "Vietnamese", "Tiếng Việt"),
+             ("zh", "Chinese", "中文"), ("ja", "Japanese", "日本語"), ("my", "Burmese", "မြန်မာ")]
+COUNTRIES = [("KR", "Korea", "ko"), ("VN", "Vietnam", "vi"), ("CN", "China", "zh"),
+             ("JP", "Japan", "ja"), ("MM", "Myanmar", "my"), ("US", "United States", "en")]
+WORDS = ["기숙사", "수강신청", "장학금", "아르바이트", "비자", "외국인등록증", "도서관", "학식",
+         "visa", "dorm", "scholarship", "part-time", "library", "TOPIK", "병원", "은행", "계좌"]
+
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class SeedSizes:
+    schools: int = 2
+    colleges_per_school: int = 5
+    departments_per_college: int = 4
+    users: int = 2000
+    helpers: int = 300
+    boards_per_community: int = 3
+    posts: int = 20000
+    conversations: int = 100
+    messages_per_conversation: int = 300
+    pending_requests: int = 300
+    offered_requests: int = 300
+
+
+@dataclass
+class SeedResult:
+    """시나리오에서 쓸 id 목록"""
+    school_ids: list = field(default_factory=list)
+    user_emails: dict = field(default_factory=dict)
+    helper_ids: list = field(default_factory=list)
+    student_ids: list = field(default_factory=list)
+    idle_student_ids: list = field(default_factory=list)   # 매칭 요청이 없는 학생
+    board_ids: list = field(default_factory=list)
+    post_ids: list = field(default_factory=list)
+    post_created_at: dict = field(default_factory=dict)
+    conversations: list = field(default_factory=list)      # (conv_id, mentor_id, mentee_id, last_msg_id)
+    pending_request_ids: list = field(default_factory=list)
+    offered_requests: list = field(default_factory=list)   # (request_id, mentor_id)
+
+
+def _insert(model, rows, chunk=5000):
+    table = model.__table__
+    for start in range(0, len(rows), chunk):
+        db.session.execute(table.insert(), rows[start:start + chunk])
+
+
+def _text(rng, n_words):
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def seed_database(sizes, seed=42, bcrypt_rounds=4):
+    """sizes(SeedSizes)만큼 데이터를 만들고 SeedResult 반환. 호출 전 db.create_all() 필요"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    out = SeedResult()
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(bcrypt_rounds)).decode("utf-8")
+
+    _insert(Language, [{"code": c, "name": n, "native_name": nn} for c, n, nn in LANGUAGES])
+    _insert(Country, [{"iso2": iso2, "name": name} for iso2, name, _ in COUNTRIES])
+
+    schools, colleges, departments = [], [], []
+    dept_by_school = {}
+    for s in range(1, sizes.schools + 1):
+        schools.append({"id": s, "school_name": f"University {s}",
+                        "website_url": f"https://univ{s}.example.ac.kr"})
+        for c in range(sizes.colleges_per_school):
+            college_id = len(colleges) + 1
+            colleges.append({"id": college_id, "school_id": s, "college_name": f"College {college_id}"})
+            for _ in range(sizes.departments_per_college):
+                dept_id = len(departments) + 1
+                departments.append({"id": dept_id, "school_id": s, "college_id": college_id,
+                                    "department_name": f"Department {dept_id}"})
+                dept_by_school.setdefault(s, []).append(dept_id)
+    _insert(Schools, schools)
+    _insert(Colleges, colleges)
+    _insert(Departments, departments)
+    out.school_ids = [s["id"] for s in schools]
+
+    users, profiles, helper_langs = [], [], []
+    school_of = {}
+    foreign = [c for c in COUNTRIES if c[0] != "KR"]
+    for uid in range(1, sizes.users + 1):
+        is_helper = uid <= sizes.helpers
+        school_id = rng.choice(out.school_ids)
+        if is_helper:
+            iso2, lang = "KR", "ko"
+        else:
+            iso2, _, lang = rng.choice(foreign)
+        email = f"user{uid}@bench.example.com"
+        users.append({"id": uid, "email": email, "password_hash": password_hash,
+                      "nickname": f"user{uid}", "realname": f"User {uid}",
+                      "gender": rng.choice(["male", "female"]), "main_language": lang,
+                      "nationality_iso2": iso2, "school_id": school_id,
+                      "department_id": rng.choice(dept_by_school[school_id]),
+                      "enrollment_year": rng.randint(2019, 2025), "is_helper": is_helper})
+        school_of[uid] = school_id
+        out.user_emails[uid] = email
+        if is_helper:
+            out.helper_ids.append(uid)
+            profiles.append({"id": uid, "user_id": uid, "intro": "도와드릴게요",
+                             "created_at": now - timedelta(days=rng.randint(0, 700))})
+            for code in rng.sample([l[0] for l in LANGUAGES if l[0] != "ko"], rng.randint(1, 3)):
+                helper_langs.append({"id": len(helper_langs) + 1, "user_id": uid, "language_code": code})
+        else:
+            out.student_ids.append(uid)
+    _insert(Users, users)
+    _insert(HelperProfiles, profiles)
+    _insert(HelperLanguages, helper_langs)
+
+    communities, boards = [], []
+    for s in out.school_ids:
+        for iso2, name, _ in foreign:
+            community_id = len(communities) + 1
+            communities.append({"id": community_id, "school_id": s,
+                                "community_name": f"{name} students", "nationality_iso2": iso2})
+            for b in range(sizes.boards_per_community):
+                board_id = len(boards) + 1
+                boards.append({"id": board_id, "community_id": community_id,
+                               "board_name": f"Board {board_id}", "order_index": b})
+    _insert(Communities, communities)
+    _insert(Boards, boards)
+    out.board_ids = [b["id"] for b in boards]
+
+    posts = []
+    for pid in range(1, sizes.posts + 1):
+        created_at = now - timedelta(seconds=(sizes.posts - pid) * 30)
+        posts.append({"id": pid, "board_id": rng.choice(out.board_ids),
+                      "user_id": rng.randint(1, sizes.users), "title": _text(rng, 4),
+                      "content": _text(rng, 30), "original_lang": "ko",
+                      "is_anonymous": rng.random() < 0.2, "like_count": 0, "comment_count": 0,
+                      "created_at": created_at, "updated_at": created_at})
+        out.post_ids.append(pid)
+        out.post_created_at[pid] = created_at
+    _insert(Posts, posts)
+
+    # 진행 중 매칭 + 대화방 + 메시지
+    students = list(out.student_ids)
+    rng.shuffle(students)
+    requests, matches, convs, participants, messages = [], [], [], [], []
+    for i in range(sizes.conversations):
+        mentee = students.pop()
+        mentor = rng.choice(out.helper_ids)
+        request_id = len(requests) + 1
+        requests.append({"id": request_id, "requester_user_id": mentee, "preferred_gender": "any",
+                         "status": "accepted", "offered_mentor_user_id": mentor,
+                         "created_at": now - timedelta(days=30)})
+        matches.append({"id": i + 1, "mentor_user_id": mentor, "mentee_user_id": mentee,
+                        "school_id": school_of[mentee], "request_id": request_id, "status": "active",
+                        "started_at": now - timedelta(days=30)})
+        last_msg_id = None
+        for m in range(sizes.messages_per_conversation):
+            last_msg_id = len(messages) + 1
+            messages.append({"id": last_msg_id, "conversation_id": i + 1,
+                             "sender_user_id": mentor if m % 2 else mentee,
+                             "content": _text(rng, 8),
+                             "created_at": now - timedelta(minutes=sizes.messages_per_conversation - m)})
+        convs.append({"id": i + 1, "match_id": i + 1, "last_message_id": last_msg_id,
+                      "created_at": now - timedelta(days=30)})
+        for uid in (mentor, mentee):
+            participants.append({"id": len(participants) + 1, "conversation_id": i + 1,
+                                 "user_id": uid, "unread_count": 0})
+        out.conversations.append((i + 1, mentor, mentee, last_msg_id))
+
+    for _ in range(min(sizes.pending_requests, len(students))):
+        request_id = len(requests) + 1
+        requests.append({"id": request_id, "requester_user_id": students.pop(),
+                         "preferred_gender": rng.choice(["any", "male", "female"]),
+                         "status": "pending", "created_at": now - timedelta(hours=rng.randint(1, 200))})
+        out.pending_request_ids.append(request_id)
+    for _ in range(min(sizes.offered_requests, len(students))):
+        request_id = len(requests) + 1
+        mentor = rng.choice(out.helper_ids)
+        requests.append({"id": request_id, "requester_user_id": students.pop(),
+                         "preferred_gender": "any", "status": "offered",
+                         "offered_mentor_user_id": mentor,
+                         "created_at": now - timedelta(hours=rng.randint(1, 200))})
+        out.offered_requests.append((request_id, mentor))
+    out.idle_student_ids = students
+
+    _insert(MatchRequests, requests)
+    _insert(Matches, matches)
+    _insert(Conversations, convs)
+    _insert(ConversationParticipants, participants)
+    _insert(Messages, messages)
+    db.session.commit()
+    return out
@@ -1,17 +1,34 @@
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
 import mysql.connector
 from mysql.connector import errorcode
 
 # 보안을 위해 다른 파일에 분리하거나 환경 변수를 사용하는 것이 좋습니다.
 DB_CONFIG = {
-    'host': '127.0.0.1',
-    'user': 'root',
-    'password': '1234',
-    'db': 'hi_campus',
+    'host': os.getenv("DB_HOST", '127.0.0.1'),
+    'user': os.getenv("DB_USER", 'root'),
+    'password': os.getenv("DB_PASS", '1234'),
+    'db': os.getenv("DB_NAME", 'hi_campus'),
     'charset': 'utf8mb4'
 }
 
+# 커넥션 풀 설정 (Flask 앱의 DB_POOL_* 환경 변수와 같은 이름)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))        # 커넥션 최대 수명(초)
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))          # 빈 커넥션 대기 시간(초)
+POOL_PING_INTERVAL = int(os.getenv("DB_POOL_PING_INTERVAL", 30)) # 이 시간 이상 쉬었던 커넥션은 꺼낼 때 ping
+
+
+class PoolTimeout(Exception):
+    """POOL_TIMEOUT 안에 커넥션을 얻지 못함"""
+
+
 def get_db_connection():
-    """데이터베이스 커넥션을 생성하고 반환하는 함수"""
+    """풀을 거치지 않는 새 커넥션 (일회성 스크립트/벤치마크 비교용). 요청 처리에는 pool.connection() 사용"""
     try:
         conn = mysql.connector.connect(**DB_CONFIG)
         return conn
@@ -22,4 +39,149 @@ def get_db_connection():
             print("데이터베이스가 존재하지 않습니다.")
         else:
             print(err)
-        return None
\ No newline at end of file
+        return None
+
+
+class _Entry:
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = self.last_used = time.monotonic()
+
+
+class ConnectionPool:
+    """mysql.connector 커넥션 풀
+
+    - 동시에 빌려줄 수 있는 커넥션은 최대 size개, 남는 커넥션은 LIFO로 재사용
+    - 꺼낼 때 수명(recycle)이 지난 커넥션은 닫고 새로 연결
+    - ping_interval 이상 쉬었던 커넥션은 ping으로 확인하고 끊겼으면 새로 연결
+    - 반납할 때 rollback으로 열린 트랜잭션을 정리
+    """
+
+    def __init__(self, config, size=10, recycle=1800, timeout=30, ping_interval=30):
+        self.config = config
+        self.size = size
+        self.recycle = recycle
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self.broken = 0
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self.config)
+        with self._lock:
+            self.created += 1
+        return _Entry(conn)
+
+    def _discard(self, entry):
+        try:
+            entry.conn.close()
+        except mysql.connector.Error:
+            pass
+
+    def _checkout_idle(self):
+        """재사용 가능한 유휴 커넥션 하나 (없으면 None)"""
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            now = time.monotonic()
+            if now - entry.created_at >= self.recycle:
+                self._discard(entry)
+                with self._lock:
+                    self.recycled += 1
+                continue
+            if now - entry.last_used >= self.ping_interval:
+                try:
+                    entry.conn.ping(reconnect=False)
+                except mysql.connector.Error:
+                    self._discard(entry)
+                    with self._lock:
+                        self.broken += 1
+                    continue
+            with self._lock:
+                self.reused += 1
+            return entry
+
+    def acquire(self):
+        if self._closed:
+            raise RuntimeError("connection pool is closed")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f"no database connection available within {self.timeout}s")
+        try:
+            return self._checkout_idle() or self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, entry, discard=False):
+        try:
+            if discard or self._closed:
+                self._discard(entry)
+                return
+            try:
+                entry.conn.rollback()
+            except mysql.connector.Error:
+                self._discard(entry)
+                with self._lock:
+                    self.broken += 1
+                return
+            entry.last_used = time.monotonic()
+            self._idle.put(entry)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ... (연결 오류가 난 커넥션은 반납하지 않고 버림)"""
+        entry = self.acquire()
+        discard = False
+        try:
+            yield entry.conn
+        except (mysql.connector.OperationalError, mysql.connector.InterfaceError):
+            discard = True
+            raise
+        finally:
+            self.release(entry, discard=discard)
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def stats(self):
+        with self._lock:
+            return {"size": self.size, "idle": self._idle.qsize(), "created": self.created,
+                    "reused": self.reused, "recycled": self.recycled, "broken": self.broken}
+
+
+pool = None
+
+
+def init_pool(**overrides):
+    """앱 시작 시(lifespan) 호출. 첫 커넥션을 미리 열어 DB 설정 오류를 시작 시점에 드러냄"""
+    global pool
+    options = {"size": POOL_SIZE, "recycle": POOL_RECYCLE, "timeout": POOL_TIMEOUT,
+               "ping_interval": POOL_PING_INTERVAL}
+    options.update(overrides)
+    pool = ConnectionPool(DB_CONFIG, **options)
+    pool.release(pool.acquire())
+    return pool
+
+
+def close_pool():
+    global pool
+    if pool is not None:
+        pool.close()
+        pool = None
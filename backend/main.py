@@ -1,12 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+import database
+import security
 from routers import auth # 우리가 만든 auth.py 파일을 불러옵니다.
 
+
+@asynccontextmanager
+async def lifespan(app):
+    """시작 시 DB 커넥션 풀 / 해싱 스레드 풀 생성, 종료 시 정리"""
+    database.init_pool()
+    security.start_hasher()
+    yield
+    security.stop_hasher()
+    database.close_pool()
+
+
 # FastAPI 앱 생성
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # '/api/auth' 경로로 들어오는 요청들을 auth.py 파일의 router가 처리하도록 등록
 app.include_router(auth.router)
 
 @app.get("/")
 def read_root():
-    return {"message": "Hi-Campus API 서버에 오신 것을 환영합니다!"}
\ No newline at end of file
+    return {"message": "Hi-Campus API 서버에 오신 것을 환영합니다!"}
+
+
+@app.get("/health")
+def health():
+    """커넥션 풀 상태 (created / reused 비율로 커넥션 재사용 확인)"""
+    return {"status": "ok", "db_pool": database.pool.stats() if database.pool else None}
@@ -0,0 +1,2 @@
+-- [user-001] 게시판별 최신순 커서 페이지네이션용 복합 인덱스 (models.Posts.__table_args__)
+ALTER TABLE posts ADD INDEX ix_posts_board_created_id (board_id, created_at, id);
@@ -0,0 +1,2 @@
+-- [user-002] 대화방별 id 커서(after_id / before_id) 조회용 복합 인덱스 (models.Messages.__table_args__)
+ALTER TABLE messages ADD INDEX ix_messages_conversation_id_id (conversation_id, id);
@@ -0,0 +1,5 @@
+-- [user-007] 일괄 자동 매칭: 제안 받은 도우미 컬럼 + 상태별 대기 순서 인덱스 (models.MatchRequests)
+ALTER TABLE match_requests ADD COLUMN offered_mentor_user_id BIGINT NULL;
+ALTER TABLE match_requests ADD CONSTRAINT fk_match_requests_offered_mentor
+    FOREIGN KEY (offered_mentor_user_id) REFERENCES users (id);
+ALTER TABLE match_requests ADD INDEX ix_match_requests_status_created (status, created_at);
@@ -0,0 +1,10 @@
+-- [user-008] 요청당 매칭 1개 (models.Matches.__table_args__ uq_matches_request_id)
+-- 이미 같은 요청으로 매칭이 여러 개 생긴 경우 가장 먼저 만든 매칭만 request_id를 유지하고
+-- 나머지는 request_id를 비움 (매칭/대화 데이터는 그대로 둠)
+UPDATE matches m
+JOIN (SELECT request_id, MIN(id) AS keep_id FROM matches
+      WHERE request_id IS NOT NULL GROUP BY request_id HAVING COUNT(*) > 1) d
+  ON d.request_id = m.request_id
+SET m.request_id = NULL
+WHERE m.id <> d.keep_id;
+ALTER TABLE matches ADD CONSTRAINT uq_matches_request_id UNIQUE (request_id);
@@ -0,0 +1,28 @@
+-- [user-014] 대화 받은편지함: 마지막 메시지 / 참여자별 안 읽은 수 (models.Conversations, ConversationParticipants)
+ALTER TABLE conversations ADD COLUMN last_message_id BIGINT NULL;
+ALTER TABLE conversation_participants ADD COLUMN unread_count INT NOT NULL DEFAULT 0;
+
+-- (conversation_id, user_id) 중복 참여자 정리: 가장 먼저 만든 행에 가장 늦은 읽음 시각을 남기고 나머지는 삭제
+UPDATE conversation_participants keep_row
+JOIN (SELECT MIN(id) AS keep_id, MAX(last_read_at) AS last_read_at FROM conversation_participants
+      GROUP BY conversation_id, user_id HAVING COUNT(*) > 1) d
+  ON d.keep_id = keep_row.id
+SET keep_row.last_read_at = d.last_read_at;
+DELETE dup FROM conversation_participants dup
+JOIN conversation_participants keep_row
+  ON keep_row.conversation_id = dup.conversation_id
+ AND keep_row.user_id = dup.user_id
+ AND keep_row.id < dup.id;
+ALTER TABLE conversation_participants
+    ADD CONSTRAINT uq_conversation_participants_conv_user UNIQUE (conversation_id, user_id);
+ALTER TABLE conversation_participants
+    ADD INDEX ix_conversation_participants_user_conv (user_id, conversation_id);
+
+-- 기존 메시지 기준으로 채우기 (flask rebuild-inbox-counters와 같은 계산)
+UPDATE conversations c
+SET c.last_message_id = (SELECT MAX(m.id) FROM messages m WHERE m.conversation_id = c.id);
+UPDATE conversation_participants p
+SET p.unread_count = (SELECT COUNT(*) FROM messages m
+                      WHERE m.conversation_id = p.conversation_id
+                        AND m.sender_user_id <> p.user_id
+                        AND (p.last_read_at IS NULL OR m.created_at > p.last_read_at));
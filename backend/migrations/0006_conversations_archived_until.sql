@@ -0,0 +1,3 @@
+-- [user-020] 종료된 매칭 대화 아카이브: 이 id까지의 메시지는 세그먼트 파일에 있음 (models.Conversations)
+-- message_archive_segments 테이블은 flask migrate가 create_all로 먼저 만듦
+ALTER TABLE conversations ADD COLUMN archived_until_id BIGINT NULL;
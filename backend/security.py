@@ -0,0 +1,35 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+HASH_WORKERS = int(os.getenv("HASH_POOL_WORKERS", os.cpu_count() or 2))
+
+# bcrypt는 해싱 중 GIL을 놓으므로 전용 스레드 풀에서 병렬로 돌고, 이벤트 루프는 막히지 않음
+_executor = None
+
+
+def start_hasher(workers=None):
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=workers or HASH_WORKERS, thread_name_prefix="bcrypt")
+
+
+def stop_hasher():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+async def hash_password(password, rounds=None):
+    """평문 비밀번호를 bcrypt 해시 문자열로 (해싱 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _hash, password, rounds or BCRYPT_ROUNDS)
+
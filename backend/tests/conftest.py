@@ -0,0 +1,97 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from app import create_app
+from app.database import db
+from app.models import Language, Country, Schools, Colleges, Departments, Users, Communities, Boards, \
+    Matches, Conversations, ConversationParticipants
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """임시 디렉터리의 SQLite 파일 DB를 쓰는 설정 (버전 파일 / 캐시 디렉터리도 tmp_path 아래)"""
+    return {
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp_path, 'test.db')}",
+        "SQLALCHEMY_ENGINE_OPTIONS": {"connect_args": {"check_same_thread": False}},
+        "BCRYPT_ROUNDS": 4,
+        "CATALOG_PRELOAD": False,
+        "POST_COUNTER_FLUSH_INTERVAL": 0,
+        "BATCH_MATCH_INTERVAL": 0,
+        "HELPER_INDEX_VERSION_FILE": os.path.join(tmp_path, "helper_index.version"),
+        "CATALOG_VERSION_FILE": os.path.join(tmp_path, "catalog.version"),
+        "BOARD_CACHE_VERSION_DIR": os.path.join(tmp_path, "board_versions"),
+        "TRANSLATION_CACHE_DIR": os.path.join(tmp_path, "translations"),
+        "MESSAGE_ARCHIVE_DIR": os.path.join(tmp_path, "message_archive"),
+        "METRICS_DIR": os.path.join(tmp_path, "metrics"),
+        "PROFILER_DIR": os.path.join(tmp_path, "profiles"),
+        "RATE_LIMIT_ENABLED": False,
+        "RATE_LIMIT_BACKEND": "local",
+        "MESSAGE_BROKER_BACKEND": "local",
+    }
+
+
+@pytest.fixture
+def app(app_config):
+    app = create_app(app_config)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def board(app):
+    """학교 / 학과 / 커뮤니티 / 게시판 1개씩과 사용자 2명 (id 1, 2)"""
+    db.session.add_all([
+        Language(code="ko", name="Korean", native_name="한국어"),
+        Country(iso2="VN", name="Vietnam"),
+        Schools(id=1, school_name="Keimyung University"),
+        Colleges(id=1, school_id=1, college_name="Engineering"),
+        Departments(id=1, school_id=1, college_id=1, department_name="Computer Engineering"),
+        Communities(id=1, school_id=1, community_name="Vietnamese", nationality_iso2="VN"),
+        Boards(id=1, community_id=1, board_name="Free"),
+    ])
+    db.session.flush()
+    db.session.add_all([
+        Users(id=i, email=f"user{i}@example.com", password_hash="x", nickname=f"user{i}",
+              realname=f"User {i}", gender="male", main_language="ko", nationality_iso2="VN",
+              school_id=1, department_id=1, enrollment_year=2024)
+        for i in (1, 2)
+    ])
+    db.session.commit()
+    return db.session.get(Boards, 1)
+
+
+@pytest.fixture
+def conversations(board):
+    """사용자 1, 2가 참여한 대화방 2개 (id 1, 2)"""
+    for conv_id in (1, 2):
+        db.session.add(Matches(id=conv_id, mentor_user_id=1, mentee_user_id=2, school_id=1))
+        db.session.add(Conversations(id=conv_id, match_id=conv_id))
+        db.session.add_all([ConversationParticipants(conversation_id=conv_id, user_id=1),
+                            ConversationParticipants(conversation_id=conv_id, user_id=2)])
+    db.session.commit()
+    return [1, 2]
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app):
+    """auth_headers(user_id) -> 로그인 응답과 같은 형식의 Bearer 토큰 헤더"""
+    def make(user_id):
+        now = datetime.now(timezone.utc)
+        token = jwt.encode({"user_id": user_id, "sub": f"user{user_id}@example.com",
+                            "iat": now, "exp": now + timedelta(days=1)},
+                           app.config['SECRET_KEY'], algorithm="HS256")
+        return {"Authorization": f"Bearer {token}"}
+    return make
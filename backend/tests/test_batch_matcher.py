@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from app.batch_matcher import PendingRequest, compute_assignment
+from app.helper_index import HelperEntry
+
+
+def helper(user_id, gender="female", school_id=1, college_id=1, languages=("ko",)):
+    return HelperEntry(user_id, f"helper{user_id}", gender, school_id, college_id,
+                       frozenset(languages), datetime(2024, 1, 1))
+
+
+def req(request_id, language="ko", gender="any", college_id=None, school_id=1):
+    return PendingRequest(request_id, language, gender, college_id, school_id)
+
+
+def test_assigns_least_loaded_helper_and_respects_capacity():
+    helpers = {1: helper(1), 2: helper(2)}
+    assignments = compute_assignment([req(10), req(11), req(12), req(13)], helpers,
+                                     load={1: 1}, capacity=2)
+    # 2번(부하 0)이 먼저, 이후 부하가 같아지면 번갈아 배정되고 둘 다 capacity에 차면 남은 요청은 대기
+    assert assignments == [(10, 2), (11, 1), (12, 2)]
+
+
+def test_prefers_same_school_over_lower_load():
+    helpers = {1: helper(1, school_id=2), 2: helper(2, school_id=1)}
+    assert compute_assignment([req(10, school_id=1)], helpers, load={2: 2}, capacity=3) == [(10, 2)]
+
+
+def test_filters_by_language_gender_and_college():
+    helpers = {
+        1: helper(1, gender="male", languages=("vi",)),
+        2: helper(2, gender="female", college_id=2, languages=("vi", "ko")),
+        3: helper(3, gender="female", college_id=1, languages=("vi",)),
+    }
+    requests = [
+        req(10, language="vi", gender="female", college_id=1),
+        req(11, language="ko"),
+        req(12, language="vi", gender="male", college_id=2),  # 조건을 모두 만족하는 도우미 없음
+        req(13, language="en"),
+    ]
+    assert compute_assignment(requests, helpers, load={}, capacity=5) == [(10, 3), (11, 2)]
+
+
+def test_load_from_earlier_requests_is_shared_across_groups():
+    helpers = {1: helper(1, languages=("ko", "vi"))}
+    requests = [req(10, language="ko"), req(11, language="vi")]
+    # 언어가 달라 힙은 따로지만 capacity 1인 도우미는 한 번만 배정됨
+    assert compute_assignment(requests, helpers, load={}, capacity=1) == [(10, 1)]
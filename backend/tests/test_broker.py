@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from app.broker import DatabasePollingBackend, conversation_channel
+from app.database import db
+from app.models import Messages
+
+
+@pytest.fixture
+def backend(app, conversations):
+    app.config["MESSAGE_BROKER_POLL_INTERVAL"] = 3600  # 폴링은 테스트에서 poll()로 직접 호출
+    return DatabasePollingBackend(app=app)
+
+
+def insert_messages(conv_id, count, sender=1):
+    """다른 워커가 저장한 메시지처럼 DB에만 넣음"""
+    db.session.execute(Messages.__table__.insert(), [
+        {"conversation_id": conv_id, "sender_user_id": sender, "content": f"m{i}",
+         "created_at": datetime(2024, 3, 1, 12, 0)} for i in range(count)])
+    db.session.commit()
+
+
+def drain(sub):
+    events = []
+    while (event := sub.get(timeout=0)) is not None:
+        events.append(event)
+    return events
+
+
+def test_poll_delivers_messages_from_other_workers_once(backend):
+    insert_messages(1, 2)
+    sub = backend.subscribe(conversation_channel(1))  # 구독 전 메시지는 전달하지 않음
+    insert_messages(1, 3)
+
+    assert backend.poll() == 3
+    assert [e["content"] for e in drain(sub)] == ["m0", "m1", "m2"]
+    assert backend.poll() == 0
+
+    # 같은 프로세스에서 publish한 메시지는 폴링으로 다시 전달되지 않음
+    insert_messages(1, 1)
+    last = db.session.query(Messages).order_by(Messages.id.desc()).first()
+    backend.publish(conversation_channel(1), {"id": last.id, "content": last.content})
+    assert backend.poll() == 0
+    assert len(drain(sub)) == 1
+
+
+def test_quiet_conversation_is_not_starved_by_a_busy_one(backend):
+    insert_messages(1, 1)
+    insert_messages(2, backend.batch_size + 100)
+    quiet = backend.subscribe(conversation_channel(1))
+    busy = backend.subscribe(conversation_channel(2))
+    insert_messages(1, 1, sender=2)
+
+    # 바쁜 대화방의 이미 본 메시지가 batch_size보다 많아도 조용한 대화방의 새 메시지가 전달되어야 함
+    assert backend.poll() == 1
+    assert [e["sender_user_id"] for e in drain(quiet)] == [2]
+    assert drain(busy) == []
+
+
+def test_busy_conversation_catches_up_across_polls(backend):
+    sub = backend.subscribe(conversation_channel(2))
+    insert_messages(2, backend.batch_size + 10)
+    assert backend.poll() == backend.batch_size
+    assert backend.poll() == 10
+    assert len(drain(sub)) == backend.batch_size + 10
@@ -0,0 +1,54 @@
+import pytest
+
+from app.counters import post_counters
+from app.database import db
+from app.models import Posts
+from app.serializers import post_list_query, serialize_post_row
+
+
+@pytest.fixture
+def post(board):
+    post = Posts(id=1, board_id=board.id, user_id=1, title="title", content="body")
+    db.session.add(post)
+    db.session.commit()
+    return post
+
+
+def serialized(post_id):
+    return serialize_post_row(post_list_query().filter(Posts.id == post_id).one())
+
+
+def stored(post_id):
+    db.session.expire_all()
+    post = db.session.get(Posts, post_id)
+    return post.like_count, post.comment_count
+
+
+def test_pending_deltas_are_merged_then_flushed(client, auth_headers, post):
+    for user_id in (1, 2):
+        assert client.post("/api/posts/1/like", headers=auth_headers(user_id)).status_code == 201
+    assert client.post("/api/posts/1/comments", json={"content": "hi"}, headers=auth_headers(2)).status_code == 201
+
+    # 아직 DB에는 반영되지 않았지만 응답에는 보임
+    assert stored(1) == (0, 0)
+    data = serialized(1)
+    assert (data["like_count"], data["comment_count"]) == (2, 1)
+
+    assert post_counters.flush() == 1
+    assert stored(1) == (2, 1)
+    assert post_counters.pending(1) == {}
+    data = serialized(1)
+    assert (data["like_count"], data["comment_count"]) == (2, 1)  # 두 번 더해지지 않음
+
+
+def test_unlike_and_repeated_like_adjust_the_delta(client, auth_headers, post):
+    client.post("/api/posts/1/like", headers=auth_headers(1))
+    assert client.post("/api/posts/1/like", headers=auth_headers(1)).status_code == 200  # 이미 누름
+    client.delete("/api/posts/1/like", headers=auth_headers(1))
+    assert post_counters.pending(1) == {"like_count": 0}
+    post_counters.flush()
+    assert stored(1) == (0, 0)
+
+
+def test_flush_without_pending_is_a_no_op(post):
+    assert post_counters.flush() == 0
@@ -0,0 +1,76 @@
+import threading
+
+import bcrypt
+import pytest
+
+from app.database import db
+from app.hashing import HashPoolSaturated, PasswordHasher, password_hasher
+from app.models import Users
+
+
+def test_inline_hasher_runs_in_the_request_thread():
+    hasher = PasswordHasher(rounds=4, workers=0)
+    assert hasher._run(threading.get_ident) == threading.get_ident()
+
+
+def test_pool_rejects_when_running_and_queued_slots_are_full():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_size=0)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    busy = threading.Thread(target=hasher._run, args=(block,))
+    busy.start()
+    started.wait(5)
+    with pytest.raises(HashPoolSaturated):
+        hasher.hash_password("pw")
+    release.set()
+    busy.join()
+
+
+def test_pool_timeout_raises_saturated():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_size=1, timeout=0.01)
+    release = threading.Event()
+    with pytest.raises(HashPoolSaturated):
+        hasher._run(release.wait, 5)
+    release.set()
+
+
+def test_needs_rehash():
+    hasher = PasswordHasher(rounds=4)
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(4)).decode())
+    assert hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(5)).decode())
+    assert hasher.needs_rehash("not-a-bcrypt-hash")
+
+
+@pytest.fixture
+def login_user(board):
+    # BCRYPT_ROUNDS(4)와 다른 cost로 저장된 기존 해시
+    user = Users(id=3, email="user3@example.com", nickname="user3", realname="User 3", gender="female",
+                 password_hash=bcrypt.hashpw(b"secret", bcrypt.gensalt(5)).decode(),
+                 main_language="ko", nationality_iso2="VN", school_id=1, department_id=1,
+                 enrollment_year=2024)
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_login_rehashes_with_current_rounds(client, login_user):
+    response = client.post("/api/auth/login", json={"email": "user3@example.com", "password": "secret"})
+    assert response.status_code == 200
+    db.session.expire_all()
+    stored = db.session.get(Users, 3).password_hash
+    assert not password_hasher.needs_rehash(stored)
+    assert bcrypt.checkpw(b"secret", stored.encode())
+
+
+def test_saturated_pool_maps_to_503(app, client, login_user, monkeypatch):
+    def saturated(*args):
+        raise HashPoolSaturated()
+
+    monkeypatch.setattr(password_hasher, "check_password", saturated)
+    response = client.post("/api/auth/login", json={"email": "user3@example.com", "password": "secret"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(app.config["HASH_POOL_RETRY_AFTER"])
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+
+from app.database import db
+from app.models import Users
+from app.pagination import encode_cursor
+
+
+def test_helper_inbox_rejects_timezone_aware_cursor(board, client, auth_headers):
+    db.session.get(Users, 2).is_helper = True
+    db.session.commit()
+    cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), 1)
+    response = client.get("/api/match_requests/helper_inbox", query_string={"cursor": cursor},
+                          headers=auth_headers(2))
+    assert response.status_code == 400
+
+
+def test_queue_stats_require_admin(app, board, client, auth_headers):
+    app.config["ADMIN_USER_IDS"] = "1"
+    assert client.get("/api/match_requests/queues/stats").status_code == 401
+    assert client.get("/api/match_requests/queues/stats", headers=auth_headers(2)).status_code == 403
+    assert client.get("/api/match_requests/queues/stats", headers=auth_headers(1)).status_code == 200
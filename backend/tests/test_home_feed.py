@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.database import db
+from app.home_feed import home_feed
+from app.models import Posts
+from app.response_cache import board_page_cache
+
+CREATED_AT = datetime(2024, 3, 1, 12, 0)
+
+
+def add_post(board, post_id):
+    post = Posts(id=post_id, board_id=board.id, user_id=1, title=f"t{post_id}", content="c",
+                 created_at=CREATED_AT + timedelta(minutes=post_id))
+    db.session.add(post)
+    db.session.commit()
+    return post
+
+
+def create_post(board, post_id):
+    """create_post 라우트와 같은 순서: 저장 -> 버전 bump -> 링 갱신"""
+    post = add_post(board, post_id)
+    version = board_page_cache.invalidate(board.id)
+    home_feed.record_post(board.id, post.created_at, post.id, version)
+
+
+@pytest.fixture
+def feed(board):
+    for post_id in (1, 2):
+        add_post(board, post_id)
+    posts, _ = home_feed.page([board.id], 10)
+    assert [p["id"] for p in posts] == [2, 1]
+    return board
+
+
+def test_record_post_keeps_the_ring_fresh(feed):
+    create_post(feed, 3)
+    ring = home_feed._rings[feed.id]
+    assert ring.version == board_page_cache.versions.get(feed.id)[0]  # 다시 읽을 필요 없음
+    assert [p["id"] for p in home_feed.page([feed.id], 10)[0]] == [3, 2, 1]
+
+
+def test_post_from_another_worker_is_not_marked_seen(feed):
+    # 다른 워커가 쓴 글: DB와 공유 버전만 바뀌고 이 워커의 링에는 없음
+    add_post(feed, 3)
+    board_page_cache.invalidate(feed.id)
+    create_post(feed, 4)
+
+    ring = home_feed._rings[feed.id]
+    assert ring.version != board_page_cache.versions.get(feed.id)[0]
+    assert [p["id"] for p in home_feed.page([feed.id], 10)[0]] == [4, 3, 2, 1]
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.database import db
+from app.inbox import mark_read, record_new_message
+from app.models import Matches, Conversations, ConversationParticipants, Messages
+
+SENT_AT = datetime(2024, 3, 1, 12, 0)
+
+
+@pytest.fixture
+def reader(board):
+    """사용자 1이 보낸 메시지 5개(id 1..5)가 있는 대화방의 사용자 2 참여 행"""
+    db.session.add(Matches(id=1, mentor_user_id=1, mentee_user_id=2, school_id=1))
+    db.session.add(Conversations(id=1, match_id=1))
+    db.session.add_all([ConversationParticipants(conversation_id=1, user_id=1),
+                        ConversationParticipants(conversation_id=1, user_id=2)])
+    db.session.flush()
+    for i in range(1, 6):
+        send(i)
+    db.session.commit()
+    return ConversationParticipants.query.filter_by(conversation_id=1, user_id=2).one()
+
+
+def send(message_id, sender=1):
+    db.session.add(Messages(id=message_id, conversation_id=1, sender_user_id=sender, content=f"m{message_id}",
+                            created_at=SENT_AT + timedelta(minutes=message_id)))
+    db.session.flush()
+    record_new_message(1, message_id, sender)
+
+
+def test_mark_read_counts_messages_after_the_read_position(reader):
+    assert reader.unread_count == 5
+    mark_read(reader, 3)
+    assert reader.unread_count == 2
+    assert reader.last_read_at == SENT_AT + timedelta(minutes=3)
+
+
+def test_mark_read_never_moves_backwards(reader):
+    mark_read(reader, 4)
+    mark_read(reader, 2)  # 늦게 도착한 이전 읽음 요청
+    assert reader.last_read_at == SENT_AT + timedelta(minutes=4)
+    assert reader.unread_count == 1
+
+
+def test_stale_mark_read_keeps_concurrent_increments(reader):
+    mark_read(reader, 5)
+    send(6)
+    send(7)
+    mark_read(reader, 3)
+    assert reader.unread_count == 2
+    mark_read(reader, 6)
+    assert reader.unread_count == 1
+
+
+def test_own_messages_are_not_unread(reader):
+    send(6, sender=2)
+    mark_read(reader, 4)
+    assert reader.unread_count == 1
+
+
+def test_mark_read_without_message_reads_everything(reader):
+    assert mark_read(reader).unread_count == 0
+
+
+def test_mark_read_unknown_message(reader):
+    assert mark_read(reader, 999) is None
+    assert reader.unread_count == 5
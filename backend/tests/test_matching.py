@@ -0,0 +1,70 @@
+import pytest
+
+from app.database import db
+from app.models import MatchRequests, Matches, Conversations
+
+
+@pytest.fixture
+def offers(board):
+    """사용자 1의 요청 2개(id 1, 2)를 사용자 2에게 제안한 상태"""
+    db.session.add_all([MatchRequests(id=rid, requester_user_id=1, status="offered", offered_mentor_user_id=2)
+                        for rid in (1, 2)])
+    db.session.commit()
+    return [1, 2]
+
+
+def accept(client, auth_headers, request_id, mentor_user_id=2):
+    return client.post(f"/api/match_requests/{request_id}/accept", json={"mentor_user_id": mentor_user_id},
+                       headers=auth_headers(2))
+
+
+def test_accept_is_idempotent(client, auth_headers, offers):
+    first = accept(client, auth_headers, 1)
+    assert first.status_code == 201
+    replay = accept(client, auth_headers, 1)
+    assert replay.status_code == 200
+    assert replay.json == first.json
+    assert Matches.query.filter_by(request_id=1).count() == 1
+    assert db.session.get(MatchRequests, 1).status == "accepted"
+
+
+def test_accept_replay_with_another_mentor_conflicts(client, auth_headers, offers):
+    accept(client, auth_headers, 1)
+    assert accept(client, auth_headers, 1, mentor_user_id=1).status_code == 409
+
+
+def test_accept_replays_when_a_concurrent_accept_already_inserted_the_match(client, auth_headers, offers):
+    # 다른 요청이 매칭을 먼저 저장했지만 이 요청이 읽을 때는 아직 offered였던 경우:
+    # 상태 UPDATE는 통과하고 commit에서 uq_matches_request_id 위반 -> 먼저 저장된 결과를 돌려줌
+    match = Matches(id=10, mentor_user_id=2, mentee_user_id=1, school_id=1, request_id=1)
+    db.session.add_all([match, Conversations(id=20, match=match)])
+    db.session.commit()
+
+    response = accept(client, auth_headers, 1)
+    assert response.status_code == 200
+    assert response.json == {"match_id": 10, "conversation_id": 20}
+    assert Matches.query.filter_by(request_id=1).count() == 1
+
+
+def test_accept_rejects_other_mentor_than_offered(client, auth_headers, offers):
+    assert accept(client, auth_headers, 1, mentor_user_id=1).status_code == 400
+    assert db.session.get(MatchRequests, 1).status == "offered"
+
+
+@pytest.mark.parametrize("role_setting", ["ADMIN_USER_IDS", "MATCH_COORDINATOR_USER_IDS"])
+def test_bulk_accept_allows_admins_and_coordinators(app, client, auth_headers, offers, role_setting):
+    app.config[role_setting] = "2"
+    response = client.post("/api/match_requests/accept_bulk", headers=auth_headers(2),
+                           json={"items": [{"request_id": 1}, {"request_id": 2}, {"request_id": 99}]})
+    assert response.status_code == 200
+    results = response.json["results"]
+    assert [r.get("status") for r in results] == ["accepted", "accepted", None]
+    assert Matches.query.count() == 2
+
+
+def test_bulk_accept_requires_a_role(app, client, auth_headers, offers):
+    app.config["ADMIN_USER_IDS"] = "1"
+    body = {"items": [{"request_id": 1}]}
+    assert client.post("/api/match_requests/accept_bulk", json=body).status_code == 401
+    assert client.post("/api/match_requests/accept_bulk", json=body, headers=auth_headers(2)).status_code == 403
+    assert db.session.get(MatchRequests, 1).status == "offered"
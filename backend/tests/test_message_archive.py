@@ -0,0 +1,82 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.database import db
+from app.inbox import record_new_message
+from app.message_archive import message_archive
+from app.models import Conversations, Matches, Messages, MessageArchiveSegments
+
+SENT_AT = datetime(2024, 3, 1, 12, 0)
+
+
+@pytest.fixture
+def ended(app, conversations):
+    """60일 전에 끝난 매칭의 대화방 1 (메시지 id 1..6)"""
+    message_archive.segment_size = 2
+    for message_id in range(1, 7):
+        db.session.add(Messages(id=message_id, conversation_id=1, sender_user_id=1 + message_id % 2,
+                                content=f"m{message_id}", created_at=SENT_AT + timedelta(minutes=message_id)))
+        db.session.flush()
+        record_new_message(1, message_id, 1 + message_id % 2)
+    match = db.session.get(Matches, 1)
+    match.status = "completed"
+    match.ended_at = datetime.utcnow() - timedelta(days=60)
+    db.session.commit()
+    return 1
+
+
+def archive():
+    assert message_archive.eligible_conversations() == [1]
+    assert message_archive.archive_ended() == (1, 5)
+
+
+def test_archive_round_trip(ended):
+    archive()
+    assert [m.id for m in Messages.query.filter_by(conversation_id=1)] == [6]  # 미리보기용 마지막 메시지
+    assert db.session.get(Conversations, 1).archived_until_id == 5
+    assert MessageArchiveSegments.query.count() == 3
+
+    read = message_archive.read(1, limit=50)
+    assert [(m.id, m.content, m.created_at) for m in read] == \
+        [(i, f"m{i}", SENT_AT + timedelta(minutes=i)) for i in range(1, 6)]
+    assert [m.id for m in message_archive.read(1, after_id=1, before_id=5)] == [2, 3, 4]
+    assert message_archive.find(1, 3).content == "m3"
+    assert message_archive.eligible_conversations() == []  # 다시 옮길 메시지 없음
+
+
+def test_only_matches_ended_before_the_cutoff_are_archived(ended):
+    match = db.session.get(Matches, 1)
+    match.ended_at = datetime.utcnow() - timedelta(days=1)
+    db.session.commit()
+    assert message_archive.eligible_conversations() == []
+    match.ended_at = None  # 언제 끝났는지 모르면 옮기지 않음
+    db.session.commit()
+    assert message_archive.eligible_conversations() == []
+
+
+def test_corrupted_segment_is_rejected(ended):
+    archive()
+    segment = MessageArchiveSegments.query.order_by(MessageArchiveSegments.first_message_id).first()
+    with open(os.path.join(message_archive.directory, segment.path), "ab") as f:
+        f.write(b"x")
+    with pytest.raises(IOError):
+        message_archive.read(1)
+
+
+def test_messages_after_id_spans_archive_and_table(client, auth_headers, ended):
+    archive()
+    response = client.get("/api/conversations/1/messages", query_string={"after_id": 2},
+                          headers=auth_headers(2))
+    assert response.status_code == 200
+    assert [m["id"] for m in response.json["messages"]] == [3, 4, 5, 6]
+
+
+def test_stream_reconnect_backfills_through_the_archive(app, client, auth_headers, ended):
+    archive()
+    app.config["MESSAGE_STREAM_MAX_SECONDS"] = 0  # 백필만 보내고 스트림 종료
+    response = client.get("/api/conversations/1/stream", headers={**auth_headers(2), "Last-Event-ID": "2"})
+    assert response.status_code == 200
+    ids = [int(line[4:]) for line in response.get_data(as_text=True).splitlines() if line.startswith("id: ")]
+    assert ids == [3, 4, 5, 6]
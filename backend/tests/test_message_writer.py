@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.database import db
+from app.message_writer import GroupCommitWriter, MessageWriteTimeout, _PendingWrite
+from app.models import Conversations, ConversationParticipants, Messages
+
+
+def pending(conv_id, sender, content):
+    return _PendingWrite({"conversation_id": conv_id, "sender_user_id": sender, "content": content,
+                          "created_at": datetime(2024, 3, 1, 12, 0)})
+
+
+def test_commit_maps_ids_to_rows_in_order(conversations):
+    batch = [pending(1, 1, "a"), pending(2, 2, "b"), pending(1, 2, "c"), pending(1, 1, "d")]
+    GroupCommitWriter()._commit(batch)
+
+    stored = {m.id: (m.conversation_id, m.sender_user_id, m.content) for m in Messages.query.all()}
+    assert [stored[p.result.id] for p in batch] == [(1, 1, "a"), (2, 2, "b"), (1, 2, "c"), (1, 1, "d")]
+    assert [p.result.content for p in batch] == ["a", "b", "c", "d"]
+
+    db.session.expire_all()
+    assert db.session.get(Conversations, 1).last_message_id == batch[3].result.id
+    assert db.session.get(Conversations, 2).last_message_id == batch[1].result.id
+    unread = {(p.conversation_id, p.user_id): p.unread_count for p in ConversationParticipants.query.all()}
+    assert unread == {(1, 1): 1, (1, 2): 2, (2, 1): 1, (2, 2): 0}
+
+
+class FakeMySQLConnection:
+    """RETURNING이 없는 (MySQL) 다이얼렉트처럼 lastrowid / rowcount만 돌려주는 커넥션"""
+
+    dialect = SimpleNamespace(insert_executemany_returning_sort_by_parameter_order=False)
+
+    def __init__(self, first_id, rowcount, increment=1):
+        self.first_id = first_id
+        self.rowcount = rowcount
+        self.increment = increment
+
+    def execute(self, statement):
+        return SimpleNamespace(rowcount=self.rowcount, lastrowid=self.first_id)
+
+    def exec_driver_sql(self, sql):
+        assert sql == "SELECT @@auto_increment_increment"
+        return SimpleNamespace(scalar=lambda: self.increment)
+
+
+def rows(n):
+    return [pending(1, 1, str(i)).row for i in range(n)]
+
+
+def test_mysql_ids_step_by_auto_increment_increment():
+    writer = GroupCommitWriter()
+    assert writer._insert(FakeMySQLConnection(101, 3), rows(3)) == [101, 102, 103]
+    writer = GroupCommitWriter()
+    # 다중 마스터 등으로 auto_increment_increment가 1이 아니면 그 간격으로 id가 할당됨
+    assert writer._insert(FakeMySQLConnection(7, 3, increment=5), rows(3)) == [7, 12, 17]
+
+
+def test_mysql_partial_insert_is_an_error():
+    with pytest.raises(RuntimeError):
+        GroupCommitWriter()._insert(FakeMySQLConnection(1, 2), rows(3))
+
+
+def test_timed_out_write_is_cancelled_before_commit():
+    writer = GroupCommitWriter()
+    writer.timeout = 0.01
+    writer._pid = os.getpid()  # writer 스레드 없이 큐에만 쌓이게 함
+    with pytest.raises(MessageWriteTimeout):
+        writer.write(1, 1, "late")
+
+    queued = writer._queue.get_nowait()
+    assert queued.state == "cancelled"
+    # 나중에 writer가 꺼내도 커밋하지 않음 (클라이언트 재전송과 중복 저장 방지)
+    assert writer._claim([queued]) == []
+    assert writer.stats()["cancelled"] == 1
+
+
+def test_claimed_write_returns_the_commit_outcome_after_timeout():
+    writer = GroupCommitWriter()
+    writer.timeout = 0.01
+    writer._pid = os.getpid()
+
+    def slow_writer():
+        item = writer._queue.get()
+        writer._claim([item])
+        time.sleep(writer.timeout * 5)  # 요청의 timeout보다 늦게 커밋됨
+        item.result = "committed"
+        item.done.set()
+
+    thread = threading.Thread(target=slow_writer)
+    thread.start()
+    # 이미 가져간 메시지는 저장될 수 있으므로 503(재전송 -> 중복) 대신 결과를 기다려 돌려줌
+    assert writer.write(1, 1, "slow") == "committed"
+    thread.join()
+
+
+def test_created_at_matches_the_stored_row(conversations):
+    writer = GroupCommitWriter()
+    writer._pid = os.getpid()
+    writer._queue = SimpleNamespace(put=lambda item: writer._flush(writer._claim([item])))
+    written = writer.write(1, 1, "hello")
+    assert written.created_at.microsecond == 0  # MySQL DATETIME(0)에 저장되는 값과 같음
+    assert db.session.get(Messages, written.id).created_at == written.created_at
@@ -0,0 +1,78 @@
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.database import db
+from app.models import Posts
+from app.pagination import encode_cursor, decode_cursor, parse_limit
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 3, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2024, 3, 1, 12, 30), 10 ** 12)
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!!", encode_cursor(datetime(2024, 1, 1), 1)[:-3]])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_decode_cursor_rejects_non_integer_id():
+
+    cursor = base64.urlsafe_b64encode(b"2024-01-01T00:00:00|abc").decode("ascii")
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("tz", [timezone.utc, timezone(timedelta(hours=9))])
+def test_decode_cursor_rejects_timezone_aware_timestamp(tz):
+    # naive UTC인 created_at과 비교하면 TypeError(500)가 나므로 ValueError(400)로 거부해야 함
+    cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=tz), 1)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_parse_limit_clamps():
+    assert parse_limit(None, 20, 100) == 20
+    assert parse_limit("0", 20, 100) == 1
+    assert parse_limit("500", 20, 100) == 100
+    with pytest.raises(ValueError):
+        parse_limit("ten", 20, 100)
+
+
+def test_board_posts_pages_follow_next_cursor(board, client):
+    created_at = datetime(2024, 3, 1, 12, 0)
+    # 같은 created_at이 섞여도 (created_at, id) 순서로 빠짐/중복 없이 이어져야 함
+    db.session.add_all([Posts(id=i, board_id=board.id, user_id=1, title=f"title {i}", content="body",
+                              created_at=created_at - timedelta(minutes=i // 2))
+                        for i in range(1, 8)])
+    db.session.commit()
+
+    seen, cursor = [], None
+    while True:
+        response = client.get(f"/api/board/{board.id}/posts",
+                              query_string={"limit": 3, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen.extend(post["id"] for post in response.json["posts"])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [1, 3, 2, 5, 4, 7, 6]
+
+
+def test_board_posts_rejects_bad_cursor(board, client):
+    response = client.get(f"/api/board/{board.id}/posts", query_string={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_home_feed_rejects_timezone_aware_cursor(board, client, auth_headers):
+    cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), 1)
+    response = client.get("/api/feed/home", query_string={"cursor": cursor}, headers=auth_headers(1))
+    assert response.status_code == 400
@@ -0,0 +1,134 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app import create_app, rate_limit
+from app.database import db
+from app.rate_limit import LocalBucketStore, RateLimiter, SharedMemoryBucketStore, parse_limit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["local", "shm"])
+def store(request, tmp_path):
+    if request.param == "local":
+        return LocalBucketStore()
+    if rate_limit.fcntl is None:
+        pytest.skip("shm backend requires fcntl")
+    config = {"RATE_LIMIT_SHM_PATH": os.path.join(tmp_path, "rate_limit.shm"), "RATE_LIMIT_SHM_SLOTS": 64}
+    return SharedMemoryBucketStore(SimpleNamespace(config=config))
+
+
+def test_parse_limit():
+    assert parse_limit("30/minute") == (0.5, 30.0)
+    for spec in ("0/minute", "10/week", "ten/second"):
+        with pytest.raises(ValueError):
+            parse_limit(spec)
+
+
+def test_bucket_denies_after_burst(store, clock):
+    rate, burst = parse_limit("3/minute")
+    assert [store.take("k", rate, burst)[0] for _ in range(3)] == [True, True, True]
+    allowed, retry_after = store.take("k", rate, burst)
+    assert not allowed
+    assert retry_after == pytest.approx(20.0)  # 토큰 1개가 다시 차는 시간
+    assert store.take("other", rate, burst)[0]  # 키마다 따로
+
+
+def test_bucket_refills_over_time(store, clock):
+    rate, burst = parse_limit("3/minute")
+    for _ in range(3):
+        store.take("k", rate, burst)
+    clock.now += 19.0
+    assert not store.take("k", rate, burst)[0]
+    clock.now += 1.0
+    assert store.take("k", rate, burst)[0]
+    assert not store.take("k", rate, burst)[0]
+    clock.now += 3600
+    # 오래 쉬어도 burst까지만 충전됨
+    assert [store.take("k", rate, burst)[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_peek_and_refund(store, clock):
+    rate, burst = parse_limit("2/minute")
+    assert [store.take("k", rate, burst, consume=False)[0] for _ in range(5)] == [True] * 5
+    assert store.take("k", rate, burst)[0] and store.take("k", rate, burst)[0]
+    assert not store.take("k", rate, burst, consume=False)[0]
+    store.take("k", rate, burst, cost=-1.0)
+    assert store.take("k", rate, burst)[0]
+    assert not store.take("k", rate, burst)[0]
+
+
+def test_clock_going_backwards_does_not_drain_the_bucket(store, clock):
+    rate, burst = parse_limit("3/minute")
+    store.take("k", rate, burst)
+    clock.now -= 3600  # 재부팅 등으로 기록된 시각보다 이른 시각
+    assert [store.take("k", rate, burst)[0] for _ in range(3)] == [True, True, False]
+
+
+def test_denied_scope_does_not_consume_other_scopes(clock):
+    limiter = RateLimiter()
+    limiter.rules = {"send": {"user": parse_limit("1/minute"), "ip": parse_limit("3/minute")}}
+
+    assert limiter.check("send", {"user": 1, "ip": "a"}) == (True, 0.0)
+    allowed, retry_after = limiter.check("send", {"user": 1, "ip": "a"})
+    assert not allowed and retry_after == pytest.approx(60.0)
+    # 사용자 범위에서 막힌 요청은 IP 버킷을 쓰지 않았으므로 같은 IP의 다른 사용자는 2번 더 가능
+    assert [limiter.check("send", {"user": user, "ip": "a"})[0] for user in (2, 3, 4)] == [True, True, False]
+    assert limiter.stats() == {"send:ip": {"allowed": 3, "throttled": 1},
+                               "send:user": {"allowed": 3, "throttled": 1}}
+
+
+def test_lost_race_refunds_tokens_already_taken(clock):
+    limiter = RateLimiter()
+    limiter.rules = {"send": {"user": parse_limit("2/minute"), "ip": parse_limit("1/minute")}}
+    real_take = limiter.store.take
+
+    def take(key, rate, burst, cost=1.0, consume=True):
+        if key.startswith("send:ip") and consume and cost > 0:
+            real_take(key, rate, burst)  # 확인과 사용 사이에 다른 워커가 먼저 씀
+        return real_take(key, rate, burst, cost, consume)
+
+    limiter.store.take = take
+    assert not limiter.check("send", {"user": 1, "ip": "a"})[0]
+    limiter.store.take = real_take
+    # 사용자 버킷에서 쓴 토큰은 돌려받았으므로 2개 그대로
+    assert [real_take("send:user:1", *parse_limit("2/minute"))[0] for _ in range(3)] == [True, True, False]
+
+
+@pytest.fixture
+def proxied_client(app_config):
+    app = create_app({**app_config, "RATE_LIMIT_ENABLED": True, "TRUSTED_PROXY_COUNT": 1,
+                      "RATE_LIMITS": {"login": {"ip": "2/minute"}}})
+    with app.app_context():
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_ip_limit_uses_forwarded_client_address(proxied_client):
+    def login(client_ip):
+        return proxied_client.post("/api/auth/login", json={"email": "a@example.com"},
+                                   headers={"X-Forwarded-For": client_ip}).status_code
+
+    assert [login("203.0.113.1") for _ in range(3)] == [400, 400, 429]
+    # 같은 프록시를 거쳐도 다른 클라이언트는 자기 버킷을 씀
+    assert login("203.0.113.2") == 400
@@ -0,0 +1,47 @@
+import os
+from types import SimpleNamespace
+
+from app.response_cache import FileVersionStore, LocalVersionStore
+from app.version_stamp import VersionStamp
+
+
+def test_version_stamp_bumps_are_distinct_within_one_clock_tick(tmp_path):
+    stamp = VersionStamp(os.path.join(tmp_path, "x.version"))
+    assert stamp.current() is None
+    versions = [stamp.bump() for _ in range(50)]
+    assert versions == list(range(versions[0], versions[0] + 50))
+    assert stamp.current() == versions[-1]
+
+
+def test_version_stamp_changed_and_mark_seen(tmp_path):
+    stamp = VersionStamp(os.path.join(tmp_path, "x.version"))
+    stamp.bump()
+    assert stamp.changed()
+    stamp.mark_seen()
+    assert not stamp.changed()
+    stamp.bump()
+    assert stamp.changed()
+
+
+def test_recreated_stamp_does_not_reuse_old_versions(tmp_path):
+    path = os.path.join(tmp_path, "x.version")
+    stamp = VersionStamp(path)
+    old = [stamp.bump() for _ in range(3)]
+    os.remove(path)
+    assert stamp.bump() > max(old)
+
+
+def test_file_version_store_is_shared_between_instances(tmp_path):
+    app = SimpleNamespace(config={"BOARD_CACHE_VERSION_DIR": os.path.join(tmp_path, "boards")})
+    worker_a, worker_b = FileVersionStore(app), FileVersionStore(app)
+    version, _ = worker_a.get(1)
+    assert worker_b.get(1)[0] == version  # 처음 조회한 워커가 만든 버전을 모두 같이 봄
+    assert worker_b.bump(1) == version + 1
+    assert worker_a.get(1)[0] == version + 1
+
+
+def test_local_version_store_bump_returns_new_version():
+    store = LocalVersionStore()
+    assert store.get(1)[0] == 0
+    assert store.bump(1) == 1
+    assert store.get(1)[0] == 1
@@ -0,0 +1,55 @@
+import pytest
+
+from app.database import db
+from app.models import Posts, PostSearchTerms
+from app.search import MAX_TERM_LEN, postings_for, rebuild_index, search_post_ids, tokenize
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello WORLD hello", {"hello": 2, "world": 1}),
+    ("ＡＢＣ１２", {"abc12": 1}),                      # NFKC로 전각 문자를 정규화
+    ("한국어 공부", {"한국": 1, "국어": 1, "공부": 1}),  # 한글은 2-gram
+    ("밥", {"밥": 1}),                                 # 한 글자 구간은 그 글자 자체
+    ("Python과 한국", {"python": 1, "과": 1, "한국": 1}),
+    ("", {}),
+    (None, {}),
+])
+def test_tokenize(text, expected):
+    assert dict(tokenize(text)) == expected
+
+
+def test_tokenize_truncates_long_words():
+    assert list(tokenize("x" * 100)) == ["x" * MAX_TERM_LEN]
+
+
+def test_postings_weight_title_terms_twice():
+    rows = postings_for(7, 1, 3, "한국", "한국 ok")
+    assert {row["term"]: row["tf"] for row in rows} == {"한국": 3, "ok": 1}
+    assert all(row["post_id"] == 7 and row["board_id"] == 1 and row["community_id"] == 3 for row in rows)
+
+
+def test_rebuild_index_replaces_postings_page_by_page(board):
+    db.session.add_all([Posts(id=i, board_id=board.id, user_id=1, title=f"post{i}", content="공통 본문")
+                        for i in range(1, 6)])
+    db.session.flush()
+    # 글 내용과 맞지 않는 오래된 색인 행은 재빌드 후 남지 않아야 함
+    db.session.add(PostSearchTerms(term="stale", post_id=3, board_id=board.id, community_id=1, tf=1))
+    db.session.commit()
+
+    assert rebuild_index(batch_size=2) == 5
+
+    terms = db.session.query(PostSearchTerms.post_id, PostSearchTerms.term, PostSearchTerms.tf).all()
+    assert sorted(terms) == sorted((i, term, tf) for i in range(1, 6)
+                                   for term, tf in (("공통", 1), ("본문", 1), (f"post{i}", 2)))
+    assert search_post_ids("stale") == ([], False)
+    ids, has_more = search_post_ids("공통 본문", board_id=board.id, limit=3)
+    assert len(ids) == 3 and has_more
+    assert search_post_ids("post4")[0][0][0] == 4
+
+
+def test_rebuild_index_is_idempotent(board):
+    db.session.add(Posts(id=1, board_id=board.id, user_id=1, title="hello", content="world"))
+    db.session.commit()
+    rebuild_index()
+    rebuild_index()
+    assert db.session.query(PostSearchTerms).count() == 2